@@ -0,0 +1,52 @@
+import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+from application.interactors.dodo_is_api_fetch import DodoIsApiFetchInteractor
+from application.pagination import fetch_all_counted_pages, merge_pages_unique
+from domain.enums import StaffMemberStatus
+from infrastructure.dodo_is_api.models import (
+    HistoricalStaffMember,
+    HistoricalStaffMembersResponse,
+)
+from infrastructure.dodo_is_api.response_parsers import (
+    StaffMembersParsingProfile,
+    parse_staff_members_response_stream,
+)
+
+
+__all__ = ("AllStaffMembersFetchInteractor",)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AllStaffMembersFetchInteractor(DodoIsApiFetchInteractor):
+    """
+    Fetches staff members of every status hired up to `hired_to_date`.
+
+    Staff members carry their hire and dismissal dates, so that the staff
+    of any past week can be reconstructed from this single snapshot.
+    """
+
+    unit_uuids: Iterable[UUID]
+    hired_to_date: datetime.datetime
+    take: int = 1000
+
+    async def execute(self) -> list[HistoricalStaffMember]:
+        async def fetch_page(skip: int) -> HistoricalStaffMembersResponse:
+            async with self.dodo_is_api_connection.stream_staff_members(
+                unit_uuids=self.unit_uuids,
+                take=self.take,
+                skip=skip,
+                statuses=tuple(StaffMemberStatus),
+                hired_to_date=self.hired_to_date,
+            ) as response:
+                return await parse_staff_members_response_stream(
+                    response, StaffMembersParsingProfile.HISTORICAL
+                )  # type: ignore[return-value]
+
+        pages = await fetch_all_counted_pages(fetch_page, take=self.take)
+        return merge_pages_unique(
+            (page.members for page in pages),
+            key=lambda staff_member: staff_member.id,
+        )
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
 from domain.services.period import Period
 from domain.services.delivery import compute_orders_per_courier
 from domain.entities import UnitDeliveryStatistics
@@ -17,19 +17,19 @@ __all__ = ("DeliveryStatisticsForMonthFetchInteractor",)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DeliveryStatisticsForMonthFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
     month: int
     year: int
     timezone: ZoneInfo
     unit_uuids: Iterable[UUID]
 
-    def execute(self):
+    async def execute(self):
         period = Period.from_month(
             month=self.month,
             year=self.year,
             timezone=self.timezone,
         )
-        response = self.dodo_is_api_connection.get_delivery_statistics(
+        response = await self.dodo_is_api_connection.get_delivery_statistics(
             from_date=period.from_date,
             to_date=period.to_date,
             unit_uuids=self.unit_uuids,
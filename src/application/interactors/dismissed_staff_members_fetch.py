@@ -4,50 +4,56 @@ from uuid import UUID
 
 import pendulum
 
+from application.pagination import fetch_all_counted_pages, merge_pages_unique
 from domain.enums import StaffMemberStatus
 from domain.services.period import get_period_by_week_number_of_year
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
-from infrastructure.dodo_is_api.models import StaffMember
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
+from infrastructure.dodo_is_api.models import (
+    LeanStaffMember,
+    LeanStaffMembersResponse,
+    StaffMember,
+    StaffMembersResponse,
+)
 from infrastructure.dodo_is_api.response_parsers import (
-    parse_staff_members_response,
+    StaffMembersParsingProfile,
+    parse_staff_members_response_stream,
 )
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DismissedStaffMembersFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
     year: int
     week: int
     timezone: pendulum.Timezone
     unit_uuids: Iterable[UUID]
+    take: int = 1000
+    parsing_profile: StaffMembersParsingProfile = StaffMembersParsingProfile.FULL
 
-    def execute(self) -> list[StaffMember]:
-        take: int = 1000
-        skip: int = 0
-
+    async def execute(self) -> list[StaffMember | LeanStaffMember]:
         period = get_period_by_week_number_of_year(
             year=self.year,
             week_number=self.week,
             timezone=self.timezone,
         )
 
-        staff_members: list[StaffMember] = []
-
-        while True:
-            response = self.dodo_is_api_connection.get_staff_members(
+        async def fetch_page(
+            skip: int,
+        ) -> StaffMembersResponse | LeanStaffMembersResponse:
+            async with self.dodo_is_api_connection.stream_staff_members(
                 unit_uuids=self.unit_uuids,
-                take=take,
+                take=self.take,
                 skip=skip,
                 dismissed_from_date=period.from_date,
                 dismissed_to_date=period.to_date,
                 statuses=(StaffMemberStatus.DISMISSED,),
-            )
-            staff_members_response = parse_staff_members_response(response)
-            staff_members += staff_members_response.members
-
-            if staff_members_response.is_end_of_list_reached:
-                break
-
-            skip += take
-
-        return staff_members
+            ) as response:
+                return await parse_staff_members_response_stream(
+                    response, self.parsing_profile
+                )
+
+        pages = await fetch_all_counted_pages(fetch_page, take=self.take)
+        return merge_pages_unique(
+            (page.members for page in pages),
+            key=lambda staff_member: staff_member.id,
+        )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
 
 
 __all__ = ("DodoIsApiFetchInteractor",)
@@ -8,4 +8,4 @@ __all__ = ("DodoIsApiFetchInteractor",)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DodoIsApiFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
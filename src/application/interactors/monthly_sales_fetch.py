@@ -4,7 +4,7 @@ from uuid import UUID
 
 import pendulum
 
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
 from domain.services.period import Period
 from domain.entities import UnitMonthlySales
 from infrastructure.dodo_is_api.response_parsers import (
@@ -17,19 +17,19 @@ __all__ = ("MonthlySalesFetchInteractor",)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class MonthlySalesFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
     month: int
     year: int
     timezone: pendulum.Timezone
     unit_uuids: Iterable[UUID]
 
-    def execute(self):
+    async def execute(self):
         period = Period.from_month(
             month=self.month,
             year=self.year,
             timezone=self.timezone,
         )
-        response = self.dodo_is_api_connection.get_monthly_units_sales(
+        response = await self.dodo_is_api_connection.get_monthly_units_sales(
             from_date=period.from_date,
             to_date=period.to_date,
             unit_uuids=self.unit_uuids,
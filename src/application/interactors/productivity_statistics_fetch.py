@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
 from domain.services.period import Period
 from domain.entities import UnitProductivityStatistics
 from infrastructure.dodo_is_api.response_parsers import (
@@ -16,20 +16,20 @@ __all__ = ("ProductivityStatisticsForMonthFetchInteractor",)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ProductivityStatisticsForMonthFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
     month: int
     year: int
     timezone: ZoneInfo
     unit_uuids: Iterable[UUID]
 
-    def execute(self):
+    async def execute(self):
         period = Period.from_month(
             month=self.month,
             year=self.year,
             timezone=self.timezone,
         ).rounded_to_upper_hour()
 
-        response = self.dodo_is_api_connection.get_production_productivity(
+        response = await self.dodo_is_api_connection.get_production_productivity(
             from_date=period.from_date,
             to_date=period.to_date,
             unit_uuids=self.unit_uuids,
@@ -1,68 +1,178 @@
+import asyncio
 from collections.abc import Iterable
+from enum import StrEnum
 from uuid import UUID
 from dataclasses import dataclass
 from itertools import batched
 
 from application.interactors.dodo_is_api_fetch import DodoIsApiFetchInteractor
-from infrastructure.dodo_is_api.models import StaffPositionsHistory
+from application.pagination import fetch_all_pages_sequentially
+from infrastructure.dodo_is_api.models import (
+    StaffPositionsHistory,
+    StaffPositionsHistoryResponse,
+)
+from infrastructure.dodo_is_api.request_builders import (
+    compute_max_staff_member_ids_per_request,
+)
 from infrastructure.dodo_is_api.response_parsers import (
     parse_staff_positions_history_response,
 )
 from bootstrap.logger import create_logger
 
 
-__all__ = ("StaffPositionsHistoryFetchInteractor",)
+__all__ = (
+    "StaffPositionsHistoryFetchMode",
+    "StaffPositionsHistoryFetchInteractor",
+)
 
 
 logger = create_logger("fetch_interactors")
 
 
+class StaffPositionsHistoryFetchMode(StrEnum):
+    STAFF_MEMBERS = "staff_members"
+    UNITS = "units"
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class StaffPositionsHistoryFetchInteractor(DodoIsApiFetchInteractor):
-    def execute(self, staff_member_ids: Iterable[UUID]) -> list[StaffPositionsHistory]:
-        take: int = 1000
-        skip: int = 0
-
-        batch_size: int = 30
-        staff_members_ids_batches = batched(staff_member_ids, n=batch_size)
+    """
+    Fetches positions history of staff members.
+
+    Two modes are supported:
+    - staff members (default): IDs are sent in batches that are fetched
+      at the same time, bounded by the request limit of the connection.
+      Each batch is paginated from its first page on. The batch size is
+      the largest one that keeps the query string within
+      `max_query_length` characters. The full history of every staff
+      member is returned, including positions held in other units.
+    - units: the whole history of `unit_uuids` is fetched as one paginated
+      stream and filtered by staff member IDs locally. Only records made
+      in these units are returned, so positions held in other units are
+      missing, and staff members who were specialists elsewhere may be
+      counted differently. Use it only when that is acceptable.
+
+    The mode is set by `dodo_is_api.staff_positions_history_fetch_mode`
+    in the config.
+    """
+
+    unit_uuids: Iterable[UUID]
+    mode: StaffPositionsHistoryFetchMode = StaffPositionsHistoryFetchMode.STAFF_MEMBERS
+    take: int = 1000
+    max_query_length: int = 2000
+
+    async def execute(
+        self, staff_member_ids: Iterable[UUID]
+    ) -> list[StaffPositionsHistory]:
+        staff_member_ids = set(staff_member_ids)
+
+        logger.debug("Staff positions history fetch mode: %s", self.mode)
+
+        if self.mode == StaffPositionsHistoryFetchMode.UNITS:
+            history = await self.__fetch_by_units(
+                unit_uuids=tuple(self.unit_uuids),
+                staff_member_ids=staff_member_ids,
+            )
+        else:
+            history = await self.__fetch_by_staff_members(
+                staff_member_ids=staff_member_ids,
+            )
 
-        history: list[StaffPositionsHistory] = []
+        logger.info(
+            "Staff positions history fetching finished: total count - %d",
+            len(history),
+        )
 
-        for batch_number, staff_member_ids_batch in enumerate(
-            staff_members_ids_batches, start=1
-        ):
-            while True:
-                response = self.dodo_is_api_connection.get_staff_positions_history(
-                    staff_member_ids=staff_member_ids_batch,
-                    take=take,
-                    skip=skip,
-                )
-                staff_positions_history_response = (
-                    parse_staff_positions_history_response(response)
-                )
+        return history
 
-                history += staff_positions_history_response.history
+    async def __fetch_by_units(
+        self,
+        *,
+        unit_uuids: Iterable[UUID],
+        staff_member_ids: set[UUID],
+    ) -> list[StaffPositionsHistory]:
+        async def fetch_page(skip: int) -> StaffPositionsHistoryResponse:
+            response = await self.dodo_is_api_connection.get_staff_positions_history(
+                unit_ids=unit_uuids,
+                take=self.take,
+                skip=skip,
+            )
+            staff_positions_history_response = parse_staff_positions_history_response(
+                response
+            )
+            logger.debug(
+                "staff positions history page fetched: taken - %d, skipped - %d",
+                len(staff_positions_history_response.history),
+                skip,
+            )
+            return staff_positions_history_response
+
+        pages = await fetch_all_pages_sequentially(fetch_page, take=self.take)
+
+        return [
+            staff_position_history
+            for page in pages
+            for staff_position_history in page.history
+            if staff_position_history.staff_id in staff_member_ids
+        ]
+
+    async def __fetch_by_staff_members(
+        self,
+        *,
+        staff_member_ids: Iterable[UUID],
+    ) -> list[StaffPositionsHistory]:
+        batch_size = compute_max_staff_member_ids_per_request(self.max_query_length)
+        staff_members_ids_batches = batched(staff_member_ids, n=batch_size)
 
-                logger.debug(
-                    "staff positions history page fetched: batch number - %d, taken - %d, skipped - %d",
-                    batch_number,
-                    len(staff_positions_history_response.history),
-                    skip,
+        batches_history = await asyncio.gather(
+            *(
+                self.__fetch_batch(
+                    batch_number=batch_number,
+                    staff_member_ids_batch=staff_member_ids_batch,
                 )
+                for batch_number, staff_member_ids_batch in enumerate(
+                    staff_members_ids_batches, start=1
+                )
+            )
+        )
 
-                if staff_positions_history_response.is_end_of_list_reached:
-                    break
-
-                skip += take
+        history: list[StaffPositionsHistory] = []
+        for batch_history in batches_history:
+            history += batch_history
+        return history
 
+    async def __fetch_batch(
+        self,
+        *,
+        batch_number: int,
+        staff_member_ids_batch: Iterable[UUID],
+    ) -> list[StaffPositionsHistory]:
+        async def fetch_page(skip: int) -> StaffPositionsHistoryResponse:
+            response = await self.dodo_is_api_connection.get_staff_positions_history(
+                staff_member_ids=staff_member_ids_batch,
+                take=self.take,
+                skip=skip,
+            )
+            staff_positions_history_response = parse_staff_positions_history_response(
+                response
+            )
             logger.debug(
-                "Staff positions history batch fetched: batch number - %d",
+                "staff positions history page fetched: batch number - %d, taken - %d, skipped - %d",
                 batch_number,
+                len(staff_positions_history_response.history),
+                skip,
             )
+            return staff_positions_history_response
 
-        logger.info(
-            "Staff positions history fetching finished: total count - %d",
-            len(history),
+        pages = await fetch_all_pages_sequentially(fetch_page, take=self.take)
+
+        logger.debug(
+            "Staff positions history batch fetched: batch number - %d",
+            batch_number,
         )
 
-        return history
+        return [
+            staff_position_history
+            for page in pages
+            for staff_position_history in page.history
+        ]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from domain.entities import UnitMonthlyGoals
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
 from infrastructure.dodo_is_api.response_parsers import (
     parse_unit_monthly_goals_response,
 )
@@ -13,13 +13,13 @@ __all__ = ("UnitMonthlyGoalsFetchInteractor",)
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class UnitMonthlyGoalsFetchInteractor:
-    dodo_is_api_connection: DodoIsApiConnection
+    dodo_is_api_connection: AsyncDodoIsApiConnection
     month: int
     year: int
     unit_uuid: UUID
 
-    def execute(self):
-        response = self.dodo_is_api_connection.get_unit_monthly_goals(
+    async def execute(self):
+        response = await self.dodo_is_api_connection.get_unit_monthly_goals(
             month=self.month,
             year=self.year,
             unit_uuid=self.unit_uuid,
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Iterable
 from dataclasses import dataclass
 
@@ -34,17 +35,25 @@ class EconomicsStatisticsOrchestrator:
     unit_monthly_goals_fetch_intetactors: Iterable[UnitMonthlyGoalsFetchInteractor]
     monthly_sales_fetch_interactor: MonthlySalesFetchInteractor
 
-    def execute(self):
-        production_statistics = self.produciton_statistics_fetch_interactor.execute()
-        delivery_statistics = self.delivery_statistics_fetch_interactor.execute()
-        monthly_sales = self.monthly_sales_fetch_interactor.execute()
-
-        units_monthly_goals = []
-        for (
-            unit_monthly_goals_fetch_intetactor
-        ) in self.unit_monthly_goals_fetch_intetactors:
-            unit_monthly_goals = unit_monthly_goals_fetch_intetactor.execute()
-            units_monthly_goals.append(unit_monthly_goals)
+    async def execute(self):
+        # All fetches are independent, so they are sent at once.
+        # The connection itself caps how many of them are in flight.
+        (
+            production_statistics,
+            delivery_statistics,
+            monthly_sales,
+            *units_monthly_goals,
+        ) = await asyncio.gather(
+            self.produciton_statistics_fetch_interactor.execute(),
+            self.delivery_statistics_fetch_interactor.execute(),
+            self.monthly_sales_fetch_interactor.execute(),
+            *(
+                unit_monthly_goals_fetch_intetactor.execute()
+                for unit_monthly_goals_fetch_intetactor in (
+                    self.unit_monthly_goals_fetch_intetactors
+                )
+            ),
+        )
 
         unit_uuid_to_delivery_statistics = map_unit_uuid_to_item(delivery_statistics)
         unit_uuid_to_productivity_statistics = map_unit_uuid_to_item(
@@ -0,0 +1,59 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import pendulum
+
+from application.interactors.all_staff_members_fetch import (
+    AllStaffMembersFetchInteractor,
+)
+from application.interactors.staff_positions_history_fetch import (
+    StaffPositionsHistoryFetchInteractor,
+)
+from bootstrap.logger import create_logger
+from domain.entities import Unit, UnitWeeklyStaffData
+from domain.services.staff_history import reconstruct_units_weekly_staff_data
+
+
+__all__ = ("StaffHistoryReconstructionOrchestrator",)
+
+
+logger = create_logger("orchestrators")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffHistoryReconstructionOrchestrator:
+    """
+    Computes staff data of many weeks from a single download.
+
+    Staff members of every status and their positions history are
+    fetched once, and every week is then reconstructed locally.
+    """
+
+    units: Iterable[Unit]
+    weeks: Iterable[tuple[int, int]]
+    timezone: pendulum.Timezone
+    all_staff_members_fetch_interactor: AllStaffMembersFetchInteractor
+    staff_positions_history_fetch_interactor: StaffPositionsHistoryFetchInteractor
+
+    async def execute(self) -> list[UnitWeeklyStaffData]:
+        staff_members = await self.all_staff_members_fetch_interactor.execute()
+        staff_positions_history = []
+        if staff_members:
+            staff_positions_history = (
+                await self.staff_positions_history_fetch_interactor.execute(
+                    staff_member.id for staff_member in staff_members
+                )
+            )
+        logger.info(
+            "Reconstructing staff data from %d staff members"
+            " and %d positions history records",
+            len(staff_members),
+            len(staff_positions_history),
+        )
+        return reconstruct_units_weekly_staff_data(
+            staff_members=staff_members,
+            staff_positions_history=staff_positions_history,
+            units=self.units,
+            weeks=self.weeks,
+            timezone=self.timezone,
+        )
@@ -1,6 +1,9 @@
+import asyncio
 from dataclasses import dataclass
 from collections.abc import Iterable
 
+import pendulum
+
 from application.interactors.staff_positions_history_fetch import (
     StaffPositionsHistoryFetchInteractor,
 )
@@ -11,34 +14,62 @@ from application.interactors.dismissed_staff_members_fetch import (
     DismissedStaffMembersFetchInteractor,
 )
 from domain.entities import Unit, UnitWeeklyStaffData
-from domain.services.common import get_ids
+from domain.services.period import get_period_by_week_number_of_year
 from domain.services.staff_members import (
+    CANDIDATES,
+    SPECIALIST,
+    get_candidate_staff_member_ids,
+    get_staff_member_ids_in_positions,
     merge_active_and_dismissed_staff_members_count,
 )
+from infrastructure.dodo_is_api.models import StaffPositionsHistory
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class StaffMembersStatisticsOrchestrator:
+    """
+    Counts staff members of the units in a week.
+
+    Positions history is fetched for current candidates only, which is
+    enough to count them. With `count_new_staff`, it is also fetched for
+    current specialists to count staff members who took a specialist or
+    candidate position during the week, at the cost of extra requests.
+    Otherwise new staff members are counted as zero.
+    """
+
     units: Iterable[Unit]
     month: int
     year: int
     week: int
+    timezone: pendulum.Timezone
     active_staff_members_fetch_interactor: ActiveStaffMembersFetchInteractor
     dismissed_staff_members_fetch_interactor: DismissedStaffMembersFetchInteractor
     staff_positions_history_fetch_interactor: StaffPositionsHistoryFetchInteractor
+    count_new_staff: bool = False
 
-    def execute(self) -> list[UnitWeeklyStaffData]:
-        active_staff_members = self.active_staff_members_fetch_interactor.execute()
-        dismissed_staff_members = (
-            self.dismissed_staff_members_fetch_interactor.execute()
-        )
-        staff_member_ids = get_ids(
-            active_staff_members,
-            dismissed_staff_members,
-        )
-        staff_positions_history = self.staff_positions_history_fetch_interactor.execute(
-            staff_member_ids
+    async def execute(self) -> list[UnitWeeklyStaffData]:
+        active_staff_members, dismissed_staff_members = await asyncio.gather(
+            self.active_staff_members_fetch_interactor.execute(),
+            self.dismissed_staff_members_fetch_interactor.execute(),
         )
+        if self.count_new_staff:
+            staff_member_ids = get_staff_member_ids_in_positions(
+                (*SPECIALIST, *CANDIDATES),
+                active_staff_members,
+                dismissed_staff_members,
+            )
+        else:
+            staff_member_ids = get_candidate_staff_member_ids(
+                active_staff_members,
+                dismissed_staff_members,
+            )
+        staff_positions_history: list[StaffPositionsHistory] = []
+        if staff_member_ids:
+            staff_positions_history = (
+                await self.staff_positions_history_fetch_interactor.execute(
+                    staff_member_ids
+                )
+            )
 
         return merge_active_and_dismissed_staff_members_count(
             active_staff_members=active_staff_members,
@@ -48,4 +79,9 @@ class StaffMembersStatisticsOrchestrator:
             year=self.year,
             month=self.month,
             week=self.week,
+            period=(
+                get_period_by_week_number_of_year(self.week, self.year, self.timezone)
+                if self.count_new_staff
+                else None
+            ),
         )
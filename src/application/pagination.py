@@ -0,0 +1,130 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Protocol, TypeVar
+
+from bootstrap.logger import create_logger
+
+
+__all__ = (
+    "Page",
+    "CountedPage",
+    "fetch_all_pages_sequentially",
+    "fetch_all_counted_pages",
+    "merge_pages_unique",
+)
+
+
+logger = create_logger("pagination")
+
+
+class Page(Protocol):
+    is_end_of_list_reached: bool
+
+
+class CountedPage(Page, Protocol):
+    total_count: int
+
+
+PageT = TypeVar("PageT", bound=Page)
+CountedPageT = TypeVar("CountedPageT", bound=CountedPage)
+ItemT = TypeVar("ItemT")
+
+
+async def fetch_all_pages_sequentially(
+    fetch_page: Callable[[int], Awaitable[PageT]],
+    *,
+    take: int,
+) -> list[PageT]:
+    """
+    Fetches all pages of an offset-paginated endpoint one after another.
+
+    Used for endpoints that do not report total count, so the next offset
+    is only known to be needed once the previous page has been received.
+    Every call starts from the first page.
+
+    Args:
+        fetch_page: Callable fetching the page that starts at the given skip.
+        take: Page size the `fetch_page` callable uses.
+
+    Returns:
+        list: Pages in the order of their offsets.
+    """
+    skip = 0
+    pages = [await fetch_page(skip)]
+    while not pages[-1].is_end_of_list_reached:
+        skip += take
+        pages.append(await fetch_page(skip))
+    return pages
+
+
+async def fetch_all_counted_pages(
+    fetch_page: Callable[[int], Awaitable[CountedPageT]],
+    *,
+    take: int,
+) -> list[CountedPageT]:
+    """
+    Fetches all pages of an offset-paginated endpoint that reports total count.
+
+    The first page is fetched alone to learn the total count, then all
+    remaining offsets are requested at the same time. Concurrency is
+    bounded by the connection the `fetch_page` callable uses.
+    If the list grew while it was being fetched, the rest of it is
+    fetched page by page until the end of the list is reached.
+
+    Args:
+        fetch_page: Callable fetching the page that starts at the given skip.
+        take: Page size the `fetch_page` callable uses.
+
+    Returns:
+        list: Pages in the order of their offsets.
+    """
+    first_page = await fetch_page(0)
+    if first_page.is_end_of_list_reached:
+        return [first_page]
+
+    skips = range(take, first_page.total_count, take)
+    pages = [first_page, *await asyncio.gather(*(fetch_page(skip) for skip in skips))]
+
+    skip = skips[-1] if skips else 0
+    while not pages[-1].is_end_of_list_reached:
+        skip += take
+        logger.debug("List grew while being fetched, fetching skip %d", skip)
+        pages.append(await fetch_page(skip))
+
+    total_counts = {page.total_count for page in pages}
+    if len(total_counts) > 1:
+        logger.warning(
+            "Total count changed while pages were being fetched: %s",
+            sorted(total_counts),
+        )
+
+    return pages
+
+
+def merge_pages_unique(
+    pages_items: Iterable[Iterable[ItemT]],
+    key: Callable[[ItemT], Hashable],
+) -> list[ItemT]:
+    """
+    Merges items of pages in order, dropping items seen on previous pages.
+
+    Records may shift between pages when the list changes while it is
+    being fetched, so the same record can be returned twice.
+
+    Args:
+        pages_items: Items of every page in the order of pages.
+        key: Callable returning the identity of an item.
+
+    Returns:
+        list: Unique items in the order they first appeared.
+    """
+    seen_keys: set[Hashable] = set()
+    result: list[ItemT] = []
+    for page_items in pages_items:
+        for item in page_items:
+            item_key = key(item)
+            if item_key in seen_keys:
+                continue
+            seen_keys.add(item_key)
+            result.append(item)
+    return result
@@ -0,0 +1,100 @@
+"""
+Measures how connection pool settings affect Dodo IS API client throughput.
+
+Requests are sent to the fake Dodo IS API answering with a fixed delay,
+so the numbers only reflect how many requests overlap and how often
+connections are reused.
+
+Run from the src directory:
+    python -m benchmarks.http_client_pool --requests 400 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from fake_dodo_is_api.api import FakeDodoIsApi, Faults
+from fake_dodo_is_api.dataset import SyntheticDataset
+from fake_dodo_is_api.server import start_fake_dodo_is_api_server
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
+from infrastructure.dodo_is_api.http_client import (
+    AsyncDodoIsApiHttpClient,
+    closing_async_dodo_is_api_http_client,
+)
+
+
+async def measure_requests_per_second(
+    *,
+    base_url: str,
+    limits: httpx.Limits,
+    requests_count: int,
+    max_concurrent_requests: int,
+) -> float:
+    async with closing_async_dodo_is_api_http_client(
+        base_url=base_url,
+        access_token="benchmark",
+        transport=httpx.AsyncHTTPTransport(limits=limits),
+    ) as http_client:
+        connection = AsyncDodoIsApiConnection(
+            http_client=AsyncDodoIsApiHttpClient(http_client),
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(
+                connection.get_unit_monthly_goals(
+                    month=1,
+                    year=2024,
+                    unit_uuid=uuid.uuid4(),
+                )
+                for _ in range(requests_count)
+            )
+        )
+        return requests_count / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--requests", type=int, default=400)
+    argument_parser.add_argument("--latency", type=float, default=0.05)
+    argument_parser.add_argument("--max-concurrent-requests", type=int, default=64)
+    args = argument_parser.parse_args()
+
+    server = start_fake_dodo_is_api_server(
+        FakeDodoIsApi(
+            dataset=SyntheticDataset(seed=0),
+            faults=Faults(latency=args.latency),
+        )
+    )
+    host, port = server.server_address[:2]
+    base_url = f"http://{host}:{port}"
+
+    cases = [
+        (max_connections, max_keepalive_connections)
+        for max_connections in (1, 4, 16, 64)
+        for max_keepalive_connections in (0, max_connections)
+    ]
+
+    print(f"{'connections':>11} {'keep-alive':>10} {'requests/s':>10}")
+    for max_connections, max_keepalive_connections in cases:
+        requests_per_second = await measure_requests_per_second(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            requests_count=args.requests,
+            max_concurrent_requests=args.max_concurrent_requests,
+        )
+        print(
+            f"{max_connections:>11} {max_keepalive_connections:>10} {requests_per_second:>10.1f}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
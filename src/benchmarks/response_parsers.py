@@ -0,0 +1,128 @@
+"""
+Compares the Dodo IS API response parsers with the previous approach.
+
+The previous parsers decoded JSON into Python objects first and then
+validated them with a `TypeAdapter` built on every call. The current
+ones validate the response bytes directly with adapters built once.
+Payloads are generated by the fake Dodo IS API.
+
+Run from the src directory:
+    python -m benchmarks.response_parsers --records 5000 --repeat 20
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+from collections.abc import Callable
+
+import httpx
+from pydantic import TypeAdapter
+
+from fake_dodo_is_api.dataset import SyntheticDataset
+from infrastructure.dodo_is_api.models import (
+    StaffMembersResponse,
+    StaffPositionsHistoryResponse,
+    UnitDeliveryStatistics,
+)
+from infrastructure.dodo_is_api.response_parsers import (
+    parse_delivery_statistics_response,
+    parse_staff_members_response,
+    parse_staff_positions_history_response,
+)
+
+
+def parse_delivery_statistics_response_previously(
+    response: httpx.Response,
+) -> list[UnitDeliveryStatistics]:
+    response_data = response.json()
+    type_adapter = TypeAdapter(list[UnitDeliveryStatistics])
+    return type_adapter.validate_python(response_data["unitsStatistics"])
+
+
+def parse_staff_members_response_previously(
+    response: httpx.Response,
+) -> StaffMembersResponse:
+    return StaffMembersResponse.model_validate(response.json())
+
+
+def parse_staff_positions_history_response_previously(
+    response: httpx.Response,
+) -> StaffPositionsHistoryResponse:
+    return StaffPositionsHistoryResponse.model_validate(response.json())
+
+
+def build_payloads(records_count: int) -> dict[str, bytes]:
+    dataset = SyntheticDataset(seed=0, staff_members_per_unit=records_count)
+    unit_uuid = uuid.UUID(int=1)
+    staff_members = dataset.get_staff_members([unit_uuid])
+    positions_history = dataset.get_units_positions_history([unit_uuid])
+    units_statistics = [
+        dataset.get_unit_delivery_statistics(
+            uuid.UUID(int=unit_number), "2024-01-01", "2024-02-01"
+        )
+        for unit_number in range(records_count)
+    ]
+    pagination = {
+        "skippedCount": 0,
+        "takenCount": records_count,
+        "totalCount": records_count,
+        "isEndOfListReached": True,
+    }
+    return {
+        "staff members": json.dumps({"members": staff_members, **pagination}).encode(),
+        "positions history": json.dumps(
+            {"history": positions_history, **pagination}
+        ).encode(),
+        "delivery statistics": json.dumps(
+            {"unitsStatistics": units_statistics}
+        ).encode(),
+    }
+
+
+def measure_seconds(
+    parse: Callable[[httpx.Response], object],
+    payload: bytes,
+    repeat: int,
+) -> float:
+    response = httpx.Response(200, content=payload)
+    return min(timeit.repeat(lambda: parse(response), number=1, repeat=repeat))
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--records", type=int, default=5000)
+    argument_parser.add_argument("--repeat", type=int, default=20)
+    args = argument_parser.parse_args()
+
+    payloads = build_payloads(args.records)
+    parsers = {
+        "staff members": (
+            parse_staff_members_response_previously,
+            parse_staff_members_response,
+        ),
+        "positions history": (
+            parse_staff_positions_history_response_previously,
+            parse_staff_positions_history_response,
+        ),
+        "delivery statistics": (
+            parse_delivery_statistics_response_previously,
+            parse_delivery_statistics_response,
+        ),
+    }
+
+    print(
+        f"{'payload':<20} {'KiB':>8} {'previous ms':>12} {'current ms':>11} {'speedup':>8}"
+    )
+    for name, (parse_previously, parse) in parsers.items():
+        payload = payloads[name]
+        previous_seconds = measure_seconds(parse_previously, payload, args.repeat)
+        current_seconds = measure_seconds(parse, payload, args.repeat)
+        print(
+            f"{name:<20} {len(payload) / 1024:>8.0f} {previous_seconds * 1000:>12.1f} "
+            f"{current_seconds * 1000:>11.1f} {previous_seconds / current_seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
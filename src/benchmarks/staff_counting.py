@@ -0,0 +1,101 @@
+"""
+Compares columnar staff counting with the reference implementation.
+
+`compute_staff_count_by_position` walks staff members unit by unit and
+tests positions against tuples of IDs. The columnar implementation
+encodes units and position categories as integers and counts them with
+a single `numpy.bincount`. Both must return the same counts.
+
+Run from the src directory:
+    python -m benchmarks.staff_counting --units 30 --staff-members-per-unit 300
+"""
+
+import argparse
+import random
+import timeit
+import uuid
+
+from domain.services.staff_members import (
+    CANDIDATES,
+    COURIERS,
+    INTERNS,
+    MANAGERS,
+    SKIPPED,
+    SPECIALIST,
+    compute_staff_count_by_position,
+    compute_staff_count_by_position_columnar,
+)
+from domain.services.staff_history import StaffMemberOnDate
+
+
+POSITION_IDS = (
+    *INTERNS,
+    *COURIERS,
+    *SPECIALIST,
+    *CANDIDATES,
+    *MANAGERS,
+    *SKIPPED,
+    None,
+)
+
+
+def build_staff_members(
+    units_count: int,
+    staff_members_per_unit: int,
+    seed: int,
+) -> tuple[list[StaffMemberOnDate], set[uuid.UUID]]:
+    rng = random.Random(seed)
+    staff_members = [
+        StaffMemberOnDate(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            unit_uuid=uuid.UUID(int=rng.randrange(units_count) + 1),
+            position_id=rng.choice(POSITION_IDS),
+        )
+        for _ in range(units_count * staff_members_per_unit)
+    ]
+    specialist_staff_member_ids = {
+        staff_member.id for staff_member in staff_members if rng.random() < 0.3
+    }
+    return staff_members, specialist_staff_member_ids
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--units", type=int, default=30)
+    argument_parser.add_argument("--staff-members-per-unit", type=int, default=300)
+    argument_parser.add_argument("--repeat", type=int, default=20)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    args = argument_parser.parse_args()
+
+    staff_members, specialist_staff_member_ids = build_staff_members(
+        args.units, args.staff_members_per_unit, args.seed
+    )
+
+    reference_counts = compute_staff_count_by_position(
+        staff_members, specialist_staff_member_ids
+    )
+    columnar_counts = compute_staff_count_by_position_columnar(
+        staff_members, specialist_staff_member_ids
+    )
+    if columnar_counts != reference_counts:
+        raise SystemExit("Columnar counts differ from the reference counts")
+
+    implementations = {
+        "reference": compute_staff_count_by_position,
+        "columnar": compute_staff_count_by_position_columnar,
+    }
+    print(f"{len(staff_members)} staff members in {args.units} units")
+    print(f"{'implementation':<16} {'ms':>8}")
+    for name, compute in implementations.items():
+        seconds = min(
+            timeit.repeat(
+                lambda: compute(staff_members, specialist_staff_member_ids),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{name:<16} {seconds * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
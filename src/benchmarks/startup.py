@@ -0,0 +1,184 @@
+"""
+Measures import time of the entry points and fails when it regresses.
+
+Every entry point is imported in a fresh interpreter with `-X importtime`
+several times, both from this tree and from the baseline git ref checked
+out into a temporary worktree. Imports of the two trees alternate, so both
+are measured on the same machine under the same load, and the medians of
+their cumulative import times are compared. The run fails when an entry
+point got slower than the baseline by more than the tolerance, or when it
+imports a module it must not, such as gspread in download runs which only
+need a cached token.
+
+Run from the src directory:
+    python -m benchmarks.startup --baseline-ref main
+"""
+
+import argparse
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+ENTRY_POINTS = (
+    "download_staff_data",
+    "download_economics_data",
+    "upload_to_dashboard_spreadsheet",
+)
+
+# Top-level packages each entry point must not import at startup.
+FORBIDDEN_PACKAGES = {
+    "download_staff_data": ("gspread", "google"),
+    "download_economics_data": ("gspread", "google"),
+}
+
+SRC_DIR = pathlib.Path(__file__).parent.parent
+
+
+def parse_import_times(importtime_output: str) -> dict[str, int]:
+    """
+    Parses the `-X importtime` report.
+
+    Args:
+        importtime_output: Standard error of the interpreter.
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds by module name.
+    """
+    import_times: dict[str, int] = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_time, module_name = line.removeprefix("import time:").split("|")
+        if not cumulative_time.strip().isdigit():
+            continue
+        import_times[module_name.strip()] = int(cumulative_time)
+    return import_times
+
+
+def measure_import(module_name: str, src_dir: pathlib.Path) -> dict[str, int]:
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=src_dir,
+    )
+    return parse_import_times(completed_process.stderr)
+
+
+def run_git(*args: str, cwd: pathlib.Path) -> str:
+    completed_process = subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=cwd,
+    )
+    return completed_process.stdout.strip()
+
+
+@contextmanager
+def checkout_src_dir(ref: str) -> Iterator[pathlib.Path]:
+    """
+    Checks out the git ref into a temporary worktree.
+
+    Args:
+        ref: Commit, branch or tag to check out.
+
+    Yields:
+        pathlib.Path: The src directory of the worktree.
+    """
+    src_dir_prefix = run_git("rev-parse", "--show-prefix", cwd=SRC_DIR)
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        worktree_dir = pathlib.Path(temporary_dir) / "worktree"
+        run_git("worktree", "add", "--detach", str(worktree_dir), ref, cwd=SRC_DIR)
+        try:
+            yield worktree_dir / src_dir_prefix
+        finally:
+            run_git("worktree", "remove", "--force", str(worktree_dir), cwd=SRC_DIR)
+
+
+def find_forbidden_modules(
+    imported_module_names: list[str],
+    forbidden_packages: tuple[str, ...],
+) -> list[str]:
+    return sorted(
+        module_name
+        for module_name in imported_module_names
+        if module_name.split(".")[0] in forbidden_packages
+    )
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument(
+        "--baseline-ref",
+        required=True,
+        help="Git ref to compare import times against, e.g. main",
+    )
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    argument_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline, 0.25 is 25%%",
+    )
+    args = argument_parser.parse_args()
+
+    failures: list[str] = []
+
+    with checkout_src_dir(args.baseline_ref) as baseline_src_dir:
+        print(f"{'entry point':<34} {'median ms':>10} {'baseline ms':>12}")
+        for entry_point in ENTRY_POINTS:
+            has_baseline = (baseline_src_dir / f"{entry_point}.py").exists()
+            measurements: list[dict[str, int]] = []
+            baseline_measurements: list[dict[str, int]] = []
+            for _ in range(args.repeat):
+                measurements.append(measure_import(entry_point, SRC_DIR))
+                if has_baseline:
+                    baseline_measurements.append(
+                        measure_import(entry_point, baseline_src_dir)
+                    )
+
+            median_ms = statistics.median(
+                import_times[entry_point] / 1000 for import_times in measurements
+            )
+            baseline_ms = None
+            if baseline_measurements:
+                baseline_ms = statistics.median(
+                    import_times[entry_point] / 1000
+                    for import_times in baseline_measurements
+                )
+            baseline_text = "-" if baseline_ms is None else f"{baseline_ms:.1f}"
+            print(f"{entry_point:<34} {median_ms:>10.1f} {baseline_text:>12}")
+
+            if baseline_ms is not None and median_ms > baseline_ms * (
+                1 + args.tolerance
+            ):
+                failures.append(
+                    f"{entry_point} imports in {median_ms:.1f} ms, "
+                    f"{args.baseline_ref} in {baseline_ms:.1f} ms"
+                )
+
+            forbidden_modules = find_forbidden_modules(
+                list(measurements[0]), FORBIDDEN_PACKAGES.get(entry_point, ())
+            )
+            if forbidden_modules:
+                failures.append(
+                    f"{entry_point} imports {', '.join(forbidden_modules[:5])}"
+                    + (" and more" if len(forbidden_modules) > 5 else "")
+                )
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
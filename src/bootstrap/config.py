@@ -1,7 +1,7 @@
 import tomllib
 import pathlib
 from typing import Final
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
 import pendulum
@@ -13,11 +13,20 @@ __all__ = (
     "CONFIG_FILE_PATH",
     "GOOGLE_SHEETS_SERVICE_ACCOUNT_CREDENTIALS_FILE_PATH",
     "DashboardConfig",
+    "AccessTokenCacheConfig",
     "AuthCredentialsConfig",
+    "DodoIsApiCacheConfig",
+    "DodoIsApiRateLimitConfig",
+    "DodoIsApiRetryConfig",
+    "DodoIsApiConfig",
+    "CalendarConfig",
     "Config",
     "load_config_from_file",
     "STORAGE_FILE_PATH",
+    "HTTP_CACHE_FILE_PATH",
+    "ACCESS_TOKEN_CACHE_FILE_PATH",
     "SRC_DIR",
+    "DEFAULT_MAX_CONCURRENT_REQUESTS",
 )
 
 SRC_DIR = pathlib.Path(__file__).parent.parent.parent
@@ -26,6 +35,11 @@ GOOGLE_SHEETS_SERVICE_ACCOUNT_CREDENTIALS_FILE_PATH: Final[pathlib.Path] = (
     SRC_DIR / "credentials" / "google_sheets_service_account.json"
 )
 STORAGE_FILE_PATH: Final[pathlib.Path] = SRC_DIR / "database.db"
+HTTP_CACHE_FILE_PATH: Final[pathlib.Path] = SRC_DIR / "http_cache.db"
+ACCESS_TOKEN_CACHE_FILE_PATH: Final[pathlib.Path] = (
+    SRC_DIR / "credentials" / "dodo_is_api_access_token.json"
+)
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final[int] = 8
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -35,15 +49,111 @@ class DashboardConfig:
     economics_sheet_id: int
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AccessTokenCacheConfig:
+    """
+    Attributes:
+        enabled: Whether the access token is cached on disk between runs.
+        ttl: Seconds the cached access token is used for.
+        check_jwt_expiry: Whether the access token also expires when
+            its JWT "exp" claim says so, if it is a JWT.
+    """
+
+    enabled: bool = True
+    ttl: int = 3600
+    check_jwt_expiry: bool = True
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class AuthCredentialsConfig:
     spreadsheet_id: str
     sheet_id: int
+    access_token_cache: AccessTokenCacheConfig = field(
+        default_factory=AccessTokenCacheConfig
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DodoIsApiCacheConfig:
+    """
+    Attributes:
+        enabled: Whether responses are cached on disk.
+        current_period_ttl: Seconds responses for not yet closed periods live.
+            Responses for closed periods never expire.
+        max_size: Size of cached responses in bytes, above which
+            the least recently used ones are evicted.
+    """
+
+    enabled: bool = True
+    current_period_ttl: int = 600
+    max_size: int = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DodoIsApiRateLimitConfig:
+    """
+    Attributes:
+        requests_per_second: Request rate allowed for every endpoint.
+        burst: Number of requests an endpoint may get at once after idling.
+        endpoints: Request rates of specific endpoints by path,
+            e.g. {"/staff/positions/history" = 2}.
+    """
+
+    requests_per_second: float = 10
+    burst: int = 10
+    endpoints: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DodoIsApiRetryConfig:
+    """
+    Attributes:
+        max_attempts: Attempts of a single request, including the first one.
+        base_delay: Upper bound in seconds of the delay before the first retry,
+            doubled for every next one.
+        max_delay: Upper bound in seconds of any backoff delay.
+        budget: Retries all requests of a run may spend together.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30
+    budget: int = 100
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DodoIsApiConfig:
     base_url: str
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
+    memoized_responses_count: int = 0
+    staff_members_take: int = 1000
+    staff_positions_history_fetch_mode: str = "staff_members"
+    cache: DodoIsApiCacheConfig = field(default_factory=DodoIsApiCacheConfig)
+    rate_limit: DodoIsApiRateLimitConfig = field(
+        default_factory=DodoIsApiRateLimitConfig
+    )
+    retry: DodoIsApiRetryConfig = field(default_factory=DodoIsApiRetryConfig)
+    max_connections: int = 20
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    timeout: float = 120
+    endpoint_timeouts: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CalendarConfig:
+    """
+    Attributes:
+        from_year: First year whose weeks are precomputed.
+        to_year: Last year whose weeks are precomputed.
+            Weeks of other years are computed on the first lookup.
+        store: Whether the weeks are also stored in the storage
+            as the calendar_weeks table.
+    """
+
+    from_year: int = 2020
+    to_year: int = 2030
+    store: bool = False
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -53,6 +163,7 @@ class Config:
     dashboard: DashboardConfig
     auth_credentials: AuthCredentialsConfig
     dodo_is_api: DodoIsApiConfig
+    calendar: CalendarConfig = field(default_factory=CalendarConfig)
 
 
 def load_config_from_file(file_path: pathlib.Path = CONFIG_FILE_PATH) -> Config:
@@ -68,8 +179,18 @@ def load_config_from_file(file_path: pathlib.Path = CONFIG_FILE_PATH) -> Config:
     auth_credentials = AuthCredentialsConfig(
         spreadsheet_id=config["auth_credentials"]["spreadsheet"]["id"],
         sheet_id=config["auth_credentials"]["spreadsheet"]["sheet_id"],
+        access_token_cache=AccessTokenCacheConfig(
+            **config["auth_credentials"].get("access_token_cache", {})
+        ),
+    )
+    dodo_is_api_config = dict(config["dodo_is_api"])
+    dodo_is_api = DodoIsApiConfig(
+        cache=DodoIsApiCacheConfig(**dodo_is_api_config.pop("cache", {})),
+        rate_limit=DodoIsApiRateLimitConfig(**dodo_is_api_config.pop("rate_limit", {})),
+        retry=DodoIsApiRetryConfig(**dodo_is_api_config.pop("retry", {})),
+        **dodo_is_api_config,
     )
-    dodo_is_api = DodoIsApiConfig(base_url=config["dodo_is_api"]["base_url"])
+    calendar = CalendarConfig(**config.get("calendar", {}))
     units = [
         Unit(uuid=UUID(unit["uuid"]), name=unit["name"])
         for unit in config["auth_credentials"]["units"]
@@ -80,4 +201,5 @@ def load_config_from_file(file_path: pathlib.Path = CONFIG_FILE_PATH) -> Config:
         dashboard=dashboard,
         auth_credentials=auth_credentials,
         dodo_is_api=dodo_is_api,
+        calendar=calendar,
     )
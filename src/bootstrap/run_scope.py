@@ -0,0 +1,177 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+)
+from typing import Any, ParamSpec, TypeVar, get_args, get_origin
+
+
+__all__ = (
+    "RunScope",
+    "RunScopeError",
+    "open_run_scope",
+    "open_async_run_scope",
+    "run_scoped",
+)
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class RunScopeError(Exception):
+    pass
+
+
+class RunScope:
+    """
+    Dependencies resolved during a single run of an entry point.
+
+    Every dependency is resolved once and its value is reused for the
+    rest of the run. Dependencies written as generators are entered into
+    the exit stack of the scope, so they are closed in reverse order of
+    resolution when the scope is closed.
+    """
+
+    def __init__(
+        self,
+        exit_stack: contextlib.ExitStack | contextlib.AsyncExitStack,
+    ) -> None:
+        self.__exit_stack = exit_stack
+        self.__values: dict[Callable, Any] = {}
+        self.__lock = threading.RLock()
+
+    def resolve(self, dependency: Callable, *args: Any, **kwargs: Any) -> Any:
+        with self.__lock:
+            if dependency in self.__values:
+                return self.__values[dependency]
+
+            if inspect.isgeneratorfunction(dependency):
+                context_manager = contextlib.contextmanager(dependency)(*args, **kwargs)
+                value = self.__exit_stack.enter_context(context_manager)
+            else:
+                value = dependency(*args, **kwargs)
+
+            self.__values[dependency] = value
+            return value
+
+    async def resolve_async(
+        self, dependency: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        if dependency in self.__values:
+            return self.__values[dependency]
+
+        if inspect.isasyncgenfunction(dependency):
+            if not isinstance(self.__exit_stack, contextlib.AsyncExitStack):
+                raise RunScopeError(
+                    f"Async dependency {dependency.__qualname__}"
+                    " requires an async run scope"
+                )
+            context_manager = contextlib.asynccontextmanager(dependency)(
+                *args, **kwargs
+            )
+            value = await self.__exit_stack.enter_async_context(context_manager)
+        else:
+            value = await dependency(*args, **kwargs)
+
+        # Another task may have resolved the dependency while this one waited.
+        return self.__values.setdefault(dependency, value)
+
+
+current_run_scope: contextvars.ContextVar[RunScope] = contextvars.ContextVar(
+    "current_run_scope"
+)
+
+
+def get_current_run_scope(dependency: Callable) -> RunScope:
+    try:
+        return current_run_scope.get()
+    except LookupError:
+        raise RunScopeError(
+            f"Dependency {dependency.__qualname__} is resolved outside of a run scope"
+        ) from None
+
+
+@contextlib.contextmanager
+def open_run_scope() -> Iterator[RunScope]:
+    with contextlib.ExitStack() as exit_stack:
+        run_scope = RunScope(exit_stack)
+        token = current_run_scope.set(run_scope)
+        try:
+            yield run_scope
+        finally:
+            current_run_scope.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def open_async_run_scope() -> AsyncIterator[RunScope]:
+    async with contextlib.AsyncExitStack() as exit_stack:
+        run_scope = RunScope(exit_stack)
+        token = current_run_scope.set(run_scope)
+        try:
+            yield run_scope
+        finally:
+            current_run_scope.reset(token)
+
+
+GENERATOR_TYPES = (Generator, Iterator, AsyncGenerator, AsyncIterator)
+
+
+def get_value_signature(dependency: Callable) -> inspect.Signature:
+    """
+    Builds the signature of the dependency returning its value.
+
+    Generator dependencies return the type they yield, so that fast_depends
+    does not validate the resolved value as a generator.
+    """
+    signature = inspect.signature(dependency)
+    return_annotation = signature.return_annotation
+    if get_origin(return_annotation) in GENERATOR_TYPES:
+        return signature.replace(return_annotation=get_args(return_annotation)[0])
+    return signature
+
+
+def run_scoped(dependency: Callable[P, T]) -> Callable[P, T]:
+    """
+    Makes the dependency resolve once per run scope.
+
+    The decorated function keeps the signature of the dependency,
+    so fast_depends still resolves its own dependencies. Generators
+    and async generators are turned into the value they yield.
+
+    Args:
+        dependency: Function, coroutine function, generator function
+            or async generator function providing the dependency.
+
+    Returns:
+        Function returning the value of the dependency in the current run scope.
+
+    Raises:
+        RunScopeError: If called outside of a run scope.
+    """
+    if inspect.iscoroutinefunction(dependency) or inspect.isasyncgenfunction(
+        dependency
+    ):
+
+        @functools.wraps(dependency)
+        async def resolve_async(*args: P.args, **kwargs: P.kwargs) -> Any:
+            run_scope = get_current_run_scope(dependency)
+            return await run_scope.resolve_async(dependency, *args, **kwargs)
+
+        resolve_async.__signature__ = get_value_signature(dependency)  # type: ignore[attr-defined]
+        return resolve_async  # type: ignore[return-value]
+
+    @functools.wraps(dependency)
+    def resolve(*args: P.args, **kwargs: P.kwargs) -> Any:
+        run_scope = get_current_run_scope(dependency)
+        return run_scope.resolve(dependency, *args, **kwargs)
+
+    resolve.__signature__ = get_value_signature(dependency)  # type: ignore[attr-defined]
+    return resolve  # type: ignore[return-value]
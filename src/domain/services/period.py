@@ -1,13 +1,19 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 import pendulum
 
+from domain.services.week_calendar import get_week_calendar, get_weeks_count_of_year
+
 
 __all__ = (
     "Period",
     "get_current_week_number",
     "get_current_week_number_of_year",
+    "get_current_year_and_week_number_of_year",
     "get_month_number_by_week_number_of_year",
+    "get_weeks_count_of_year",
+    "iter_weeks_of_years",
 )
 
 
@@ -70,55 +76,96 @@ def get_current_week_number_of_year(timezone: pendulum.Timezone) -> int:
     return now.week_of_year
 
 
+def get_current_year_and_week_number_of_year(
+    timezone: pendulum.Timezone,
+) -> tuple[int, int]:
+    """
+    Returns the ISO year and week number of the current week.
+
+    The ISO year differs from the calendar year in the first and last days
+    of some years, e.g. January 1st, 2027 falls into the 53rd week of 2026.
+
+    Args:
+        timezone (pendulum.Timezone): The timezone to consider.
+
+    Returns:
+        tuple[int, int]: The ISO year and week number of the current week.
+    """
+    year, week, _ = pendulum.now(timezone).isocalendar()
+    return year, week
+
+
 def get_period_by_week_number_of_year(
     week_number: int, year: int, timezone: pendulum.Timezone
 ) -> Period:
     """
-    Returns the period corresponding to a specific week of the year.
+    Returns the period corresponding to a specific ISO week of the year.
 
     Args:
-        week_number (int): The week number (1-53).
-        year (int): The year number.
+        week_number (int): The ISO week number.
+        year (int): The ISO year number.
         timezone (pendulum.Timezone): The timezone to consider.
 
     Returns:
         Period: The period representing the specified week.
 
     Raises:
-        ValueError: If the week number is not valid (e.g., greater than 53 or less than 1).
+        ValueError: If the week number is not valid for the year.
     """
-    if not (1 <= week_number <= 53):
-        raise ValueError(
-            f"Invalid week number: {week_number}. Week number must be between 1 and 53."
-        )
-
-    start_of_year = pendulum.datetime(year=year, month=1, day=1, tz=timezone)
-    from_date = start_of_year.add(weeks=week_number - 1).start_of("week")
-    to_date = from_date.end_of("week")
-
+    from_date, to_date = get_week_calendar(timezone).get_bounds(year, week_number)
     return Period(from_date=from_date, to_date=to_date)
 
 
-def get_month_number_by_week_number_of_year(week_number: int, year: int):
+def get_month_number_by_week_number_of_year(
+    week_number: int, year: int, timezone: pendulum.Timezone = pendulum.UTC
+) -> int:
     """
-    Returns the month number corresponding to a specific week of the year.
+    Returns the month number corresponding to a specific ISO week of the year.
 
     Args:
-        week_number (int): The week number (1-53).
-        year (int): The year number.
+        week_number (int): The ISO week number.
+        year (int): The ISO year number.
+        timezone (pendulum.Timezone): The timezone to consider.
 
     Returns:
-        int: The month number of the specified week.
+        int: The month number of the first day of the specified week.
 
     Raises:
-        ValueError: If the week number is not valid (e.g., greater than 53 or less than 1).
+        ValueError: If the week number is not valid for the year.
     """
-    if not (1 <= week_number <= 53):
-        raise ValueError(
-            f"Invalid week number: {week_number}. Week number must be between 1 and 53."
-        )
+    return get_week_calendar(timezone).get_week(year, week_number).month
+
 
-    start_of_year = pendulum.datetime(year=year, month=1, day=1)
-    week_start = start_of_year.add(weeks=week_number - 1).start_of("week")
+def iter_weeks_of_years(
+    *,
+    from_year: int,
+    from_week: int,
+    to_year: int,
+    to_week: int,
+) -> Iterator[tuple[int, int]]:
+    """
+    Iterates over the ISO weeks between two weeks of the year, both included.
 
-    return week_start.month
+    Args:
+        from_year (int): The ISO year of the first week.
+        from_week (int): The ISO week number of the first week.
+        to_year (int): The ISO year of the last week.
+        to_week (int): The ISO week number of the last week.
+
+    Yields:
+        tuple[int, int]: The year and the week number of every week.
+
+    Raises:
+        ValueError: If a week number is not valid for its year.
+    """
+    for year, week in ((from_year, from_week), (to_year, to_week)):
+        if not (1 <= week <= get_weeks_count_of_year(year)):
+            raise ValueError(f"Invalid week number: {week} of year {year}")
+
+    year, week = from_year, from_week
+    while (year, week) <= (to_year, to_week):
+        yield year, week
+        if week < get_weeks_count_of_year(year):
+            week += 1
+        else:
+            year, week = year + 1, 1
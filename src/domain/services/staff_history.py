@@ -0,0 +1,167 @@
+import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Protocol
+from uuid import UUID
+
+import pendulum
+
+from domain.entities import Unit, UnitWeeklyStaffData
+from domain.services.period import (
+    get_month_number_by_week_number_of_year,
+    get_period_by_week_number_of_year,
+)
+from domain.services.staff_members import (
+    SPECIALIST,
+    StaffMember,
+    StaffPosition,
+    StaffPositionInUnit,
+    count_new_staff_by_period,
+    count_units_weekly_staff_data,
+)
+from domain.services.staff_positions_index import StaffPositionsIndex
+
+
+__all__ = (
+    "HistoricalStaffMember",
+    "HistoricalStaffPosition",
+    "StaffMemberOnDate",
+    "get_specialist_since",
+    "reconstruct_units_weekly_staff_data",
+)
+
+
+class HistoricalStaffMember(StaffMember, Protocol):
+    hired_on: datetime.date
+    dismissed_on: datetime.date | None
+
+
+class HistoricalStaffPosition(StaffPosition, StaffPositionInUnit, Protocol):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffMemberOnDate:
+    id: UUID
+    unit_uuid: UUID
+    position_id: UUID | None
+
+
+def get_specialist_since(
+    staff_positions_history: Iterable[StaffPosition],
+) -> dict[UUID, datetime.date]:
+    """
+    Finds when every staff member took a specialist position for the first time.
+
+    Args:
+        staff_positions_history: Positions history records.
+
+    Returns:
+        dict[UUID, datetime.date]: The date by staff member ID.
+    """
+    specialist_since: dict[UUID, datetime.date] = {}
+    for staff_position in staff_positions_history:
+        if staff_position.position_id not in SPECIALIST:
+            continue
+        since = specialist_since.get(staff_position.staff_id)
+        if since is None or staff_position.take_position_on < since:
+            specialist_since[staff_position.staff_id] = staff_position.take_position_on
+    return specialist_since
+
+
+def get_staff_member_on(
+    staff_member: HistoricalStaffMember,
+    date: datetime.date,
+    staff_positions_index: StaffPositionsIndex,
+) -> StaffMemberOnDate:
+    # Staff members without history on the date keep their current position.
+    position_id = staff_positions_index.get_position_id_on(staff_member.id, date)
+    if position_id is None:
+        position_id = staff_member.position_id
+    return StaffMemberOnDate(
+        id=staff_member.id,
+        unit_uuid=staff_member.unit_uuid,
+        position_id=position_id,
+    )
+
+
+def reconstruct_units_weekly_staff_data(
+    *,
+    staff_members: Iterable[HistoricalStaffMember],
+    staff_positions_history: Iterable[HistoricalStaffPosition],
+    units: Iterable[Unit],
+    weeks: Iterable[tuple[int, int]],
+    timezone: pendulum.Timezone,
+) -> list[UnitWeeklyStaffData]:
+    """
+    Computes staff data of every week from one snapshot of staff members.
+
+    For each week, staff members employed at its end, hired on its last
+    day or before and not dismissed by then, are active, and those
+    dismissed during it are dismissed.
+    They are counted by the position they held at the end of the week or
+    on the day of dismissal, and candidates are counted as kitchen members
+    if they had been specialists by then. Specialist and candidate
+    positions taken during the week are counted as new staff of the unit
+    they were taken in.
+
+    Args:
+        staff_members: Staff members of every status.
+        staff_positions_history: Positions history of the staff members.
+        units: Units to compute staff data of.
+        weeks: Years and week numbers to compute staff data of.
+        timezone: Timezone the weeks are in.
+
+    Returns:
+        list[UnitWeeklyStaffData]: Staff data of every unit for every week.
+    """
+    staff_members = list(staff_members)
+    staff_positions_history = list(staff_positions_history)
+    units = list(units)
+    staff_positions_index = StaffPositionsIndex(staff_positions_history)
+    specialist_since = get_specialist_since(staff_positions_history)
+
+    week_to_period: dict[tuple[int, int], tuple[datetime.date, datetime.date]] = {}
+    for year, week in weeks:
+        period = get_period_by_week_number_of_year(week, year, timezone)
+        week_to_period[(year, week)] = (period.from_date.date(), period.to_date.date())
+    week_to_new_staff_count = count_new_staff_by_period(
+        staff_positions_history, week_to_period
+    )
+
+    units_weekly_staff_data: list[UnitWeeklyStaffData] = []
+    for (year, week), (from_date, to_date) in week_to_period.items():
+        active_staff_members: list[StaffMemberOnDate] = []
+        dismissed_staff_members: list[StaffMemberOnDate] = []
+        for staff_member in staff_members:
+            dismissed_on = staff_member.dismissed_on
+            if dismissed_on is not None and from_date <= dismissed_on <= to_date:
+                dismissed_staff_members.append(
+                    get_staff_member_on(
+                        staff_member, dismissed_on, staff_positions_index
+                    )
+                )
+            elif staff_member.hired_on <= to_date and (
+                dismissed_on is None or dismissed_on > to_date
+            ):
+                active_staff_members.append(
+                    get_staff_member_on(staff_member, to_date, staff_positions_index)
+                )
+
+        specialist_staff_member_ids = {
+            staff_member.id
+            for staff_member in (*active_staff_members, *dismissed_staff_members)
+            if specialist_since.get(staff_member.id, datetime.date.max) <= to_date
+        }
+        units_weekly_staff_data += count_units_weekly_staff_data(
+            active_staff_members=active_staff_members,
+            dismissed_staff_members=dismissed_staff_members,
+            specialist_staff_member_ids=specialist_staff_member_ids,
+            units=units,
+            year=year,
+            month=get_month_number_by_week_number_of_year(week, year, timezone),
+            week=week,
+            unit_uuid_to_new_staff_count=week_to_new_staff_count[(year, week)],
+        )
+
+    return units_weekly_staff_data
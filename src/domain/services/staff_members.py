@@ -1,15 +1,23 @@
-from collections.abc import Iterable
+import datetime
+import enum
+from collections.abc import Hashable, Iterable, Mapping
 from collections import defaultdict
 from dataclasses import dataclass
 from uuid import UUID
 from typing import Protocol, TypeVar
 
-from domain.enums import StaffMemberStatus, StaffMemberType
+import numpy as np
+
+from bootstrap.logger import create_logger
 from domain.services.common import HasUnitUuidT
 from domain.entities import UnitStaffCountByPosition, Unit, UnitWeeklyStaffData
+from domain.services.period import Period
 from domain.services.units import map_unit_uuid_to_item
 
 
+logger = create_logger("staff_members")
+
+
 INTERNS = (
     UUID("09b059ae5fceac4211eb7bf91936e79c"),
     UUID("09b059ae5fceac4211eb7bf91936f16d"),
@@ -39,13 +47,33 @@ MANAGERS = (UUID("09b059ae5fceac4211eb7bf91936faa5"),)
 SKIPPED = (UUID("09b059ae5fceac4211eb7bf9193701a7"),)
 
 
+class PositionCategory(enum.IntEnum):
+    MANAGER = 0
+    KITCHEN_MEMBER = 1
+    COURIER = 2
+    CANDIDATE = 3
+    INTERN = 4
+
+
+# Filled in reverse order of the checks in `compute_staff_count_by_position`,
+# so a position listed twice gets the category checked first.
+POSITION_ID_TO_CATEGORY: dict[UUID, PositionCategory] = {
+    position_id: category
+    for position_id, category in {
+        **dict.fromkeys(INTERNS, PositionCategory.INTERN),
+        **dict.fromkeys(CANDIDATES, PositionCategory.CANDIDATE),
+        **dict.fromkeys(COURIERS, PositionCategory.COURIER),
+        **dict.fromkeys(SPECIALIST, PositionCategory.KITCHEN_MEMBER),
+        **dict.fromkeys(MANAGERS, PositionCategory.MANAGER),
+    }.items()
+    if position_id not in SKIPPED
+}
+
+
 class StaffMember(Protocol):
     id: UUID
     unit_uuid: UUID
-    status: StaffMemberStatus
-    staff_type: StaffMemberType
     position_id: UUID | None
-    position_name: str | None
 
 
 def group_by_unit_uuid(
@@ -91,7 +119,7 @@ def compute_staff_count_by_position(
             elif staff_member.position_id in INTERNS:
                 interns_count += 1
             else:
-                print(f"Unknown staff position: {staff_member}")
+                logger.warning("Unknown staff position: %s", staff_member.position_id)
 
         unit_staff_count_by_position = UnitStaffCountByPosition(
             unit_uuid=unit_uuid,
@@ -106,6 +134,110 @@ def compute_staff_count_by_position(
     return units_staff_count_by_position
 
 
+def compute_staff_count_by_position_columnar(
+    staff_members: Iterable[StaffMember],
+    specialist_staff_member_ids: Iterable[UUID],
+) -> list[UnitStaffCountByPosition]:
+    """
+    Counts staff members of every unit by position category in one pass.
+
+    Same as `compute_staff_count_by_position`, which stays as the reference
+    implementation. Units and position categories are encoded as small
+    integers through `POSITION_ID_TO_CATEGORY`, and all units are counted
+    at once with a single `numpy.bincount`.
+
+    Args:
+        staff_members: Staff members to count.
+        specialist_staff_member_ids: IDs of staff members who were specialists,
+            so that they are counted as kitchen members in candidate positions.
+
+    Returns:
+        list[UnitStaffCountByPosition]: Counts of every unit staff members
+            belong to, in the order units first appear.
+    """
+    specialist_staff_member_ids = set(specialist_staff_member_ids)
+    categories_count = len(PositionCategory)
+
+    unit_uuid_to_code: dict[UUID, int] = {}
+    codes: list[int] = []
+    for staff_member in staff_members:
+        unit_code = unit_uuid_to_code.setdefault(
+            staff_member.unit_uuid, len(unit_uuid_to_code)
+        )
+        position_id = staff_member.position_id
+        if position_id is None:
+            continue
+        category = POSITION_ID_TO_CATEGORY.get(position_id)
+        if category is None:
+            if position_id not in SKIPPED:
+                logger.warning("Unknown staff position: %s", staff_member.position_id)
+            continue
+        if (
+            category == PositionCategory.CANDIDATE
+            and staff_member.id in specialist_staff_member_ids
+        ):
+            category = PositionCategory.KITCHEN_MEMBER
+        codes.append(unit_code * categories_count + category)
+
+    counts = np.bincount(
+        np.array(codes, dtype=np.intp),
+        minlength=len(unit_uuid_to_code) * categories_count,
+    ).reshape(-1, categories_count)
+
+    return [
+        UnitStaffCountByPosition(
+            unit_uuid=unit_uuid,
+            managers_count=unit_counts[PositionCategory.MANAGER],
+            kitchen_members_count=unit_counts[PositionCategory.KITCHEN_MEMBER],
+            couriers_count=unit_counts[PositionCategory.COURIER],
+            candidates_count=unit_counts[PositionCategory.CANDIDATE],
+            interns_count=unit_counts[PositionCategory.INTERN],
+        )
+        for unit_uuid, unit_counts in zip(unit_uuid_to_code, counts.tolist())
+    ]
+
+
+def get_staff_member_ids_in_positions(
+    position_ids: Iterable[UUID],
+    *staff_members_collections: Iterable[StaffMember],
+) -> set[UUID]:
+    """
+    Get the IDs of staff members whose current position is one of the given.
+
+    Args:
+        position_ids: IDs of the positions.
+        *staff_members_collections: Iterables of staff members.
+
+    Returns:
+        A set of UUIDs of staff members in the positions.
+    """
+    position_ids = frozenset(position_ids)
+    return {
+        staff_member.id
+        for staff_members in staff_members_collections
+        for staff_member in staff_members
+        if staff_member.position_id in position_ids
+    }
+
+
+def get_candidate_staff_member_ids(
+    *staff_members_collections: Iterable[StaffMember],
+) -> set[UUID]:
+    """
+    Get the IDs of staff members whose current position is a candidate one.
+
+    Only these staff members are counted differently depending on whether
+    they have ever been specialists, so only their positions history matters.
+
+    Args:
+        *staff_members_collections: Iterables of staff members.
+
+    Returns:
+        A set of UUIDs of staff members in candidate positions.
+    """
+    return get_staff_member_ids_in_positions(CANDIDATES, *staff_members_collections)
+
+
 class HasStaffIdAndPositionId(Protocol):
     staff_id: UUID
     position_id: UUID
@@ -118,7 +250,7 @@ def get_specialist_staff_member_ids(
     Get the IDs of staff members who were specialists.
 
     Args:
-        An iterable of staff position history records.
+        staff_positions_history: An iterable of staff position history records.
 
     Returns:
         A set of UUIDs of staff members who were specialists.
@@ -139,6 +271,81 @@ class StaffCountByPosition:
     interns_count: int = 0
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NewStaffCount:
+    new_specialists_count: int = 0
+    new_candidates_count: int = 0
+
+
+class StaffPositionInUnit(HasStaffIdAndPositionId, Protocol):
+    unit_uuid: UUID
+    take_position_on: datetime.date
+
+
+PeriodKeyT = TypeVar("PeriodKeyT", bound=Hashable)
+
+
+def count_new_staff_by_period(
+    staff_positions_history: Iterable[StaffPositionInUnit],
+    periods: Mapping[PeriodKeyT, tuple[datetime.date, datetime.date]],
+) -> dict[PeriodKeyT, dict[UUID, NewStaffCount]]:
+    """
+    Counts staff members who took specialist or candidate positions
+    during every period, by unit the position was taken in.
+
+    Every day of the periods is mapped to its period first, so the history
+    is walked once however many periods there are. A staff member taking
+    several such positions in a period is counted once per kind.
+
+    Args:
+        staff_positions_history: Positions history records.
+        periods: First and last days of every period by its key.
+            Periods must not overlap.
+
+    Returns:
+        dict: Counts by unit UUID by period key. Units without new
+            staff members in a period are missing from it.
+    """
+    day_to_period_key: dict[datetime.date, PeriodKeyT] = {}
+    for period_key, (from_date, to_date) in periods.items():
+        for days in range((to_date - from_date).days + 1):
+            day_to_period_key[from_date + datetime.timedelta(days=days)] = period_key
+
+    new_specialist_ids: defaultdict[tuple[PeriodKeyT, UUID], set[UUID]] = defaultdict(
+        set
+    )
+    new_candidate_ids: defaultdict[tuple[PeriodKeyT, UUID], set[UUID]] = defaultdict(
+        set
+    )
+    for staff_position in staff_positions_history:
+        period_key = day_to_period_key.get(staff_position.take_position_on)
+        if period_key is None:
+            continue
+        if staff_position.position_id in SPECIALIST:
+            new_staff_ids = new_specialist_ids
+        elif staff_position.position_id in CANDIDATES:
+            new_staff_ids = new_candidate_ids
+        else:
+            continue
+        new_staff_ids[(period_key, staff_position.unit_uuid)].add(
+            staff_position.staff_id
+        )
+
+    period_key_to_new_staff_count: dict[PeriodKeyT, dict[UUID, NewStaffCount]] = {
+        period_key: {} for period_key in periods
+    }
+    for period_key, unit_uuid in new_specialist_ids.keys() | new_candidate_ids.keys():
+        period_key_to_new_staff_count[period_key][unit_uuid] = NewStaffCount(
+            new_specialists_count=len(
+                new_specialist_ids.get((period_key, unit_uuid), ())
+            ),
+            new_candidates_count=len(
+                new_candidate_ids.get((period_key, unit_uuid), ())
+            ),
+        )
+    return period_key_to_new_staff_count
+
+
 def get_staff_members_count_by_position(
     unit_staff_members_count_by_position: UnitStaffCountByPosition | None,
 ) -> StaffCountByPosition:
@@ -161,7 +368,10 @@ def merge_unit_active_and_dismissed_staff_members_count(
     week: int,
     unit_active_staff_members: UnitStaffCountByPosition | None,
     unit_dismissed_staff_members: UnitStaffCountByPosition | None,
+    unit_new_staff_count: NewStaffCount | None = None,
 ) -> UnitWeeklyStaffData:
+    if unit_new_staff_count is None:
+        unit_new_staff_count = NewStaffCount()
     active_staff_count_by_position = get_staff_members_count_by_position(
         unit_active_staff_members
     )
@@ -183,32 +393,33 @@ def merge_unit_active_and_dismissed_staff_members_count(
         dismissed_couriers_count=dismissed_staff_count_by_position.couriers_count,
         dismissed_candidates_count=dismissed_staff_count_by_position.candidates_count,
         dismissed_interns_count=dismissed_staff_count_by_position.interns_count,
-        new_candidates_count=0,
-        new_specialists_count=0,
+        new_candidates_count=unit_new_staff_count.new_candidates_count,
+        new_specialists_count=unit_new_staff_count.new_specialists_count,
     )
 
 
-def merge_active_and_dismissed_staff_members_count(
+def count_units_weekly_staff_data(
     *,
     active_staff_members: Iterable[StaffMember],
     dismissed_staff_members: Iterable[StaffMember],
-    staff_positions_history: Iterable[HasStaffIdAndPositionId],
+    specialist_staff_member_ids: Iterable[UUID],
     units: Iterable[Unit],
     year: int,
     month: int,
     week: int,
-):
-    specialist_staff_member_ids = get_specialist_staff_member_ids(
-        staff_positions_history=staff_positions_history,
-    )
-
-    active_staff_members_count_by_position = compute_staff_count_by_position(
+    unit_uuid_to_new_staff_count: Mapping[UUID, NewStaffCount] | None = None,
+) -> list[UnitWeeklyStaffData]:
+    if unit_uuid_to_new_staff_count is None:
+        unit_uuid_to_new_staff_count = {}
+    active_staff_members_count_by_position = compute_staff_count_by_position_columnar(
         staff_members=active_staff_members,
         specialist_staff_member_ids=specialist_staff_member_ids,
     )
-    dismissed_staff_members_count_by_position = compute_staff_count_by_position(
-        staff_members=dismissed_staff_members,
-        specialist_staff_member_ids=specialist_staff_member_ids,
+    dismissed_staff_members_count_by_position = (
+        compute_staff_count_by_position_columnar(
+            staff_members=dismissed_staff_members,
+            specialist_staff_member_ids=specialist_staff_member_ids,
+        )
     )
     unit_uuid_to_active_staff_memebrs = map_unit_uuid_to_item(
         active_staff_members_count_by_position
@@ -234,15 +445,58 @@ def merge_active_and_dismissed_staff_members_count(
                 week=week,
                 unit_active_staff_members=unit_active_staff_members_count_by_position,
                 unit_dismissed_staff_members=unit_dismissed_staff_members_count_by_position,
+                unit_new_staff_count=unit_uuid_to_new_staff_count.get(unit.uuid),
             )
         )
 
     return units_weekly_staff_data
 
 
+def merge_active_and_dismissed_staff_members_count(
+    *,
+    active_staff_members: Iterable[StaffMember],
+    dismissed_staff_members: Iterable[StaffMember],
+    staff_positions_history: Iterable[StaffPositionInUnit],
+    units: Iterable[Unit],
+    year: int,
+    month: int,
+    week: int,
+    period: Period | None = None,
+):
+    staff_positions_history = list(staff_positions_history)
+    specialist_staff_member_ids = get_specialist_staff_member_ids(
+        staff_positions_history=staff_positions_history,
+    )
+    # New staff members are counted only when the period is given.
+    new_staff_count_by_week: dict[int, dict[UUID, NewStaffCount]] = {week: {}}
+    if period is not None:
+        week_period = (period.from_date.date(), period.to_date.date())
+        new_staff_count_by_week = count_new_staff_by_period(
+            staff_positions_history, {week: week_period}
+        )
+    return count_units_weekly_staff_data(
+        active_staff_members=active_staff_members,
+        dismissed_staff_members=dismissed_staff_members,
+        specialist_staff_member_ids=specialist_staff_member_ids,
+        units=units,
+        year=year,
+        month=month,
+        week=week,
+        unit_uuid_to_new_staff_count=new_staff_count_by_week[week],
+    )
+
+
 class HasTakePositionOnAndLeavePositionOn(Protocol):
-    take_position_on: str
-    leave_position_on: str | None
+    take_position_on: datetime.date
+    leave_position_on: datetime.date | None
+
+
+class StaffPosition(
+    HasStaffIdAndPositionId,
+    HasTakePositionOnAndLeavePositionOn,
+    Protocol,
+):
+    pass
 
 
 HasTakePositionOnAndLeavePositionOnT = TypeVar(
@@ -0,0 +1,168 @@
+import bisect
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from uuid import UUID
+
+from domain.services.staff_members import StaffPosition
+
+
+__all__ = ("PositionIntervals", "StaffPositionsIndex")
+
+
+# Positions not left yet are open until the end of time.
+OPEN_END = datetime.date.max.toordinal()
+
+
+class PositionIntervals:
+    """
+    Static interval tree over the periods a position was held.
+
+    Intervals are sorted by the day they start, and a segment tree keeps
+    the latest end day of every range of them. Intervals overlapping
+    a period are found by descending only into the ranges that start
+    before the period ends and end after it starts, so a query takes
+    O((k + 1) * log n) for k intervals found.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int, UUID]]) -> None:
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+        self.__starts = [start for start, _, _ in intervals]
+        self.__staff_ids = [staff_id for _, _, staff_id in intervals]
+
+        self.__size = 1
+        while self.__size < len(intervals):
+            self.__size *= 2
+        self.__max_ends = [-1] * (2 * self.__size)
+        for i, (_, end, _) in enumerate(intervals):
+            self.__max_ends[self.__size + i] = end
+        for node in range(self.__size - 1, 0, -1):
+            self.__max_ends[node] = max(
+                self.__max_ends[2 * node], self.__max_ends[2 * node + 1]
+            )
+
+    def iter_overlapping(self, start: int, end: int) -> Iterator[UUID]:
+        """
+        Iterates over staff IDs of intervals overlapping the period.
+
+        Args:
+            start: First day of the period as a proleptic Gregorian ordinal.
+            end: Last day of the period as a proleptic Gregorian ordinal.
+
+        Yields:
+            UUID: Staff ID of every overlapping interval.
+        """
+        # Intervals from this index on start after the period ends.
+        starts_after_end = bisect.bisect_right(self.__starts, end)
+        if starts_after_end == 0:
+            return
+
+        nodes = [(1, 0, self.__size)]
+        while nodes:
+            node, node_from, node_to = nodes.pop()
+            if node_from >= starts_after_end or self.__max_ends[node] < start:
+                continue
+            if node >= self.__size:
+                yield self.__staff_ids[node_from]
+                continue
+            middle = (node_from + node_to) // 2
+            nodes.append((2 * node + 1, middle, node_to))
+            nodes.append((2 * node, node_from, middle))
+
+
+class StaffPositionsIndex:
+    """
+    Index over positions history for as-of lookups.
+
+    Positions of every staff member are kept sorted by the day they were
+    taken, so the position held on a date is found with a binary search.
+    Periods every position was held are kept in a `PositionIntervals`
+    tree, so those who held it during a period are found without
+    scanning the whole history.
+    """
+
+    def __init__(self, staff_positions_history: Iterable[StaffPosition]) -> None:
+        staff_id_to_positions: dict[UUID, list[tuple[int, int, UUID]]] = defaultdict(
+            list
+        )
+        position_id_to_intervals: dict[UUID, list[tuple[int, int, UUID]]] = defaultdict(
+            list
+        )
+        for staff_position in staff_positions_history:
+            take = staff_position.take_position_on.toordinal()
+            leave = OPEN_END
+            if staff_position.leave_position_on is not None:
+                leave = staff_position.leave_position_on.toordinal()
+            staff_id_to_positions[staff_position.staff_id].append(
+                (take, leave, staff_position.position_id)
+            )
+            position_id_to_intervals[staff_position.position_id].append(
+                (take, leave, staff_position.staff_id)
+            )
+
+        self.__staff_id_to_takes: dict[UUID, list[int]] = {}
+        self.__staff_id_to_positions: dict[UUID, list[tuple[int, int, UUID]]] = {}
+        for staff_id, positions in staff_id_to_positions.items():
+            positions.sort()
+            self.__staff_id_to_takes[staff_id] = [take for take, _, _ in positions]
+            self.__staff_id_to_positions[staff_id] = positions
+
+        self.__position_id_to_intervals = {
+            position_id: PositionIntervals(intervals)
+            for position_id, intervals in position_id_to_intervals.items()
+        }
+
+    def get_position_id_on(
+        self,
+        staff_id: UUID,
+        date: datetime.date,
+    ) -> UUID | None:
+        """
+        Finds the position the staff member held on the date.
+
+        Args:
+            staff_id: ID of the staff member.
+            date: The date.
+
+        Returns:
+            UUID | None: ID of the position, or None if no position was held.
+        """
+        takes = self.__staff_id_to_takes.get(staff_id)
+        if takes is None:
+            return None
+
+        day = date.toordinal()
+        # The latest position taken on the date or before it.
+        i = bisect.bisect_right(takes, day) - 1
+        if i < 0:
+            return None
+        _, leave, position_id = self.__staff_id_to_positions[staff_id][i]
+        if leave < day:
+            return None
+        return position_id
+
+    def get_staff_ids_holding_position(
+        self,
+        position_id: UUID,
+        from_date: datetime.date,
+        to_date: datetime.date,
+    ) -> set[UUID]:
+        """
+        Finds staff members who held the position at any time of the period.
+
+        Args:
+            position_id: ID of the position.
+            from_date: First day of the period.
+            to_date: Last day of the period.
+
+        Returns:
+            set[UUID]: IDs of the staff members.
+        """
+        position_intervals = self.__position_id_to_intervals.get(position_id)
+        if position_intervals is None:
+            return set()
+        return set(
+            position_intervals.iter_overlapping(
+                from_date.toordinal(), to_date.toordinal()
+            )
+        )
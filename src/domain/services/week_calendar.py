@@ -0,0 +1,186 @@
+import datetime
+import functools
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import pendulum
+
+
+__all__ = (
+    "CalendarWeek",
+    "WeekCalendar",
+    "compute_calendar_week",
+    "get_week_calendar",
+    "get_weeks_count_of_year",
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CalendarWeek:
+    year: int
+    week: int
+    from_date: datetime.date
+    to_date: datetime.date
+    month: int
+
+
+def get_weeks_count_of_year(year: int) -> int:
+    """
+    Returns the number of ISO weeks in the year.
+
+    Args:
+        year (int): The year number.
+
+    Returns:
+        int: 53 for years with a 53rd week, 52 otherwise.
+    """
+    # December 28th always falls into the last week of the year.
+    return datetime.date(year, 12, 28).isocalendar().week
+
+
+def compute_calendar_week(year: int, week: int) -> CalendarWeek:
+    """
+    Computes the days of a specific ISO week of the year.
+
+    Weeks start on Monday, and the first week of the year is the one
+    its first Thursday falls into.
+
+    Args:
+        year (int): The ISO year number.
+        week (int): The ISO week number.
+
+    Returns:
+        CalendarWeek: The first and last days of the week and its month,
+            which is the month of its first day.
+
+    Raises:
+        ValueError: If the week number is not valid for the year.
+    """
+    if not (1 <= week <= get_weeks_count_of_year(year)):
+        raise ValueError(f"Invalid week number: {week} of year {year}")
+
+    from_date = datetime.date.fromisocalendar(year, week, 1)
+    return CalendarWeek(
+        year=year,
+        week=week,
+        from_date=from_date,
+        to_date=from_date + datetime.timedelta(days=6),
+        month=from_date.month,
+    )
+
+
+class WeekCalendar:
+    """
+    Calendar dimension of the ISO weeks of the year in a timezone.
+
+    Weeks and their periods are computed once and then looked up,
+    so no pendulum arithmetic is repeated for the same week. Years
+    may be precomputed up front, and weeks of other years are
+    computed and kept on the first lookup.
+    """
+
+    def __init__(self, timezone: pendulum.Timezone) -> None:
+        self.__timezone = timezone
+        self.__weeks: dict[tuple[int, int], CalendarWeek] = {}
+        self.__bounds: dict[
+            tuple[int, int], tuple[pendulum.DateTime, pendulum.DateTime]
+        ] = {}
+
+    @property
+    def timezone(self) -> pendulum.Timezone:
+        return self.__timezone
+
+    def __iter__(self) -> Iterator[CalendarWeek]:
+        return iter(sorted(self.__weeks.values(), key=lambda w: (w.year, w.week)))
+
+    def __len__(self) -> int:
+        return len(self.__weeks)
+
+    def precompute(self, *, from_year: int, to_year: int) -> None:
+        """
+        Computes every week of the years, both included.
+
+        Args:
+            from_year (int): The first year.
+            to_year (int): The last year.
+        """
+        for year in range(from_year, to_year + 1):
+            for week in range(1, get_weeks_count_of_year(year) + 1):
+                self.get_bounds(year, week)
+
+    def get_week(self, year: int, week: int) -> CalendarWeek:
+        """
+        Returns the days of a specific week of the year.
+
+        Args:
+            year (int): The year number.
+            week (int): The ISO week number.
+
+        Returns:
+            CalendarWeek: The week.
+
+        Raises:
+            ValueError: If the week number is not valid for the year.
+        """
+        calendar_week = self.__weeks.get((year, week))
+        if calendar_week is None:
+            calendar_week = compute_calendar_week(year, week)
+            self.__weeks[(year, week)] = calendar_week
+        return calendar_week
+
+    def get_bounds(
+        self, year: int, week: int
+    ) -> tuple[pendulum.DateTime, pendulum.DateTime]:
+        """
+        Returns the bounds of a specific week of the year in the timezone.
+
+        Args:
+            year (int): The year number.
+            week (int): The ISO week number.
+
+        Returns:
+            tuple[pendulum.DateTime, pendulum.DateTime]: The start of the first
+                day of the week and the end of its last day.
+
+        Raises:
+            ValueError: If the week number is not valid for the year.
+        """
+        bounds = self.__bounds.get((year, week))
+        if bounds is None:
+            calendar_week = self.get_week(year, week)
+            from_date = calendar_week.from_date
+            to_date = calendar_week.to_date
+            bounds = (
+                pendulum.datetime(
+                    from_date.year,
+                    from_date.month,
+                    from_date.day,
+                    tz=self.__timezone,
+                ),
+                pendulum.datetime(
+                    to_date.year,
+                    to_date.month,
+                    to_date.day,
+                    23,
+                    59,
+                    59,
+                    999999,
+                    tz=self.__timezone,
+                ),
+            )
+            self.__bounds[(year, week)] = bounds
+        return bounds
+
+
+@functools.cache
+def get_week_calendar(timezone: pendulum.Timezone) -> WeekCalendar:
+    """
+    Returns the calendar shared by every lookup in the timezone.
+
+    Args:
+        timezone (pendulum.Timezone): The timezone of the calendar.
+
+    Returns:
+        WeekCalendar: The calendar.
+    """
+    return WeekCalendar(timezone)
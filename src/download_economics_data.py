@@ -1,14 +1,18 @@
 import argparse
+import asyncio
 
 from fast_depends import inject
 
+from bootstrap.logger import create_logger
+from bootstrap.run_scope import open_async_run_scope
 from infrastructure.dependencies.config import ConfigDependency
+from infrastructure.dependencies.metrics import DodoIsApiMetricsDependency
 from infrastructure.dependencies.storage import StorageGatewayDependency
 from application.interactors.monthly_sales_fetch import (
     MonthlySalesFetchInteractor,
 )
 from infrastructure.dependencies.dodo_is_api import (
-    DodoIsApiConnectionDependency,
+    AsyncDodoIsApiConnectionDependency,
 )
 from domain.services.period import Period
 from domain.services.units import to_uuids
@@ -24,13 +28,18 @@ from application.interactors.productivity_statistics_fetch import (
 from application.interactors.unit_monthly_goals_fetch import (
     UnitMonthlyGoalsFetchInteractor,
 )
+from infrastructure.exceptions.storage import UnitsDataNotStoredError
+
+
+logger = create_logger("economics_download")
 
 
 @inject
-def main(
+async def main(
     config: ConfigDependency,
-    dodo_is_api_connection: DodoIsApiConnectionDependency,
+    dodo_is_api_connection: AsyncDodoIsApiConnectionDependency,
     storage_gateway: StorageGatewayDependency,
+    metrics: DodoIsApiMetricsDependency,
 ):
     argument_parser = argparse.ArgumentParser()
     argument_parser.add_argument(
@@ -48,6 +57,11 @@ def main(
         type=int,
         required=False,
     )
+    argument_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download and replace economics data that is already stored",
+    )
     args = argument_parser.parse_args()
 
     period = Period.current_month(config.timezone)
@@ -60,7 +74,27 @@ def main(
     if month is None:
         month = period.from_date.month
 
-    unit_uuids = to_uuids(config.units)
+    units = list(config.units)
+    if not args.force:
+        stored_unit_names = storage_gateway.get_stored_economics_data_unit_names(
+            unit_names=[unit.name for unit in units],
+            year=year,
+            month=month,
+        )
+        if stored_unit_names:
+            logger.info(
+                "Economics data of %d-%02d is already stored for %d of %d units",
+                year,
+                month,
+                len(stored_unit_names),
+                len(units),
+            )
+        # Units added to the config later are downloaded on their own.
+        units = [unit for unit in units if unit.name not in stored_unit_names]
+        if not units:
+            return
+
+    unit_uuids = to_uuids(units)
     delivery_statistics_fetch_interactor = DeliveryStatisticsForMonthFetchInteractor(
         dodo_is_api_connection=dodo_is_api_connection,
         month=month,
@@ -95,7 +129,7 @@ def main(
     )
 
     economics_statistics_orchestrator = EconomicsStatisticsOrchestrator(
-        units=config.units,
+        units=units,
         year=year,
         month=month,
         delivery_statistics_fetch_interactor=delivery_statistics_fetch_interactor,
@@ -103,10 +137,21 @@ def main(
         unit_monthly_goals_fetch_intetactors=unit_monthly_goals_fetch_interactors,
         monthly_sales_fetch_interactor=monthly_sales_fetch_interactor,
     )
-    units_monthly_economics_data = economics_statistics_orchestrator.execute()
+    try:
+        units_monthly_economics_data = await economics_statistics_orchestrator.execute()
+    finally:
+        print(metrics.format_summary())
+
+    if not storage_gateway.add_units_economics_data(
+        units_monthly_economics_data, replace=args.force
+    ):
+        raise UnitsDataNotStoredError(f"{year}-{month:02d}")
+
 
-    storage_gateway.add_units_economics_data(units_monthly_economics_data)
+async def run() -> None:
+    async with open_async_run_scope():
+        await main()  # type: ignore[reportCallIssue]
 
 
 if __name__ == "__main__":
-    main()  # type: ignore[reportCallIssue]
+    asyncio.run(run())
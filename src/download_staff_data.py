@@ -1,58 +1,98 @@
 import argparse
+import asyncio
+import itertools
+from collections.abc import Iterable
 
 from fast_depends import inject
 
+from bootstrap.run_scope import open_async_run_scope
+from application.interactors.all_staff_members_fetch import (
+    AllStaffMembersFetchInteractor,
+)
 from application.interactors.staff_positions_history_fetch import (
     StaffPositionsHistoryFetchInteractor,
+    StaffPositionsHistoryFetchMode,
 )
 from bootstrap.config import Config
+from bootstrap.logger import create_logger
 from infrastructure.dependencies.config import ConfigDependency
 from infrastructure.dependencies.dodo_is_api import (
-    DodoIsApiConnectionDependency,
+    AsyncDodoIsApiConnectionDependency,
 )
+from infrastructure.dependencies.metrics import DodoIsApiMetricsDependency
 from infrastructure.dependencies.storage import StorageGatewayDependency
 from domain.services.period import (
-    Period,
-    get_current_week_number_of_year,
+    get_current_year_and_week_number_of_year,
     get_month_number_by_week_number_of_year,
+    get_period_by_week_number_of_year,
+    iter_weeks_of_years,
 )
+from domain.services.week_calendar import get_week_calendar
 from application.interactors.active_staff_members_fetch import (
     ActiveStaffMembersFetchInteractor,
 )
 from application.interactors.dismissed_staff_members_fetch import (
     DismissedStaffMembersFetchInteractor,
 )
+from application.orchestrators.staff_history_reconstruction import (
+    StaffHistoryReconstructionOrchestrator,
+)
 from application.orchestrators.staff_members_statistics import (
     StaffMembersStatisticsOrchestrator,
 )
 from domain.services.units import to_uuids
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dodo_is_api.connection import AsyncDodoIsApiConnection
+from infrastructure.dodo_is_api.response_parsers import StaffMembersParsingProfile
+from infrastructure.exceptions.storage import UnitsDataNotStoredError
 from infrastructure.storage import StorageGateway
 
 
-def process(
+logger = create_logger("staff_backfill")
+
+DEFAULT_BACKFILL_WORKERS = 4
+
+
+async def process(
     config: Config,
-    year: int | None,
-    week: int | None,
-    dodo_is_api_connection: DodoIsApiConnection,
+    year: int,
+    week: int,
+    dodo_is_api_connection: AsyncDodoIsApiConnection,
     storage_gateway: StorageGateway,
+    force: bool = False,
+    count_new_staff: bool = False,
 ) -> None:
-    period = Period.current_month(config.timezone)
-
-    if year is None:
-        year = period.from_date.year
-    if week is None:
-        week = get_current_week_number_of_year(config.timezone)
+    month = get_month_number_by_week_number_of_year(week, year, config.timezone)
 
-    month = get_month_number_by_week_number_of_year(week, year)
+    units = list(config.units)
+    if not force:
+        stored_unit_names = storage_gateway.get_stored_staff_data_unit_names(
+            unit_names=[unit.name for unit in units],
+            year=year,
+            month=month,
+            week=week,
+        )
+        if stored_unit_names:
+            logger.info(
+                "Staff data of %d-W%02d is already stored for %d of %d units",
+                year,
+                week,
+                len(stored_unit_names),
+                len(units),
+            )
+        # Units added to the config later are downloaded on their own.
+        units = [unit for unit in units if unit.name not in stored_unit_names]
+        if not units:
+            return
 
-    unit_uuids = to_uuids(config.units)
+    unit_uuids = to_uuids(units)
     active_staff_members_fetch_interactor = ActiveStaffMembersFetchInteractor(
         dodo_is_api_connection=dodo_is_api_connection,
         unit_uuids=unit_uuids,
         year=year,
         week=week,
         timezone=config.timezone,
+        take=config.dodo_is_api.staff_members_take,
+        parsing_profile=StaffMembersParsingProfile.LEAN,
     )
     dismissed_staff_members_fetch_interactor = DismissedStaffMembersFetchInteractor(
         dodo_is_api_connection=dodo_is_api_connection,
@@ -60,29 +100,232 @@ def process(
         week=week,
         timezone=config.timezone,
         unit_uuids=unit_uuids,
+        take=config.dodo_is_api.staff_members_take,
+        parsing_profile=StaffMembersParsingProfile.LEAN,
     )
     staff_positions_history_fetch_interactor = StaffPositionsHistoryFetchInteractor(
         dodo_is_api_connection=dodo_is_api_connection,
+        unit_uuids=unit_uuids,
+        mode=StaffPositionsHistoryFetchMode(
+            config.dodo_is_api.staff_positions_history_fetch_mode
+        ),
     )
     staff_members_statistics_orchestrator = StaffMembersStatisticsOrchestrator(
-        units=config.units,
+        units=units,
         year=year,
         month=month,
         week=week,
+        timezone=config.timezone,
         active_staff_members_fetch_interactor=active_staff_members_fetch_interactor,
         dismissed_staff_members_fetch_interactor=dismissed_staff_members_fetch_interactor,
         staff_positions_history_fetch_interactor=staff_positions_history_fetch_interactor,
+        count_new_staff=count_new_staff,
+    )
+    units_weekly_staff_data = await staff_members_statistics_orchestrator.execute()
+
+    if not storage_gateway.add_units_staff_data(units_weekly_staff_data, replace=force):
+        raise UnitsDataNotStoredError(f"{year}-W{week:02d}")
+
+
+async def backfill(
+    config: Config,
+    weeks: Iterable[tuple[int, int]],
+    workers: int,
+    dodo_is_api_connection: AsyncDodoIsApiConnection,
+    storage_gateway: StorageGateway,
+    force: bool = False,
+    count_new_staff: bool = False,
+) -> list[tuple[int, int]]:
+    """
+    Downloads staff data of the weeks using a pool of workers.
+
+    Every downloaded week is checkpointed in the storage, so weeks
+    downloaded by an interrupted backfill are skipped when it is rerun.
+    A week that fails does not stop the other ones. Weeks already
+    in the storage are skipped without requesting Dodo IS API.
+
+    Args:
+        config (Config): The application config.
+        weeks (Iterable[tuple[int, int]]): Years and week numbers to download.
+        workers (int): Number of weeks downloaded at the same time.
+        dodo_is_api_connection (AsyncDodoIsApiConnection): Dodo IS API connection.
+        storage_gateway (StorageGateway): The storage to save staff data to.
+        force (bool): Whether checkpoints and stored staff data are ignored,
+            and the stored staff data is replaced.
+        count_new_staff (bool): Whether new staff members are counted,
+            fetching positions history of current specialists too.
+
+    Returns:
+        list[tuple[int, int]]: Years and week numbers that failed.
+    """
+    completed_weeks: set[tuple[int, int]] = set()
+    if not force:
+        completed_weeks = storage_gateway.get_completed_staff_backfill_weeks()
+    weeks = list(weeks)
+    pending_weeks = [week for week in weeks if week not in completed_weeks]
+    logger.info(
+        "Backfilling %d weeks, %d already done",
+        len(pending_weeks),
+        len(weeks) - len(pending_weeks),
+    )
+
+    failed_weeks: list[tuple[int, int]] = []
+    # Workers take weeks from the shared iterator one at a time.
+    weeks_iterator = iter(pending_weeks)
+
+    async def work() -> None:
+        for year, week in weeks_iterator:
+            try:
+                await process(
+                    config,
+                    year,
+                    week,
+                    dodo_is_api_connection,
+                    storage_gateway,
+                    force,
+                    count_new_staff,
+                )
+            except Exception:
+                logger.exception(
+                    "Could not download staff data of %d-W%02d", year, week
+                )
+                failed_weeks.append((year, week))
+                continue
+            storage_gateway.mark_staff_backfill_week_as_completed(year, week)
+            logger.info("Downloaded staff data of %d-W%02d", year, week)
+
+    await asyncio.gather(*(work() for _ in range(workers)))
+    return sorted(failed_weeks)
+
+
+async def reconstruct(
+    config: Config,
+    weeks: Iterable[tuple[int, int]],
+    dodo_is_api_connection: AsyncDodoIsApiConnection,
+    storage_gateway: StorageGateway,
+    force: bool = False,
+) -> None:
+    """
+    Reconstructs staff data of the weeks from a single download.
+
+    Unlike the backfill, staff members are counted as of every week
+    rather than by their current status and position.
+
+    Args:
+        config (Config): The application config.
+        weeks (Iterable[tuple[int, int]]): Years and week numbers to reconstruct.
+        dodo_is_api_connection (AsyncDodoIsApiConnection): Dodo IS API connection.
+        storage_gateway (StorageGateway): The storage to save staff data to.
+        force (bool): Whether stored staff data is reconstructed and replaced.
+    """
+    unit_names = [unit.name for unit in config.units]
+    weeks = [
+        (year, week)
+        for year, week in weeks
+        if force
+        or not storage_gateway.has_units_staff_data(
+            unit_names=unit_names,
+            year=year,
+            month=get_month_number_by_week_number_of_year(week, year, config.timezone),
+            week=week,
+        )
+    ]
+    if not weeks:
+        logger.info("Staff data of all weeks is already stored")
+        return
+
+    last_year, last_week = max(weeks)
+    last_period = get_period_by_week_number_of_year(
+        last_week, last_year, config.timezone
+    )
+    unit_uuids = to_uuids(config.units)
+    staff_history_reconstruction_orchestrator = StaffHistoryReconstructionOrchestrator(
+        units=config.units,
+        weeks=weeks,
+        timezone=config.timezone,
+        all_staff_members_fetch_interactor=AllStaffMembersFetchInteractor(
+            dodo_is_api_connection=dodo_is_api_connection,
+            unit_uuids=unit_uuids,
+            hired_to_date=last_period.to_date,
+            take=config.dodo_is_api.staff_members_take,
+        ),
+        staff_positions_history_fetch_interactor=StaffPositionsHistoryFetchInteractor(
+            dodo_is_api_connection=dodo_is_api_connection,
+            unit_uuids=unit_uuids,
+            mode=StaffPositionsHistoryFetchMode(
+                config.dodo_is_api.staff_positions_history_fetch_mode
+            ),
+        ),
     )
-    units_weekly_staff_data = staff_members_statistics_orchestrator.execute()
+    units_weekly_staff_data = await staff_history_reconstruction_orchestrator.execute()
+
+    for (year, week), week_units_staff_data in itertools.groupby(
+        units_weekly_staff_data,
+        key=lambda unit_staff_data: (unit_staff_data.year, unit_staff_data.week),
+    ):
+        week_units_staff_data = list(week_units_staff_data)
+        if not force:
+            stored_unit_names = storage_gateway.get_stored_staff_data_unit_names(
+                unit_names=unit_names,
+                year=year,
+                month=week_units_staff_data[0].month,
+                week=week,
+            )
+            week_units_staff_data = [
+                unit_staff_data
+                for unit_staff_data in week_units_staff_data
+                if unit_staff_data.unit_name not in stored_unit_names
+            ]
+        if not storage_gateway.add_units_staff_data(
+            week_units_staff_data, replace=force
+        ):
+            raise UnitsDataNotStoredError(f"{year}-W{week:02d}")
+        logger.info("Reconstructed staff data of %d-W%02d", year, week)
+
 
-    storage_gateway.add_units_staff_data(units_weekly_staff_data)
+def parse_year_week(value: str) -> tuple[int, int]:
+    """Parses a week of the year written as YYYY-WW, e.g. 2024-07 or 2024-W07."""
+    year, separator, week = value.partition("-")
+    try:
+        if not separator:
+            raise ValueError
+        return int(year), int(week.removeprefix("W"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid week: {value!r}, expected YYYY-WW"
+        ) from None
+
+
+def add_weeks_range_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--from",
+        dest="from_week",
+        type=parse_year_week,
+        required=True,
+        help="First week, YYYY-WW",
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_week",
+        type=parse_year_week,
+        required=False,
+        help="Last week, YYYY-WW, the current week by default",
+    )
+    # Lets --force follow the subcommand without overriding the one before it.
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Download and replace staff data that is already stored",
+    )
 
 
 @inject
-def main(
+async def main(
     config: ConfigDependency,
-    dodo_is_api_connection: DodoIsApiConnectionDependency,
+    dodo_is_api_connection: AsyncDodoIsApiConnectionDependency,
     storage_gateway: StorageGatewayDependency,
+    metrics: DodoIsApiMetricsDependency,
 ):
     argument_parser = argparse.ArgumentParser()
     argument_parser.add_argument(
@@ -95,18 +338,123 @@ def main(
         type=int,
         required=False,
     )
+    argument_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download and replace staff data that is already stored",
+    )
+    argument_parser.add_argument(
+        "--count-new-staff",
+        action="store_true",
+        help=(
+            "Count new specialists and candidates, fetching positions history"
+            " of current specialists too"
+        ),
+    )
+    subparsers = argument_parser.add_subparsers(dest="command")
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Download staff data of a range of weeks",
+    )
+    add_weeks_range_arguments(backfill_parser)
+    backfill_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BACKFILL_WORKERS,
+        help="Number of weeks downloaded at the same time",
+    )
+    backfill_parser.add_argument(
+        "--count-new-staff",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help=(
+            "Count new specialists and candidates, fetching positions history"
+            " of current specialists too"
+        ),
+    )
+    reconstruct_parser = subparsers.add_parser(
+        "reconstruct",
+        help="Reconstruct staff data of a range of weeks from a single download",
+    )
+    add_weeks_range_arguments(reconstruct_parser)
     args = argument_parser.parse_args()
-    year: int | None = args.year
-    week: int | None = args.week
 
-    for year in range(2020, 2025):
-        for week in range(1, 53):
-            process(config, year, week, dodo_is_api_connection, storage_gateway)
+    week_calendar = get_week_calendar(config.timezone)
+    week_calendar.precompute(
+        from_year=config.calendar.from_year,
+        to_year=config.calendar.to_year,
+    )
+    if config.calendar.store:
+        storage_gateway.add_calendar_weeks(week_calendar)
+
+    current_week = get_current_year_and_week_number_of_year(config.timezone)
+
+    try:
+        if args.command in ("backfill", "reconstruct"):
+            if args.year is not None or args.week is not None:
+                argument_parser.error(
+                    f"--year and --week do not apply to {args.command}"
+                )
+            from_year, from_week = args.from_week
+            to_year, to_week = args.to_week or current_week
+            try:
+                weeks = list(
+                    iter_weeks_of_years(
+                        from_year=from_year,
+                        from_week=from_week,
+                        to_year=to_year,
+                        to_week=to_week,
+                    )
+                )
+            except ValueError as error:
+                argument_parser.error(str(error))
+
+        if args.command == "backfill":
+            if args.workers < 1:
+                argument_parser.error("--workers must be at least 1")
+
+            failed_weeks = await backfill(
+                config,
+                weeks,
+                args.workers,
+                dodo_is_api_connection,
+                storage_gateway,
+                args.force,
+                args.count_new_staff,
+            )
+            if failed_weeks:
+                raise SystemExit(
+                    f"Could not download staff data of {len(failed_weeks)} weeks,"
+                    " rerun the backfill to retry them: "
+                    + ", ".join(f"{year}-W{week:02d}" for year, week in failed_weeks)
+                )
+        elif args.command == "reconstruct":
+            await reconstruct(
+                config, weeks, dodo_is_api_connection, storage_gateway, args.force
+            )
+        else:
+            year, week = current_week
+            if args.year is not None:
+                year = args.year
+            if args.week is not None:
+                week = args.week
+            await process(
+                config,
+                year,
+                week,
+                dodo_is_api_connection,
+                storage_gateway,
+                args.force,
+                args.count_new_staff,
+            )
+    finally:
+        print(metrics.format_summary())
+
 
-    for year in range(2025, 2026):
-        for week in range(1, 6):
-            process(config, year, week, dodo_is_api_connection, storage_gateway)
+async def run() -> None:
+    async with open_async_run_scope():
+        await main()  # type: ignore[reportCallIssue]
 
 
 if __name__ == "__main__":
-    main()  # type: ignore[reportCallIssue]
+    asyncio.run(run())
@@ -0,0 +1,67 @@
+"""
+Serves a fake Dodo IS API for replay and load testing.
+
+Point the pipeline at it by setting `dodo_is_api.base_url` to the printed
+URL. Data is generated from the seed, or replayed from the response cache
+file with `--replay`, in which case the base URL path has to be the same
+as the recorded one, e.g. http://127.0.0.1:8000/dodopizza/ru.
+
+Run from the src directory:
+    python -m fake_dodo_is_api --port 8000 --latency 0.05 --rate-limit-rate 0.05
+"""
+
+import argparse
+import pathlib
+
+from fake_dodo_is_api.api import FakeDodoIsApi, Faults
+from fake_dodo_is_api.dataset import SyntheticDataset
+from fake_dodo_is_api.replay import load_recording
+from fake_dodo_is_api.server import create_fake_dodo_is_api_server
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--host", default="127.0.0.1")
+    argument_parser.add_argument("--port", type=int, default=8000)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--staff-members-per-unit", type=int, default=200)
+    argument_parser.add_argument("--replay", type=pathlib.Path)
+    argument_parser.add_argument("--latency", type=float, default=0)
+    argument_parser.add_argument("--latency-jitter", type=float, default=0)
+    argument_parser.add_argument("--error-rate", type=float, default=0)
+    argument_parser.add_argument("--rate-limit-rate", type=float, default=0)
+    argument_parser.add_argument("--retry-after", type=float, default=1)
+    args = argument_parser.parse_args()
+
+    recording = None
+    if args.replay is not None:
+        recording = load_recording(args.replay)
+
+    api = FakeDodoIsApi(
+        dataset=SyntheticDataset(
+            seed=args.seed,
+            staff_members_per_unit=args.staff_members_per_unit,
+        ),
+        recording=recording,
+        faults=Faults(
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+        ),
+        seed=args.seed,
+    )
+    server = create_fake_dodo_is_api_server(api, host=args.host, port=args.port)
+    host, port = server.server_address[:2]
+    print(f"Serving fake Dodo IS API on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import json
+import random
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from fake_dodo_is_api.dataset import SyntheticDataset
+from fake_dodo_is_api.replay import Recording
+
+
+__all__ = ("FakeResponse", "Faults", "FakeDodoIsApi")
+
+
+DEFAULT_TAKE = 100
+MAX_TAKE = 1000
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FakeResponse:
+    status_code: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def json_response(data: dict, status_code: int = 200) -> FakeResponse:
+    return FakeResponse(status_code=status_code, content=json.dumps(data).encode())
+
+
+def error_response(status_code: int, message: str) -> FakeResponse:
+    return json_response({"message": message}, status_code=status_code)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Faults:
+    """
+    Misbehavior injected into responses.
+
+    Attributes:
+        latency: Delay in seconds before every response.
+        latency_jitter: Random extra delay in seconds, up to this value.
+        error_rate: Share of requests answered with 500.
+        rate_limit_rate: Share of requests answered with 429.
+        retry_after: Retry-After header value of 429 responses in seconds.
+    """
+
+    latency: float = 0
+    latency_jitter: float = 0
+    error_rate: float = 0
+    rate_limit_rate: float = 0
+    retry_after: float | None = 1
+
+
+def parse_uuids(value: str | None) -> list[UUID]:
+    if not value:
+        return []
+    return [UUID(item) for item in value.split(",")]
+
+
+def paginate(
+    items: list[dict], query_params: dict[str, str]
+) -> tuple[list[dict], dict]:
+    take = min(int(query_params.get("take", DEFAULT_TAKE)), MAX_TAKE)
+    skip = int(query_params.get("skip", 0))
+    page = items[skip : skip + take]
+    return page, {
+        "skippedCount": skip,
+        "takenCount": len(page),
+        "totalCount": len(items),
+        "isEndOfListReached": skip + take >= len(items),
+    }
+
+
+def is_date_in_range(
+    date: str | None,
+    from_date: str | None,
+    to_date: str | None,
+) -> bool:
+    if from_date is None and to_date is None:
+        return True
+    if date is None:
+        return False
+    if from_date is not None and date < from_date[:10]:
+        return False
+    if to_date is not None and date > to_date[:10]:
+        return False
+    return True
+
+
+class FakeDodoIsApi:
+    """
+    Answers Dodo IS API requests with synthetic or recorded data.
+
+    Requests are routed by the end of the path, so the server may be given
+    a base URL with any path. When `recording` is given, it is served
+    instead of `dataset` and requests it lacks are answered with 404.
+    Any bearer token is accepted, requests without one get 401.
+    """
+
+    def __init__(
+        self,
+        *,
+        dataset: SyntheticDataset,
+        recording: Recording | None = None,
+        faults: Faults = Faults(),
+        seed: int = 0,
+    ) -> None:
+        self.__dataset = dataset
+        self.__recording = recording
+        self.__faults = faults
+        self.__rng = random.Random(seed)
+        self.__rng_lock = threading.Lock()
+        self.__routes: dict[str, Callable[[dict[str, str]], FakeResponse]] = {
+            "/staff/members": self.__get_staff_members,
+            "/staff/positions/history": self.__get_staff_positions_history,
+            "/delivery/statistics": self.__get_delivery_statistics,
+            "/production/productivity": self.__get_production_productivity,
+            "/finances/sales/units/monthly": self.__get_monthly_units_sales,
+            "/units/month-goals": self.__get_unit_monthly_goals,
+        }
+
+    def __inject_faults(self) -> FakeResponse | None:
+        with self.__rng_lock:
+            jitter = self.__rng.uniform(0, self.__faults.latency_jitter)
+            chance = self.__rng.random()
+
+        time.sleep(self.__faults.latency + jitter)
+
+        if chance < self.__faults.rate_limit_rate:
+            response = error_response(429, "Too many requests")
+            if self.__faults.retry_after is not None:
+                response.headers["Retry-After"] = f"{self.__faults.retry_after:g}"
+            return response
+        if chance < self.__faults.rate_limit_rate + self.__faults.error_rate:
+            return error_response(500, "Injected error")
+        return None
+
+    def handle(
+        self,
+        path_and_query: str,
+        authorization: str | None,
+    ) -> FakeResponse:
+        """
+        Answers the GET request.
+
+        Args:
+            path_and_query: Requested path with the query string.
+            authorization: Value of the Authorization header.
+
+        Returns:
+            FakeResponse: The response to send.
+        """
+        if authorization is None or not authorization.startswith("Bearer "):
+            return error_response(401, "Unauthorized")
+
+        fault_response = self.__inject_faults()
+        if fault_response is not None:
+            return fault_response
+
+        if self.__recording is not None:
+            recorded_response = self.__recording.get(path_and_query)
+            if recorded_response is None:
+                return error_response(404, "Not recorded")
+            return FakeResponse(
+                status_code=recorded_response.status_code,
+                content=recorded_response.content,
+            )
+
+        url = urllib.parse.urlsplit(path_and_query)
+        query_params = dict(urllib.parse.parse_qsl(url.query))
+        path = url.path.rstrip("/")
+        for endpoint, route in self.__routes.items():
+            if path.endswith(endpoint):
+                try:
+                    return route(query_params)
+                except (KeyError, ValueError) as error:
+                    return error_response(400, f"Invalid query params: {error!r}")
+        return error_response(404, "Unknown endpoint")
+
+    def __get_staff_members(self, query_params: dict[str, str]) -> FakeResponse:
+        staff_members = self.__dataset.get_staff_members(
+            parse_uuids(query_params.get("units"))
+        )
+        statuses = query_params.get("statuses")
+        if statuses is not None:
+            statuses = statuses.split(",")
+        staff_types = query_params.get("staffType")
+        if staff_types is not None:
+            staff_types = staff_types.split(",")
+
+        staff_members = [
+            staff_member
+            for staff_member in staff_members
+            if (statuses is None or staff_member["status"] in statuses)
+            and (staff_types is None or staff_member["staffType"] in staff_types)
+            and is_date_in_range(
+                staff_member["dismissedOn"],
+                query_params.get("dismissedFrom"),
+                query_params.get("dismissedTo"),
+            )
+            and is_date_in_range(
+                staff_member["hiredOn"],
+                query_params.get("hiredFrom"),
+                query_params.get("hiredTo"),
+            )
+        ]
+        page, pagination = paginate(staff_members, query_params)
+        return json_response({"members": page, **pagination})
+
+    def __get_staff_positions_history(
+        self,
+        query_params: dict[str, str],
+    ) -> FakeResponse:
+        if "staffMembers" in query_params:
+            history = self.__dataset.get_staff_members_positions_history(
+                parse_uuids(query_params["staffMembers"])
+            )
+        else:
+            history = self.__dataset.get_units_positions_history(
+                parse_uuids(query_params["units"])
+            )
+        page, pagination = paginate(history, query_params)
+        return json_response({"history": page, **pagination})
+
+    def __get_delivery_statistics(self, query_params: dict[str, str]) -> FakeResponse:
+        units_statistics = [
+            self.__dataset.get_unit_delivery_statistics(
+                unit_uuid, query_params["from"], query_params["to"]
+            )
+            for unit_uuid in parse_uuids(query_params["units"])
+        ]
+        return json_response({"unitsStatistics": units_statistics})
+
+    def __get_production_productivity(
+        self,
+        query_params: dict[str, str],
+    ) -> FakeResponse:
+        productivity_statistics = [
+            self.__dataset.get_unit_productivity_statistics(
+                unit_uuid, query_params["from"], query_params["to"]
+            )
+            for unit_uuid in parse_uuids(query_params["units"])
+        ]
+        return json_response({"productivityStatistics": productivity_statistics})
+
+    def __get_monthly_units_sales(self, query_params: dict[str, str]) -> FakeResponse:
+        result = [
+            self.__dataset.get_unit_monthly_sales(
+                unit_uuid, query_params["fromDate"], query_params["toDate"]
+            )
+            for unit_uuid in parse_uuids(query_params["units"])
+        ]
+        return json_response({"result": result})
+
+    def __get_unit_monthly_goals(self, query_params: dict[str, str]) -> FakeResponse:
+        return json_response(
+            self.__dataset.get_unit_monthly_goals(
+                UUID(query_params["unit"]),
+                int(query_params["year"]),
+                int(query_params["month"]),
+            )
+        )
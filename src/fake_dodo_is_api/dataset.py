@@ -0,0 +1,239 @@
+import datetime
+import random
+import threading
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from domain.enums import StaffMemberStatus, StaffMemberType
+from domain.services.staff_members import (
+    CANDIDATES,
+    COURIERS,
+    INTERNS,
+    MANAGERS,
+    SPECIALIST,
+)
+
+
+__all__ = ("SyntheticDataset",)
+
+
+POSITIONS: tuple[tuple[UUID, str, StaffMemberType], ...] = (
+    *(
+        (position_id, "Intern", StaffMemberType.KITCHEN_MEMBER)
+        for position_id in INTERNS
+    ),
+    *((position_id, "Courier", StaffMemberType.COURIER) for position_id in COURIERS),
+    *(
+        (position_id, "Specialist", StaffMemberType.KITCHEN_MEMBER)
+        for position_id in SPECIALIST
+    ),
+    *(
+        (position_id, "Candidate", StaffMemberType.KITCHEN_MEMBER)
+        for position_id in CANDIDATES
+    ),
+    *(
+        (position_id, "Manager", StaffMemberType.PERSONAL_MANAGER)
+        for position_id in MANAGERS
+    ),
+)
+
+FIRST_NAMES = ("Ivan", "Anna", "Petr", "Olga", "Sergey", "Maria", "Oleg", "Elena")
+LAST_NAMES = ("Ivanov", "Petrova", "Sidorov", "Smirnova", "Kuznetsov", "Popova")
+
+
+def generate_uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def format_date(date: datetime.date | None) -> str | None:
+    if date is None:
+        return None
+    return f"{date:%Y-%m-%d}"
+
+
+@dataclass(slots=True, kw_only=True)
+class SyntheticDataset:
+    """
+    Deterministic synthetic data of any unit asked for.
+
+    Staff members of a unit are generated on the first request to the unit
+    from `seed` and the unit UUID, so the same seed always yields the same
+    data regardless of the order of requests. Statistics are derived from
+    the seed and the request params the same way.
+
+    Records are kept in the camelCase shape of the Dodo IS API responses.
+    """
+
+    seed: int
+    staff_members_per_unit: int = 200
+    first_hire_date: datetime.date = datetime.date(2020, 1, 1)
+    last_hire_date: datetime.date = datetime.date(2025, 12, 31)
+    dismissed_share: float = 0.4
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _unit_staff_members: dict[UUID, list[dict]] = field(
+        default_factory=dict, repr=False
+    )
+    _unit_positions_history: dict[UUID, list[dict]] = field(
+        default_factory=dict, repr=False
+    )
+    _staff_member_positions_history: dict[UUID, list[dict]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def __create_rng(self, *parts: object) -> random.Random:
+        key = ":".join(str(part) for part in (self.seed, *parts))
+        return random.Random(zlib.crc32(key.encode()))
+
+    def __generate_unit(self, unit_uuid: UUID) -> None:
+        rng = self.__create_rng("staff", unit_uuid)
+        unit_name = f"Unit {unit_uuid.hex[:6]}"
+        hire_days_count = (self.last_hire_date - self.first_hire_date).days
+
+        staff_members: list[dict] = []
+        positions_history: list[dict] = []
+        for _ in range(self.staff_members_per_unit):
+            staff_member_id = generate_uuid(rng)
+            hired_on = self.first_hire_date + datetime.timedelta(
+                days=rng.randrange(hire_days_count)
+            )
+            dismissed_on = None
+            if rng.random() < self.dismissed_share:
+                dismissed_on = hired_on + datetime.timedelta(days=rng.randint(7, 720))
+
+            # Everyone holds one to three positions one after another.
+            history: list[dict] = []
+            take_position_on = hired_on
+            positions_count = rng.randint(1, 3)
+            for position_number in range(positions_count):
+                position_id, position_name, staff_type = rng.choice(POSITIONS)
+                is_last = position_number == positions_count - 1
+                leave_position_on = dismissed_on
+                if not is_last:
+                    leave_position_on = take_position_on + datetime.timedelta(
+                        days=rng.randint(14, 240)
+                    )
+                    if dismissed_on is not None and leave_position_on >= dismissed_on:
+                        leave_position_on = dismissed_on
+                        is_last = True
+                history.append(
+                    {
+                        "staffId": str(staff_member_id),
+                        "unitId": str(unit_uuid),
+                        "positionId": str(position_id),
+                        "positionName": position_name,
+                        "takePositionOn": format_date(take_position_on),
+                        "leavePositionOn": format_date(leave_position_on),
+                        "isActive": leave_position_on is None,
+                    }
+                )
+                if is_last:
+                    break
+                take_position_on = leave_position_on + datetime.timedelta(days=1)
+
+            last_position = history[-1]
+            status = StaffMemberStatus.ACTIVE
+            if dismissed_on is not None:
+                status = StaffMemberStatus.DISMISSED
+            staff_members.append(
+                {
+                    "id": str(staff_member_id),
+                    "firstName": rng.choice(FIRST_NAMES),
+                    "lastName": rng.choice(LAST_NAMES),
+                    "patronymicName": None,
+                    "unitId": str(unit_uuid),
+                    "unitName": unit_name,
+                    "staffType": staff_type.value,
+                    "positionId": last_position["positionId"],
+                    "positionName": last_position["positionName"],
+                    "status": status.value,
+                    "hiredOn": format_date(hired_on),
+                    "dismissedOn": format_date(dismissed_on),
+                }
+            )
+            positions_history.extend(history)
+            self._staff_member_positions_history[staff_member_id] = history
+
+        self._unit_staff_members[unit_uuid] = staff_members
+        self._unit_positions_history[unit_uuid] = positions_history
+
+    def __ensure_units_generated(self, unit_uuids: Iterable[UUID]) -> None:
+        with self._lock:
+            for unit_uuid in unit_uuids:
+                if unit_uuid not in self._unit_staff_members:
+                    self.__generate_unit(unit_uuid)
+
+    def get_staff_members(self, unit_uuids: Iterable[UUID]) -> list[dict]:
+        unit_uuids = list(unit_uuids)
+        self.__ensure_units_generated(unit_uuids)
+        return [
+            staff_member
+            for unit_uuid in unit_uuids
+            for staff_member in self._unit_staff_members[unit_uuid]
+        ]
+
+    def get_units_positions_history(self, unit_uuids: Iterable[UUID]) -> list[dict]:
+        unit_uuids = list(unit_uuids)
+        self.__ensure_units_generated(unit_uuids)
+        return [
+            staff_position
+            for unit_uuid in unit_uuids
+            for staff_position in self._unit_positions_history[unit_uuid]
+        ]
+
+    def get_staff_members_positions_history(
+        self,
+        staff_member_ids: Iterable[UUID],
+    ) -> list[dict]:
+        """Returns history of staff members of the units generated so far."""
+        return [
+            staff_position
+            for staff_member_id in staff_member_ids
+            for staff_position in self._staff_member_positions_history.get(
+                staff_member_id, ()
+            )
+        ]
+
+    def get_unit_monthly_sales(
+        self,
+        unit_uuid: UUID,
+        from_date: str,
+        to_date: str,
+    ) -> dict:
+        rng = self.__create_rng("sales", unit_uuid, from_date, to_date)
+        return {"unitId": str(unit_uuid), "sales": rng.randint(1_000_000, 9_000_000)}
+
+    def get_unit_monthly_goals(self, unit_uuid: UUID, year: int, month: int) -> dict:
+        rng = self.__create_rng("goals", unit_uuid, year, month)
+        return {
+            "salesPerPerson": round(rng.uniform(2000, 6000), 2),
+            "ordersPerCourier": round(rng.uniform(1.5, 3.5), 2),
+        }
+
+    def get_unit_delivery_statistics(
+        self,
+        unit_uuid: UUID,
+        from_date: str,
+        to_date: str,
+    ) -> dict:
+        rng = self.__create_rng("delivery", unit_uuid, from_date, to_date)
+        return {
+            "unitId": str(unit_uuid),
+            "unitName": f"Unit {unit_uuid.hex[:6]}",
+            "deliveryOrdersCount": rng.randint(1000, 9000),
+            "couriersShiftsDuration": rng.randint(500_000, 5_000_000),
+        }
+
+    def get_unit_productivity_statistics(
+        self,
+        unit_uuid: UUID,
+        from_date: str,
+        to_date: str,
+    ) -> dict:
+        rng = self.__create_rng("productivity", unit_uuid, from_date, to_date)
+        return {
+            "unitId": str(unit_uuid),
+            "unitName": f"Unit {unit_uuid.hex[:6]}",
+            "salesPerLaborHour": round(rng.uniform(2000, 6000), 2),
+        }
@@ -0,0 +1,66 @@
+import contextlib
+import pathlib
+import sqlite3
+import zlib
+from dataclasses import dataclass
+
+import httpx
+
+from infrastructure.dodo_is_api.cache import build_response_cache_key
+
+
+__all__ = ("RecordedResponse", "Recording", "load_recording")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RecordedResponse:
+    status_code: int
+    content: bytes
+
+
+def build_recording_key(url: str) -> str:
+    """Returns path and normalized query of the URL, dropping scheme and host."""
+    key = build_response_cache_key(httpx.Request("GET", url))
+    return httpx.URL(key.removeprefix("GET ")).raw_path.decode("ascii")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Recording:
+    """
+    Responses recorded by the Dodo IS API response cache.
+
+    Requests are matched by path and query params, so the fake server
+    has to be given a base URL with the same path as the recorded one.
+    """
+
+    responses: dict[str, RecordedResponse]
+
+    def get(self, path_and_query: str) -> RecordedResponse | None:
+        key = build_recording_key(f"http://recording{path_and_query}")
+        return self.responses.get(key)
+
+
+def load_recording(file_path: pathlib.Path) -> Recording:
+    """
+    Loads responses from the SQLite file of the response cache.
+
+    Args:
+        file_path: Path to the response cache file, see `HTTP_CACHE_FILE_PATH`.
+
+    Returns:
+        Recording: All responses of the file, including expired ones.
+    """
+    connection = sqlite3.connect(file_path)
+    with contextlib.closing(connection):
+        rows = connection.execute(
+            "SELECT key, status_code, content FROM responses;"
+        ).fetchall()
+
+    responses: dict[str, RecordedResponse] = {}
+    for key, status_code, content in rows:
+        url = key.removeprefix("GET ")
+        responses[build_recording_key(url)] = RecordedResponse(
+            status_code=status_code,
+            content=zlib.decompress(content),
+        )
+    return Recording(responses=responses)
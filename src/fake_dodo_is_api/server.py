@@ -0,0 +1,59 @@
+import http.server
+import threading
+
+from fake_dodo_is_api.api import FakeDodoIsApi
+
+
+__all__ = ("create_fake_dodo_is_api_server", "start_fake_dodo_is_api_server")
+
+
+def create_fake_dodo_is_api_server(
+    api: FakeDodoIsApi,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> http.server.ThreadingHTTPServer:
+    """
+    Creates an HTTP/1.1 server answering every request in its own thread.
+
+    Args:
+        api: The fake API answering requests.
+        host: Host to listen on.
+        port: Port to listen on, 0 picks a free one.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The server, not serving yet.
+    """
+
+    class FakeDodoIsApiRequestHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            response = api.handle(self.path, self.headers.get("Authorization"))
+            self.send_response(response.status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response.content)))
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(response.content)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), FakeDodoIsApiRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def start_fake_dodo_is_api_server(
+    api: FakeDodoIsApi,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> http.server.ThreadingHTTPServer:
+    """Creates the server and serves it in a background thread."""
+    server = create_fake_dodo_is_api_server(api, host=host, port=port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
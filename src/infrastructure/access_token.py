@@ -0,0 +1,240 @@
+import asyncio
+import base64
+import binascii
+import json
+import os
+import pathlib
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from dataclasses import dataclass
+
+import httpx
+
+from bootstrap.logger import create_logger
+
+
+__all__ = (
+    "CachedAccessToken",
+    "AccessTokenCache",
+    "AccessTokenProvider",
+    "AccessTokenAuth",
+    "get_jwt_expires_at",
+)
+
+
+logger = create_logger("access_token")
+
+
+# Seconds before the JWT expiry at which the access token is renewed.
+JWT_EXPIRY_LEEWAY = 60
+
+
+def get_jwt_expires_at(access_token: str) -> float | None:
+    """
+    Reads the "exp" claim of the JWT without verifying its signature.
+
+    Args:
+        access_token: The access token.
+
+    Returns:
+        float | None: Expiry timestamp or None if the token is not a JWT
+            or has no expiry.
+    """
+    parts = access_token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+    expires_at = claims.get("exp")
+    if not isinstance(expires_at, int | float):
+        return None
+    return float(expires_at)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachedAccessToken:
+    access_token: str
+    expires_at: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AccessTokenCache:
+    """File keeping the access token between runs, readable by the owner only."""
+
+    file_path: pathlib.Path
+
+    def load(self) -> CachedAccessToken | None:
+        try:
+            data = json.loads(self.file_path.read_text("utf-8"))
+            return CachedAccessToken(
+                access_token=data["access_token"],
+                expires_at=data["expires_at"],
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Access token cache file is corrupted, ignoring it")
+            return None
+
+    def save(self, cached_access_token: CachedAccessToken) -> None:
+        data = {
+            "access_token": cached_access_token.access_token,
+            "expires_at": cached_access_token.expires_at,
+        }
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file_path = self.file_path.with_suffix(".tmp")
+        file_descriptor = os.open(
+            temporary_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        temporary_file_path.replace(self.file_path)
+
+
+class AccessTokenProvider:
+    """
+    Provides the Dodo IS API access token, fetching it only when needed.
+
+    The token is taken from memory, then from `cache`, and only when
+    both are missing or expired it is fetched with `fetch_access_token`.
+    A token expires `ttl` seconds after it was fetched or, when
+    `check_jwt_expiry` is set, a bit before its JWT expiry if that is sooner.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_access_token: Callable[[], str],
+        cache: AccessTokenCache | None,
+        ttl: float,
+        check_jwt_expiry: bool,
+    ) -> None:
+        self.__fetch_access_token = fetch_access_token
+        self.__cache = cache
+        self.__ttl = ttl
+        self.__check_jwt_expiry = check_jwt_expiry
+        self.__cached_access_token: CachedAccessToken | None = None
+        self.__lock = threading.Lock()
+
+    def __compute_expires_at(self, access_token: str, now: float) -> float:
+        expires_at = now + self.__ttl
+        if self.__check_jwt_expiry:
+            jwt_expires_at = get_jwt_expires_at(access_token)
+            if jwt_expires_at is not None:
+                expires_at = min(expires_at, jwt_expires_at - JWT_EXPIRY_LEEWAY)
+        return expires_at
+
+    def __fetch(self, now: float) -> str:
+        logger.info("Fetching access token")
+        access_token = self.__fetch_access_token()
+        self.__cached_access_token = CachedAccessToken(
+            access_token=access_token,
+            expires_at=self.__compute_expires_at(access_token, now),
+        )
+        if self.__cache is not None:
+            self.__cache.save(self.__cached_access_token)
+        return access_token
+
+    def peek_access_token(self) -> str | None:
+        """Returns the access token if it is in memory and not expired."""
+        cached_access_token = self.__cached_access_token
+        if cached_access_token is None or cached_access_token.expires_at <= time.time():
+            return None
+        return cached_access_token.access_token
+
+    def get_access_token(self) -> str:
+        with self.__lock:
+            access_token = self.peek_access_token()
+            if access_token is not None:
+                return access_token
+
+            now = time.time()
+            if self.__cache is not None:
+                cached_access_token = self.__cache.load()
+                if (
+                    cached_access_token is not None
+                    and cached_access_token.expires_at > now
+                ):
+                    self.__cached_access_token = cached_access_token
+                    return cached_access_token.access_token
+
+            return self.__fetch(now)
+
+    def refresh_access_token(self, rejected_access_token: str) -> str:
+        """
+        Fetches a new access token after the API has rejected one.
+
+        Concurrent requests rejected with the same token trigger
+        a single fetch, the rest get the already fetched token.
+
+        Args:
+            rejected_access_token: The token the API has rejected.
+
+        Returns:
+            str: The new access token.
+        """
+        now = time.time()
+        with self.__lock:
+            if (
+                self.__cached_access_token is not None
+                and self.__cached_access_token.access_token != rejected_access_token
+            ):
+                return self.__cached_access_token.access_token
+            return self.__fetch(now)
+
+
+class AccessTokenAuth(httpx.Auth):
+    """
+    Authorizes requests with the access token of `AccessTokenProvider`.
+
+    A request rejected with 401 is sent once more with a newly fetched token.
+    Fetching is blocking, so the async flow runs it in a worker thread
+    unless the token is already in memory.
+    """
+
+    def __init__(self, access_token_provider: AccessTokenProvider) -> None:
+        self.__access_token_provider = access_token_provider
+
+    @staticmethod
+    def __authorize(request: httpx.Request, access_token: str) -> None:
+        request.headers["Authorization"] = f"Bearer {access_token}"
+
+    def sync_auth_flow(
+        self,
+        request: httpx.Request,
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        access_token = self.__access_token_provider.get_access_token()
+        self.__authorize(request, access_token)
+        response = yield request
+
+        if response.status_code == 401:
+            access_token = self.__access_token_provider.refresh_access_token(
+                access_token
+            )
+            self.__authorize(request, access_token)
+            yield request
+
+    async def async_auth_flow(
+        self,
+        request: httpx.Request,
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        access_token = self.__access_token_provider.peek_access_token()
+        if access_token is None:
+            access_token = await asyncio.to_thread(
+                self.__access_token_provider.get_access_token
+            )
+        self.__authorize(request, access_token)
+        response = yield request
+
+        if response.status_code == 401:
+            access_token = await asyncio.to_thread(
+                self.__access_token_provider.refresh_access_token, access_token
+            )
+            self.__authorize(request, access_token)
+            yield request
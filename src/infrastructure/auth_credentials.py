@@ -1,4 +1,7 @@
-from gspread.client import Client
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gspread.client import Client
 
 
 __all__ = ("AuthCredentialsGateway",)
@@ -13,7 +16,7 @@ class AuthCredentialsGateway:
     def __init__(
         self,
         *,
-        service_account: Client,
+        service_account: "Client",
         spreadsheet_id: str,
         credentials_sheet_id: int,
     ) -> None:
@@ -1,9 +1,11 @@
 from collections.abc import Iterable
-
-from gspread.client import Client
+from typing import TYPE_CHECKING
 
 from domain.entities import UnitMonthlyEconomicsData, UnitWeeklyStaffData
 
+if TYPE_CHECKING:
+    from gspread.client import Client
+
 
 __all__ = ("DashboardSpreadsheetGateway",)
 
@@ -12,7 +14,7 @@ class DashboardSpreadsheetGateway:
     def __init__(
         self,
         *,
-        service_account: Client,
+        service_account: "Client",
         spreadsheet_id: str,
         staff_sheet_id: int,
         economics_sheet_id: int,
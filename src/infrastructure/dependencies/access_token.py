@@ -0,0 +1,59 @@
+from typing import Annotated
+
+from fast_depends import Depends
+
+from bootstrap.config import ACCESS_TOKEN_CACHE_FILE_PATH
+from bootstrap.run_scope import run_scoped
+from infrastructure.access_token import AccessTokenCache, AccessTokenProvider
+from infrastructure.dependencies.config import ConfigDependency
+
+
+__all__ = (
+    "get_access_token_provider",
+    "AccessTokenProviderDependency",
+    "get_access_token",
+    "AccessTokenDependency",
+)
+
+
+@run_scoped
+def get_access_token_provider(config: ConfigDependency) -> AccessTokenProvider:
+    access_token_cache_config = config.auth_credentials.access_token_cache
+
+    # gspread is slow to import and the spreadsheet is slow to open,
+    # so both happen only if the cached access token is unusable.
+    # They are run-scoped, so refreshing the token does not authenticate again.
+    def fetch_access_token() -> str:
+        from infrastructure.dependencies.auth_credentials import (
+            get_auth_credentials_gateway,
+        )
+        from infrastructure.dependencies.service_account import get_service_account
+
+        auth_credentials_gateway = get_auth_credentials_gateway(
+            config=config,
+            service_account=get_service_account(),
+        )
+        return auth_credentials_gateway.get_access_token()
+
+    access_token_cache = None
+    if access_token_cache_config.enabled:
+        access_token_cache = AccessTokenCache(file_path=ACCESS_TOKEN_CACHE_FILE_PATH)
+
+    return AccessTokenProvider(
+        fetch_access_token=fetch_access_token,
+        cache=access_token_cache,
+        ttl=access_token_cache_config.ttl,
+        check_jwt_expiry=access_token_cache_config.check_jwt_expiry,
+    )
+
+
+AccessTokenProviderDependency = Annotated[
+    AccessTokenProvider, Depends(get_access_token_provider)
+]
+
+
+def get_access_token(access_token_provider: AccessTokenProviderDependency) -> str:
+    return access_token_provider.get_access_token()
+
+
+AccessTokenDependency = Annotated[str, Depends(get_access_token)]
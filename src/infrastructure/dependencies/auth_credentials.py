@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fast_depends import Depends
+from bootstrap.run_scope import run_scoped
 from infrastructure.auth_credentials import AuthCredentialsGateway
 from infrastructure.dependencies.config import ConfigDependency
 from infrastructure.dependencies.service_account import ServiceAccountDependency
@@ -9,11 +10,10 @@ from infrastructure.dependencies.service_account import ServiceAccountDependency
 __all__ = (
     "get_auth_credentials_gateway",
     "AuthCredentialsGatewayDependency",
-    "get_access_token",
-    "AccessTokenDependency",
 )
 
 
+@run_scoped
 def get_auth_credentials_gateway(
     config: ConfigDependency,
     service_account: ServiceAccountDependency,
@@ -28,12 +28,3 @@ def get_auth_credentials_gateway(
 AuthCredentialsGatewayDependency = Annotated[
     AuthCredentialsGateway, Depends(get_auth_credentials_gateway)
 ]
-
-
-def get_access_token(
-    auth_credentials_gateway: AuthCredentialsGatewayDependency,
-) -> str:
-    return auth_credentials_gateway.get_access_token()
-
-
-AccessTokenDependency = Annotated[str, Depends(get_access_token)]
@@ -3,9 +3,15 @@ from typing import Annotated
 from fast_depends import Depends
 
 from bootstrap.config import Config, load_config_from_file
+from bootstrap.run_scope import run_scoped
 
 
-__all__ = ("ConfigDependency",)
+__all__ = ("get_config", "ConfigDependency")
 
 
-ConfigDependency = Annotated[Config, Depends(load_config_from_file)]
+@run_scoped
+def get_config() -> Config:
+    return load_config_from_file()
+
+
+ConfigDependency = Annotated[Config, Depends(get_config)]
@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fast_depends import Depends
+from bootstrap.run_scope import run_scoped
 from infrastructure.dashboard import DashboardSpreadsheetGateway
 from infrastructure.dependencies.config import ConfigDependency
 from infrastructure.dependencies.service_account import ServiceAccountDependency
@@ -12,6 +13,7 @@ __all__ = (
 )
 
 
+@run_scoped
 def get_dashboard_spreadsheet_gateway(
     service_account: ServiceAccountDependency,
     config: ConfigDependency,
@@ -2,15 +2,28 @@ from typing import Annotated
 
 from fast_depends import Depends
 
+from bootstrap.run_scope import run_scoped
+from infrastructure.dependencies.config import ConfigDependency
 from infrastructure.dependencies.http_clients import (
+    AsyncDodoIsApiHttpClientDependency,
     DodoIsApiHttpClientDependency,
 )
-from infrastructure.dodo_is_api.connection import DodoIsApiConnection
+from infrastructure.dependencies.metrics import DodoIsApiMetricsDependency
+from infrastructure.dodo_is_api.connection import (
+    AsyncDodoIsApiConnection,
+    DodoIsApiConnection,
+)
 
 
-__all__ = ("get_dodo_is_api_connection", "DodoIsApiConnectionDependency")
+__all__ = (
+    "get_dodo_is_api_connection",
+    "DodoIsApiConnectionDependency",
+    "get_async_dodo_is_api_connection",
+    "AsyncDodoIsApiConnectionDependency",
+)
 
 
+@run_scoped
 def get_dodo_is_api_connection(
     http_client: DodoIsApiHttpClientDependency,
 ) -> DodoIsApiConnection:
@@ -20,3 +33,22 @@ def get_dodo_is_api_connection(
 DodoIsApiConnectionDependency = Annotated[
     DodoIsApiConnection, Depends(get_dodo_is_api_connection)
 ]
+
+
+@run_scoped
+def get_async_dodo_is_api_connection(
+    config: ConfigDependency,
+    http_client: AsyncDodoIsApiHttpClientDependency,
+    metrics: DodoIsApiMetricsDependency,
+) -> AsyncDodoIsApiConnection:
+    return AsyncDodoIsApiConnection(
+        http_client=http_client,
+        max_concurrent_requests=config.dodo_is_api.max_concurrent_requests,
+        memoized_responses_count=config.dodo_is_api.memoized_responses_count,
+        metrics=metrics,
+    )
+
+
+AsyncDodoIsApiConnectionDependency = Annotated[
+    AsyncDodoIsApiConnection, Depends(get_async_dodo_is_api_connection)
+]
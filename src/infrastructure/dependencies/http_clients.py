@@ -1,26 +1,44 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
 from fast_depends import Depends
 
-from infrastructure.dependencies.auth_credentials import AccessTokenDependency
+from bootstrap.run_scope import run_scoped
+from infrastructure.access_token import AccessTokenAuth
+from infrastructure.dependencies.access_token import AccessTokenProviderDependency
 from infrastructure.dodo_is_api.http_client import (
+    closing_async_dodo_is_api_http_client,
     closing_dodo_is_api_http_client,
+    AsyncDodoIsApiHttpClient,
     DodoIsApiHttpClient,
 )
 from infrastructure.dependencies.config import ConfigDependency
+from infrastructure.dependencies.http_transports import (
+    AsyncDodoIsApiHttpTransportDependency,
+    HttpLimitsDependency,
+)
 
 
-__all__ = ("get_dodo_is_api_http_client", "DodoIsApiHttpClientDependency")
+__all__ = (
+    "get_dodo_is_api_http_client",
+    "DodoIsApiHttpClientDependency",
+    "get_async_dodo_is_api_http_client",
+    "AsyncDodoIsApiHttpClientDependency",
+)
 
 
+@run_scoped
 def get_dodo_is_api_http_client(
     config: ConfigDependency,
-    access_token: AccessTokenDependency,
+    access_token_provider: AccessTokenProviderDependency,
+    limits: HttpLimitsDependency,
 ) -> Generator[DodoIsApiHttpClient, None, None]:
     with closing_dodo_is_api_http_client(
         base_url=config.dodo_is_api.base_url,
-        access_token=access_token,
+        auth=AccessTokenAuth(access_token_provider),
+        timeout=config.dodo_is_api.timeout,
+        limits=limits,
+        endpoint_timeouts=config.dodo_is_api.endpoint_timeouts,
     ) as http_client:
         yield http_client
 
@@ -29,3 +47,25 @@ DodoIsApiHttpClientDependency = Annotated[
     DodoIsApiHttpClient,
     Depends(get_dodo_is_api_http_client),
 ]
+
+
+@run_scoped
+async def get_async_dodo_is_api_http_client(
+    config: ConfigDependency,
+    access_token_provider: AccessTokenProviderDependency,
+    transport: AsyncDodoIsApiHttpTransportDependency,
+) -> AsyncGenerator[AsyncDodoIsApiHttpClient, None]:
+    async with closing_async_dodo_is_api_http_client(
+        base_url=config.dodo_is_api.base_url,
+        auth=AccessTokenAuth(access_token_provider),
+        timeout=config.dodo_is_api.timeout,
+        endpoint_timeouts=config.dodo_is_api.endpoint_timeouts,
+        transport=transport,
+    ) as http_client:
+        yield http_client
+
+
+AsyncDodoIsApiHttpClientDependency = Annotated[
+    AsyncDodoIsApiHttpClient,
+    Depends(get_async_dodo_is_api_http_client),
+]
@@ -0,0 +1,125 @@
+import contextlib
+import sqlite3
+from collections.abc import Generator
+from typing import Annotated
+
+import httpx
+from fast_depends import Depends
+
+from bootstrap.config import HTTP_CACHE_FILE_PATH
+from bootstrap.run_scope import run_scoped
+from infrastructure.dependencies.config import ConfigDependency
+from infrastructure.dependencies.metrics import DodoIsApiMetricsDependency
+from infrastructure.dodo_is_api.cache import (
+    CachingTransport,
+    ResponseCache,
+    ResponseCacheTtlPolicy,
+)
+from infrastructure.dodo_is_api.rate_limit import RateLimitingTransport
+from infrastructure.dodo_is_api.retry import RetryBudget, RetryingTransport
+
+
+__all__ = (
+    "get_http_limits",
+    "HttpLimitsDependency",
+    "get_response_cache",
+    "ResponseCacheDependency",
+    "get_retry_budget",
+    "RetryBudgetDependency",
+    "get_async_dodo_is_api_http_transport",
+    "AsyncDodoIsApiHttpTransportDependency",
+)
+
+
+@run_scoped
+def get_http_limits(config: ConfigDependency) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.dodo_is_api.max_connections,
+        max_keepalive_connections=config.dodo_is_api.max_keepalive_connections,
+        keepalive_expiry=config.dodo_is_api.keepalive_expiry,
+    )
+
+
+HttpLimitsDependency = Annotated[httpx.Limits, Depends(get_http_limits)]
+
+
+@run_scoped
+def get_response_cache(
+    config: ConfigDependency,
+) -> Generator[ResponseCache | None, None, None]:
+    if not config.dodo_is_api.cache.enabled:
+        yield None
+        return
+
+    # Resolved and used in worker threads, see `ResponseCache`.
+    connection = sqlite3.connect(HTTP_CACHE_FILE_PATH, check_same_thread=False)
+    with contextlib.closing(connection):
+        yield ResponseCache(
+            connection=connection,
+            max_size=config.dodo_is_api.cache.max_size,
+        )
+
+
+ResponseCacheDependency = Annotated[
+    ResponseCache | None,
+    Depends(get_response_cache),
+]
+
+
+@run_scoped
+def get_retry_budget(config: ConfigDependency) -> RetryBudget:
+    return RetryBudget(config.dodo_is_api.retry.budget)
+
+
+RetryBudgetDependency = Annotated[RetryBudget, Depends(get_retry_budget)]
+
+
+@run_scoped
+def get_async_dodo_is_api_http_transport(
+    config: ConfigDependency,
+    limits: HttpLimitsDependency,
+    response_cache: ResponseCacheDependency,
+    retry_budget: RetryBudgetDependency,
+    metrics: DodoIsApiMetricsDependency,
+) -> httpx.AsyncBaseTransport:
+    """
+    Builds the transport chain of the async Dodo IS API HTTP client.
+
+    Requests go through the response cache first, so cache hits are not
+    rate limited. Every attempt of a retried request takes a rate limit
+    token of its own.
+    """
+    rate_limit = config.dodo_is_api.rate_limit
+    retry = config.dodo_is_api.retry
+
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=limits)
+    transport = RateLimitingTransport(
+        transport=transport,
+        requests_per_second=rate_limit.requests_per_second,
+        burst=rate_limit.burst,
+        endpoints_requests_per_second=rate_limit.endpoints,
+    )
+    transport = RetryingTransport(
+        transport=transport,
+        budget=retry_budget,
+        max_attempts=retry.max_attempts,
+        base_delay=retry.base_delay,
+        max_delay=retry.max_delay,
+        metrics=metrics,
+    )
+    if response_cache is not None:
+        transport = CachingTransport(
+            transport=transport,
+            cache=response_cache,
+            ttl_policy=ResponseCacheTtlPolicy(
+                timezone=config.timezone,
+                current_period_ttl=config.dodo_is_api.cache.current_period_ttl,
+            ),
+        )
+    return transport
+
+
+AsyncDodoIsApiHttpTransportDependency = Annotated[
+    httpx.AsyncBaseTransport,
+    Depends(get_async_dodo_is_api_http_transport),
+]
@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from fast_depends import Depends
+
+from bootstrap.run_scope import run_scoped
+from infrastructure.dodo_is_api.metrics import DodoIsApiMetrics
+
+
+__all__ = ("get_dodo_is_api_metrics", "DodoIsApiMetricsDependency")
+
+
+@run_scoped
+def get_dodo_is_api_metrics() -> DodoIsApiMetrics:
+    return DodoIsApiMetrics()
+
+
+DodoIsApiMetricsDependency = Annotated[
+    DodoIsApiMetrics,
+    Depends(get_dodo_is_api_metrics),
+]
@@ -5,11 +5,13 @@ from gspread.client import Client
 from fast_depends import Depends
 
 from bootstrap.config import GOOGLE_SHEETS_SERVICE_ACCOUNT_CREDENTIALS_FILE_PATH
+from bootstrap.run_scope import run_scoped
 
 
 __all__ = ("get_service_account", "ServiceAccountDependency")
 
 
+@run_scoped
 def get_service_account() -> Client:
     return gspread.service_account(  # type: ignore[reportPrivateImportUsage]
         GOOGLE_SHEETS_SERVICE_ACCOUNT_CREDENTIALS_FILE_PATH
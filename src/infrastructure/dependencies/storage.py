@@ -1,18 +1,25 @@
+import contextlib
 import sqlite3
+from collections.abc import Generator
 from typing import Annotated
 
 from fast_depends import Depends
 
 from bootstrap.config import STORAGE_FILE_PATH
+from bootstrap.run_scope import run_scoped
 from infrastructure.storage import StorageGateway
 
 
 __all__ = ("get_storage_gateway", "StorageGatewayDependency")
 
 
-def get_storage_gateway() -> StorageGateway:
-    with sqlite3.connect(STORAGE_FILE_PATH) as connection:
-        return StorageGateway(connection=connection)
+@run_scoped
+def get_storage_gateway() -> Generator[StorageGateway, None, None]:
+    # Sync dependencies of async entry points are resolved in worker threads,
+    # while the connection is used in the event loop thread.
+    connection = sqlite3.connect(STORAGE_FILE_PATH, check_same_thread=False)
+    with contextlib.closing(connection):
+        yield StorageGateway(connection=connection)
 
 
 StorageGatewayDependency = Annotated[StorageGateway, Depends(get_storage_gateway)]
@@ -0,0 +1,470 @@
+import asyncio
+import calendar
+import contextlib
+import datetime
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from _thread import LockType
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+
+import httpx
+import pendulum
+
+from bootstrap.logger import create_logger
+from infrastructure.dodo_is_api.request_builders import normalize_query_params
+
+
+__all__ = (
+    "CachedResponse",
+    "ResponseCache",
+    "ResponseCacheTtlPolicy",
+    "CachingTransport",
+    "build_response_cache_key",
+    "get_period_end_date",
+)
+
+
+logger = create_logger("dodo_is_api_cache")
+
+# Version of the cache file, kept in its user_version pragma.
+# 1: content is the last column, total size is kept in its own table.
+RESPONSE_CACHE_SCHEMA_VERSION = 1
+
+# Share of `max_size` the cache is evicted down to once it is exceeded.
+EVICTION_TARGET_SIZE_RATIO = 0.9
+
+
+# Headers describing the raw body, which no longer apply to the decoded one.
+NOT_CACHED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def build_response_cache_key(request: httpx.Request) -> str:
+    """
+    Builds the cache key of a request from its endpoint and query params.
+
+    Query params are normalized the same way as for in-memory
+    request keys, see `normalize_query_params`, so equal requests
+    share one key.
+
+    Args:
+        request (httpx.Request): The HTTP request object.
+
+    Returns:
+        str: The cache key.
+    """
+    query_params = normalize_query_params(request.url.params.multi_items())
+    query_string = str(httpx.QueryParams(query_params))
+    url = request.url.copy_with(query=None)
+    return f"{request.method} {url}?{query_string}"
+
+
+def parse_date(value: str) -> datetime.date:
+    return datetime.date.fromisoformat(value[:10])
+
+
+def get_period_end_date(request: httpx.Request) -> datetime.date | None:
+    """
+    Returns the last date of the period the request asks data for.
+
+    Args:
+        request (httpx.Request): The HTTP request object.
+
+    Returns:
+        datetime.date | None: The last date of the period or None if the data
+            of the request may still change regardless of its dates,
+            for example current staff members or positions history.
+    """
+    path = request.url.path
+    query_params = request.url.params
+
+    if path.endswith("/finances/sales/units/monthly"):
+        return parse_date(query_params["toDate"])
+    if path.endswith(("/delivery/statistics", "/production/productivity")):
+        return parse_date(query_params["to"])
+    if path.endswith("/units/month-goals"):
+        year = int(query_params["year"])
+        month = int(query_params["month"])
+        _, days_count = calendar.monthrange(year, month)
+        return datetime.date(year, month, days_count)
+    # Dismissals in the past do not change, while active staff members do.
+    if (
+        path.endswith("/staff/members")
+        and query_params.get("statuses") == "Dismissed"
+        and "dismissedTo" in query_params
+    ):
+        return parse_date(query_params["dismissedTo"])
+    return None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResponseCacheTtlPolicy:
+    """
+    Decides how long a response is cached.
+
+    Responses for periods that are fully over never expire,
+    all other ones expire after `current_period_ttl` seconds.
+    """
+
+    timezone: pendulum.Timezone
+    current_period_ttl: int
+
+    def get_expires_at(self, request: httpx.Request, now: float) -> float | None:
+        period_end_date = get_period_end_date(request)
+        today = pendulum.now(self.timezone).date()
+        if period_end_date is not None and period_end_date < today:
+            return None
+        return now + self.current_period_ttl
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachedResponse:
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResponseCache:
+    """
+    SQLite storage of zlib-compressed responses.
+
+    When compressed responses take more than `max_size` bytes,
+    the least recently read ones are evicted.
+
+    Methods block on SQLite and zlib, so async code calls them
+    in worker threads. Calls are serialized by a lock.
+    """
+
+    connection: sqlite3.Connection
+    max_size: int
+    _lock: LockType = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        with self._lock, self.connection:
+            self.__migrate()
+            self.__init_tables()
+
+    def __init_tables(self) -> None:
+        queries = (
+            # Content goes last, so reading the other columns
+            # does not load the overflow pages of the blob.
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER,
+                headers TEXT,
+                size INTEGER,
+                expires_at REAL,
+                accessed_at REAL,
+                content BLOB
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS responses_expires_at
+            ON responses (expires_at)
+            WHERE expires_at IS NOT NULL
+            """,
+            # Total size of the responses, kept up to date by the triggers
+            # below instead of summing sizes on every write.
+            """
+            CREATE TABLE IF NOT EXISTS responses_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total_size INTEGER NOT NULL
+            )
+            """,
+            """
+            INSERT OR IGNORE INTO responses_size (id, total_size)
+            SELECT 0, COALESCE(SUM(size), 0) FROM responses
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS responses_size_insert
+            AFTER INSERT ON responses
+            BEGIN
+                UPDATE responses_size SET total_size = total_size + NEW.size;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS responses_size_update
+            AFTER UPDATE OF size ON responses
+            BEGIN
+                UPDATE responses_size
+                SET total_size = total_size - OLD.size + NEW.size;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS responses_size_delete
+            AFTER DELETE ON responses
+            BEGIN
+                UPDATE responses_size SET total_size = total_size - OLD.size;
+            END
+            """,
+        )
+        for query in queries:
+            self.connection.execute(query)
+
+    def __migrate(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version;").fetchone()
+        if version >= RESPONSE_CACHE_SCHEMA_VERSION:
+            return
+        if version < 1:
+            self.__move_content_column_last()
+        self.connection.execute(
+            f"PRAGMA user_version = {RESPONSE_CACHE_SCHEMA_VERSION};"
+        )
+
+    def __move_content_column_last(self) -> None:
+        """Copies responses of a file created before version 1 to the new table."""
+        table = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'responses';"
+        ).fetchone()
+        if table is None:
+            return
+        self.connection.execute("ALTER TABLE responses RENAME TO legacy_responses;")
+        self.__init_tables()
+        self.connection.execute(
+            """
+            INSERT INTO responses (
+                key,
+                status_code,
+                headers,
+                size,
+                expires_at,
+                accessed_at,
+                content
+            )
+            SELECT key, status_code, headers, size, expires_at, accessed_at, content
+            FROM legacy_responses;
+            """
+        )
+        self.connection.execute("DROP TABLE legacy_responses;")
+
+    def get(self, key: str, now: float) -> CachedResponse | None:
+        query = """
+        SELECT status_code, headers, content, expires_at
+        FROM responses
+        WHERE key = ?;
+        """
+        with self._lock:
+            cursor = self.connection.cursor()
+            with contextlib.closing(cursor):
+                cursor.execute(query, (key,))
+                row = cursor.fetchone()
+
+            if row is None:
+                return None
+
+            status_code, headers, content, expires_at = row
+            with self.connection:
+                if expires_at is not None and expires_at <= now:
+                    self.connection.execute(
+                        "DELETE FROM responses WHERE key = ?;", (key,)
+                    )
+                    return None
+                self.connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?;",
+                    (now, key),
+                )
+
+        return CachedResponse(
+            status_code=status_code,
+            headers=[tuple(header) for header in json.loads(headers)],
+            content=zlib.decompress(content),
+        )
+
+    def set(
+        self,
+        key: str,
+        response: CachedResponse,
+        *,
+        expires_at: float | None,
+        now: float,
+    ) -> None:
+        # Upsert instead of INSERT OR REPLACE, which does not fire
+        # the delete trigger for the replaced row.
+        query = """
+        INSERT INTO responses (
+            key,
+            status_code,
+            headers,
+            size,
+            expires_at,
+            accessed_at,
+            content
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (key) DO UPDATE SET
+            status_code = excluded.status_code,
+            headers = excluded.headers,
+            size = excluded.size,
+            expires_at = excluded.expires_at,
+            accessed_at = excluded.accessed_at,
+            content = excluded.content;
+        """
+        content = zlib.compress(response.content)
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    query,
+                    (
+                        key,
+                        response.status_code,
+                        json.dumps(response.headers),
+                        len(content),
+                        expires_at,
+                        now,
+                        content,
+                    ),
+                )
+            self.__evict(now)
+
+    def evict(self, now: float) -> None:
+        with self._lock:
+            self.__evict(now)
+
+    def __evict(self, now: float) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?;",
+                (now,),
+            )
+            (total_size,) = self.connection.execute(
+                "SELECT total_size FROM responses_size;"
+            ).fetchone()
+            if total_size <= self.max_size:
+                return
+
+            # Delete the least recently read responses until the rest fits
+            # with some room, so the next writes do not evict again.
+            query = """
+            DELETE FROM responses
+            WHERE key IN (
+                SELECT key FROM (
+                    SELECT
+                        key,
+                        SUM(size) OVER (
+                            ORDER BY accessed_at DESC, key
+                        ) AS cumulative_size
+                    FROM responses
+                )
+                WHERE cumulative_size > ?
+            );
+            """
+            self.connection.execute(
+                query, (int(self.max_size * EVICTION_TARGET_SIZE_RATIO),)
+            )
+        logger.debug("Response cache evicted: size before - %d", total_size)
+
+
+def decode_content(headers: httpx.Headers, raw_content: bytes) -> bytes:
+    """Decodes the raw body of a response by its Content-Encoding header."""
+    return httpx.Response(200, headers=headers, content=raw_content).read()
+
+
+class CachingByteStream(httpx.AsyncByteStream):
+    """
+    Response body passed through as it is read, calling `on_complete`
+    with the whole raw body when the stream is closed after being read
+    to the end. Bodies closed early are not passed anywhere.
+    """
+
+    def __init__(
+        self,
+        *,
+        stream: httpx.AsyncByteStream,
+        on_complete: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        self.__stream = stream
+        self.__on_complete = on_complete
+        self.__chunks: list[bytes] = []
+        self.__is_complete = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.__stream:
+            self.__chunks.append(chunk)
+            yield chunk
+        self.__is_complete = True
+
+    async def aclose(self) -> None:
+        await self.__stream.aclose()
+        if not self.__is_complete:
+            return
+        raw_content = b"".join(self.__chunks)
+        self.__chunks.clear()
+        self.__is_complete = False
+        await self.__on_complete(raw_content)
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport serving successful GET responses from `ResponseCache`.
+
+    Requests that miss the cache are sent through the wrapped transport.
+    Their bodies are streamed to the caller as they arrive, and cached
+    once the caller has read them to the end and closed the response.
+    """
+
+    def __init__(
+        self,
+        *,
+        transport: httpx.AsyncBaseTransport,
+        cache: ResponseCache,
+        ttl_policy: ResponseCacheTtlPolicy,
+    ) -> None:
+        self.__transport = transport
+        self.__cache = cache
+        self.__ttl_policy = ttl_policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.__transport.handle_async_request(request)
+
+        key = build_response_cache_key(request)
+        now = time.time()
+
+        cached_response = await asyncio.to_thread(self.__cache.get, key, now)
+        if cached_response is not None:
+            logger.debug("Response cache hit", extra={"key": key})
+            return httpx.Response(
+                status_code=cached_response.status_code,
+                headers=cached_response.headers,
+                content=cached_response.content,
+                request=request,
+            )
+
+        response = await self.__transport.handle_async_request(request)
+        if response.status_code != 200:
+            return response
+
+        async def cache_response(raw_content: bytes) -> None:
+            await asyncio.to_thread(
+                self.__cache.set,
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    headers=[
+                        (name, value)
+                        for name, value in response.headers.items()
+                        if name.lower() not in NOT_CACHED_HEADERS
+                    ],
+                    content=decode_content(response.headers, raw_content),
+                ),
+                expires_at=self.__ttl_policy.get_expires_at(request, now),
+                now=now,
+            )
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=CachingByteStream(
+                stream=response.stream,
+                on_complete=cache_response,
+            ),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.__transport.aclose()
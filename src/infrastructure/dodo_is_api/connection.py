@@ -1,33 +1,60 @@
+import asyncio
+import contextlib
 import datetime
-from dataclasses import dataclass
-from collections.abc import Iterable
+import time
+from dataclasses import dataclass, field
+from collections.abc import AsyncIterator, Iterable
 from uuid import UUID
 
 import httpx
+from cachetools import LRUCache
 
 from domain.enums import StaffMemberStatus, StaffMemberType
-from infrastructure.dodo_is_api.http_client import DodoIsApiHttpClient
+from infrastructure.dodo_is_api.http_client import (
+    AsyncDodoIsApiHttpClient,
+    DodoIsApiHttpClient,
+)
+from infrastructure.dodo_is_api.metrics import DodoIsApiMetrics
+from infrastructure.dodo_is_api.request_builders import (
+    DodoIsApiRequest,
+    build_delivery_statistics_request,
+    build_monthly_units_sales_request,
+    build_production_productivity_request,
+    build_staff_members_request,
+    build_staff_positions_history_request,
+    build_request_key,
+    build_unit_monthly_goals_request,
+    join_uuids_with_comma,
+    join_with_comma,
+)
 from bootstrap.logger import create_logger
 
 
-__all__ = ("DodoIsApiConnection", "join_uuids_with_comma", "join_with_comma")
+__all__ = (
+    "DodoIsApiConnection",
+    "AsyncDodoIsApiConnection",
+    "join_uuids_with_comma",
+    "join_with_comma",
+)
 
 
 logger = create_logger("dodo_is_api_connection")
 
 
-def join_uuids_with_comma(uuids: Iterable[UUID]) -> str:
-    return ",".join(uuid.hex for uuid in uuids)
-
-
-def join_with_comma(items: Iterable[str]) -> str:
-    return ",".join(items)
-
-
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DodoIsApiConnection:
     http_client: DodoIsApiHttpClient
 
+    def __send(self, request: DodoIsApiRequest) -> httpx.Response:
+        logger.debug("Requesting %s", request.name, extra=request.query_params)
+        response = self.http_client.get(request.url, params=request.query_params)
+        logger.debug(
+            "Received %s",
+            request.name,
+            extra=request.query_params | {"status_code": response.status_code},
+        )
+        return response
+
     def get_monthly_units_sales(
         self,
         *,
@@ -35,19 +62,12 @@ class DodoIsApiConnection:
         to_date: datetime.date,
         unit_uuids: Iterable[UUID],
     ) -> httpx.Response:
-        url = "/finances/sales/units/monthly"
-        query_params = {
-            "fromDate": f"{from_date:%Y-%m-%d}",
-            "toDate": f"{to_date:%Y-%m-%d}",
-            "units": join_uuids_with_comma(unit_uuids),
-        }
-        logger.debug("Requesting monthly units sales", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
-        logger.debug(
-            "Received monthly units sales",
-            extra=query_params | {"status_code": response.status_code},
+        request = build_monthly_units_sales_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
         )
-        return response
+        return self.__send(request)
 
     def get_unit_monthly_goals(
         self,
@@ -56,19 +76,12 @@ class DodoIsApiConnection:
         year: int,
         unit_uuid: UUID,
     ) -> httpx.Response:
-        url = "/units/month-goals"
-        query_params = {
-            "year": year,
-            "month": month,
-            "unit": unit_uuid.hex,
-        }
-        logger.debug("Requesting unit monthly goals", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
-        logger.debug(
-            "Received unit monthly goals",
-            extra=query_params | {"status_code": response.status_code},
+        request = build_unit_monthly_goals_request(
+            month=month,
+            year=year,
+            unit_uuid=unit_uuid,
         )
-        return response
+        return self.__send(request)
 
     def get_delivery_statistics(
         self,
@@ -77,19 +90,12 @@ class DodoIsApiConnection:
         to_date: datetime.datetime,
         unit_uuids: Iterable[UUID],
     ) -> httpx.Response:
-        url = "/delivery/statistics"
-        query_params = {
-            "from": f"{from_date:%Y-%m-%d %H:%M:%S}",
-            "to": f"{to_date:%Y-%m-%d %H:%M:%S}",
-            "units": join_uuids_with_comma(unit_uuids),
-        }
-        logger.debug("Requesting delivery statistics", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
-        logger.debug(
-            "Received delivery statistics",
-            extra=query_params | {"status_code": response.status_code},
+        request = build_delivery_statistics_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
         )
-        return response
+        return self.__send(request)
 
     def get_production_productivity(
         self,
@@ -98,19 +104,12 @@ class DodoIsApiConnection:
         to_date: datetime.datetime,
         unit_uuids: Iterable[UUID],
     ) -> httpx.Response:
-        url = "/production/productivity"
-        query_params = {
-            "from": f"{from_date:%Y-%m-%d %H:%M:%S}",
-            "to": f"{to_date:%Y-%m-%d %H:%M:%S}",
-            "units": join_uuids_with_comma(unit_uuids),
-        }
-        logger.debug("Requesting production productivity", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
-        logger.debug(
-            "Received production productivity",
-            extra=query_params | {"status_code": response.status_code},
+        request = build_production_productivity_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
         )
-        return response
+        return self.__send(request)
 
     def get_staff_members(
         self,
@@ -125,34 +124,18 @@ class DodoIsApiConnection:
         hired_from_date: datetime.datetime | None = None,
         hired_to_date: datetime.datetime | None = None,
     ) -> httpx.Response:
-        url = "/staff/members"
-        query_params = {}
-        if unit_uuids is not None:
-            query_params["units"] = join_uuids_with_comma(unit_uuids)
-        if take is not None:
-            query_params["take"] = take
-        if skip is not None:
-            query_params["skip"] = skip
-        if statuses is not None:
-            query_params["statuses"] = join_with_comma(statuses)
-        if staff_types is not None:
-            query_params["staffType"] = join_with_comma(staff_types)
-        if dismissed_from_date is not None:
-            query_params["dismissedFrom"] = f"{dismissed_from_date:%Y-%m-%d}"
-        if dismissed_to_date is not None:
-            query_params["dismissedTo"] = f"{dismissed_to_date:%Y-%m-%d}"
-        if hired_from_date is not None:
-            query_params["hiredFrom"] = f"{hired_from_date:%Y-%m-%d}"
-        if hired_to_date is not None:
-            query_params["hiredTo"] = f"{hired_to_date:%Y-%m-%d}"
-
-        logger.debug("Requesting staff members", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
-        logger.debug(
-            "Received staff members",
-            extra=query_params | {"status_code": response.status_code},
+        request = build_staff_members_request(
+            unit_uuids=unit_uuids,
+            take=take,
+            skip=skip,
+            statuses=statuses,
+            staff_types=staff_types,
+            dismissed_from_date=dismissed_from_date,
+            dismissed_to_date=dismissed_to_date,
+            hired_from_date=hired_from_date,
+            hired_to_date=hired_to_date,
         )
-        return response
+        return self.__send(request)
 
     def get_staff_positions_history(
         self,
@@ -162,31 +145,288 @@ class DodoIsApiConnection:
         take: int | None = None,
         skip: int | None = None,
     ) -> httpx.Response:
-        if staff_member_ids is not None and unit_ids is not None:
-            raise ValueError(
-                "Invalid parameters. Both staff_member_ids and unit_ids specified"
-            )
-        if staff_member_ids is None and unit_ids is None:
-            raise ValueError(
-                "Invalid parameters. Either staff_member_ids or unit_ids must be specified"
+        request = build_staff_positions_history_request(
+            staff_member_ids=staff_member_ids,
+            unit_ids=unit_ids,
+            take=take,
+            skip=skip,
+        )
+        return self.__send(request)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AsyncDodoIsApiConnection:
+    """Asyncio counterpart of `DodoIsApiConnection`.
+
+    Exposes the same methods, but every one of them is a coroutine,
+    so that independent requests can be awaited concurrently.
+    No more than `max_concurrent_requests` requests are in flight
+    at the same time, the rest wait for a free slot.
+
+    Equal requests are coalesced: while one is in flight, the others
+    await its response instead of being sent, and up to
+    `memoized_responses_count` most recently used successful responses
+    are kept in memory for the lifetime of the connection. Memoization
+    is off by default: whole responses such as staff members pages are
+    large, and the on-disk response cache already serves repeated ones.
+
+    When `metrics` is given, every request is recorded to it.
+    """
+
+    http_client: AsyncDodoIsApiHttpClient
+    max_concurrent_requests: int
+    memoized_responses_count: int = 0
+    metrics: DodoIsApiMetrics | None = None
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _in_flight_requests: dict[tuple[str, str], asyncio.Task[httpx.Response]] = field(
+        init=False, repr=False
+    )
+    _memoized_responses: LRUCache[tuple[str, str], httpx.Response] = field(
+        init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_semaphore", asyncio.Semaphore(self.max_concurrent_requests)
+        )
+        object.__setattr__(self, "_in_flight_requests", {})
+        object.__setattr__(
+            self,
+            "_memoized_responses",
+            LRUCache(maxsize=max(1, self.memoized_responses_count)),
+        )
+
+    async def __send(self, request: DodoIsApiRequest) -> httpx.Response:
+        key = build_request_key(request)
+
+        response = self._memoized_responses.get(key)
+        if response is not None:
+            logger.debug("Memoized %s", request.name, extra=request.query_params)
+            if self.metrics is not None:
+                self.metrics.record_coalesced_request(request.url)
+            return response
+
+        task = self._in_flight_requests.get(key)
+        if task is None:
+            task = asyncio.create_task(self.__request(request))
+            task.add_done_callback(
+                lambda done_task: self.__on_request_done(key, done_task)
             )
+            self._in_flight_requests[key] = task
+        else:
+            logger.debug("Coalesced %s", request.name, extra=request.query_params)
+            if self.metrics is not None:
+                self.metrics.record_coalesced_request(request.url)
 
-        url = "staff/positions/history"
-        query_params = {}
+        # The request is shared, so one cancelled caller must not cancel it.
+        return await asyncio.shield(task)
 
-        if staff_member_ids is not None:
-            query_params["staffMembers"] = join_uuids_with_comma(staff_member_ids)
-        if unit_ids is not None:
-            query_params["units"] = join_uuids_with_comma(unit_ids)
-        if take is not None:
-            query_params["take"] = take
-        if skip is not None:
-            query_params["skip"] = skip
+    def __on_request_done(
+        self,
+        key: tuple[str, str],
+        task: asyncio.Task[httpx.Response],
+    ) -> None:
+        del self._in_flight_requests[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        if response.is_success and self.memoized_responses_count > 0:
+            self._memoized_responses[key] = response
 
-        logger.debug("Requesting staff positions history", extra=query_params)
-        response = self.http_client.get(url, params=query_params)
+    async def __request(self, request: DodoIsApiRequest) -> httpx.Response:
+        if self.metrics is not None:
+            self.metrics.record_request(
+                request.url, is_page="skip" in request.query_params
+            )
+        async with self._semaphore:
+            logger.debug("Requesting %s", request.name, extra=request.query_params)
+            started_at = time.perf_counter()
+            response = await self.http_client.get(
+                request.url,
+                params=request.query_params,
+            )
+            latency = time.perf_counter() - started_at
+        if self.metrics is not None:
+            self.metrics.record_response(
+                request.url,
+                status_code=response.status_code,
+                response_bytes=len(response.content),
+                latency=latency,
+            )
         logger.debug(
-            "Received staff positions history",
-            extra=query_params | {"status_code": response.status_code},
+            "Received %s",
+            request.name,
+            extra=request.query_params | {"status_code": response.status_code},
         )
         return response
+
+    @contextlib.asynccontextmanager
+    async def __stream(
+        self, request: DodoIsApiRequest
+    ) -> AsyncIterator[httpx.Response]:
+        if self.metrics is not None:
+            self.metrics.record_request(
+                request.url, is_page="skip" in request.query_params
+            )
+        async with self._semaphore:
+            logger.debug("Streaming %s", request.name, extra=request.query_params)
+            started_at = time.perf_counter()
+            response: httpx.Response | None = None
+            try:
+                async with self.http_client.stream(
+                    "GET",
+                    request.url,
+                    params=request.query_params,
+                ) as response:
+                    yield response
+            finally:
+                # Responses the caller failed to parse are recorded too.
+                if response is not None:
+                    latency = time.perf_counter() - started_at
+                    if self.metrics is not None:
+                        self.metrics.record_response(
+                            request.url,
+                            status_code=response.status_code,
+                            response_bytes=response.num_bytes_downloaded,
+                            latency=latency,
+                        )
+                    logger.debug(
+                        "Streamed %s",
+                        request.name,
+                        extra=request.query_params
+                        | {"status_code": response.status_code},
+                    )
+
+    async def get_monthly_units_sales(
+        self,
+        *,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        unit_uuids: Iterable[UUID],
+    ) -> httpx.Response:
+        request = build_monthly_units_sales_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
+        )
+        return await self.__send(request)
+
+    async def get_unit_monthly_goals(
+        self,
+        *,
+        month: int,
+        year: int,
+        unit_uuid: UUID,
+    ) -> httpx.Response:
+        request = build_unit_monthly_goals_request(
+            month=month,
+            year=year,
+            unit_uuid=unit_uuid,
+        )
+        return await self.__send(request)
+
+    async def get_delivery_statistics(
+        self,
+        *,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        unit_uuids: Iterable[UUID],
+    ) -> httpx.Response:
+        request = build_delivery_statistics_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
+        )
+        return await self.__send(request)
+
+    async def get_production_productivity(
+        self,
+        *,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        unit_uuids: Iterable[UUID],
+    ) -> httpx.Response:
+        request = build_production_productivity_request(
+            from_date=from_date,
+            to_date=to_date,
+            unit_uuids=unit_uuids,
+        )
+        return await self.__send(request)
+
+    async def get_staff_members(
+        self,
+        *,
+        unit_uuids: Iterable[UUID] | None = None,
+        take: int | None = None,
+        skip: int | None = None,
+        statuses: Iterable[StaffMemberStatus] | None = None,
+        staff_types: Iterable[StaffMemberType] | None = None,
+        dismissed_from_date: datetime.datetime | None = None,
+        dismissed_to_date: datetime.datetime | None = None,
+        hired_from_date: datetime.datetime | None = None,
+        hired_to_date: datetime.datetime | None = None,
+    ) -> httpx.Response:
+        request = build_staff_members_request(
+            unit_uuids=unit_uuids,
+            take=take,
+            skip=skip,
+            statuses=statuses,
+            staff_types=staff_types,
+            dismissed_from_date=dismissed_from_date,
+            dismissed_to_date=dismissed_to_date,
+            hired_from_date=hired_from_date,
+            hired_to_date=hired_to_date,
+        )
+        return await self.__send(request)
+
+    @contextlib.asynccontextmanager
+    async def stream_staff_members(
+        self,
+        *,
+        unit_uuids: Iterable[UUID] | None = None,
+        take: int | None = None,
+        skip: int | None = None,
+        statuses: Iterable[StaffMemberStatus] | None = None,
+        staff_types: Iterable[StaffMemberType] | None = None,
+        dismissed_from_date: datetime.datetime | None = None,
+        dismissed_to_date: datetime.datetime | None = None,
+        hired_from_date: datetime.datetime | None = None,
+        hired_to_date: datetime.datetime | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Same as `get_staff_members`, but the response body is not read.
+
+        The body has to be read inside the context, for example with
+        `parse_staff_members_response_stream`. Streamed requests take
+        a concurrency slot until the context exits and are neither
+        coalesced nor memoized.
+        """
+        request = build_staff_members_request(
+            unit_uuids=unit_uuids,
+            take=take,
+            skip=skip,
+            statuses=statuses,
+            staff_types=staff_types,
+            dismissed_from_date=dismissed_from_date,
+            dismissed_to_date=dismissed_to_date,
+            hired_from_date=hired_from_date,
+            hired_to_date=hired_to_date,
+        )
+        async with self.__stream(request) as response:
+            yield response
+
+    async def get_staff_positions_history(
+        self,
+        *,
+        staff_member_ids: Iterable[UUID] | None = None,
+        unit_ids: Iterable[UUID] | None = None,
+        take: int | None = None,
+        skip: int | None = None,
+    ) -> httpx.Response:
+        request = build_staff_positions_history_request(
+            staff_member_ids=staff_member_ids,
+            unit_ids=unit_ids,
+            take=take,
+            skip=skip,
+        )
+        return await self.__send(request)
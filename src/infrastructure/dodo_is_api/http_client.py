@@ -1,27 +1,130 @@
 import contextlib
-from collections.abc import Generator
-from typing import NewType
+from collections.abc import AsyncGenerator, Generator, Mapping
+from typing import NewType, TypeVar
 
 import httpx
 
 
-__all__ = ("DodoIsApiHttpClient", "closing_dodo_is_api_http_client")
+__all__ = (
+    "DodoIsApiHttpClient",
+    "AsyncDodoIsApiHttpClient",
+    "closing_dodo_is_api_http_client",
+    "closing_async_dodo_is_api_http_client",
+    "get_endpoint_setting",
+)
 
 
 DodoIsApiHttpClient = NewType("DodoIsApiHttpClient", httpx.Client)
+AsyncDodoIsApiHttpClient = NewType("AsyncDodoIsApiHttpClient", httpx.AsyncClient)
+
+
+SettingT = TypeVar("SettingT")
+
+
+def get_endpoint_setting(
+    path: str,
+    endpoint_settings: Mapping[str, SettingT],
+) -> SettingT | None:
+    """
+    Returns the setting of the endpoint by the longest matching path suffix.
+
+    The base URL may have a path of its own, so endpoints are matched
+    by the end of the requested path.
+
+    Args:
+        path: Path of the requested URL.
+        endpoint_settings: Settings by endpoint path, e.g. "/staff/members".
+
+    Returns:
+        The setting or None if the endpoint has no setting of its own.
+    """
+    matching_endpoints = [
+        endpoint
+        for endpoint in endpoint_settings
+        if path.endswith("/" + endpoint.strip("/"))
+    ]
+    if not matching_endpoints:
+        return None
+    return endpoint_settings[max(matching_endpoints, key=len)]
+
+
+def apply_endpoint_timeout(
+    request: httpx.Request,
+    endpoint_timeouts: Mapping[str, float],
+) -> None:
+    timeout = get_endpoint_setting(request.url.path, endpoint_timeouts)
+    if timeout is not None:
+        request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
 
 
 @contextlib.contextmanager
 def closing_dodo_is_api_http_client(
     *,
     base_url: str,
-    access_token: str,
-    timeout: int = 120,
+    access_token: str | None = None,
+    auth: httpx.Auth | None = None,
+    timeout: float = 120,
+    limits: httpx.Limits | None = None,
+    endpoint_timeouts: Mapping[str, float] | None = None,
 ) -> Generator[DodoIsApiHttpClient, None, None]:
-    headers = {"Authorization": f"Bearer {access_token}"}
+    headers = {}
+    if access_token is not None:
+        headers["Authorization"] = f"Bearer {access_token}"
+    endpoint_timeouts = endpoint_timeouts or {}
+
+    def on_request(request: httpx.Request) -> None:
+        apply_endpoint_timeout(request, endpoint_timeouts)
+
+    # Without limits of its own, the client keeps the httpx defaults.
+    limits_options = {} if limits is None else {"limits": limits}
+
     with httpx.Client(
         base_url=base_url,
         headers=headers,
+        auth=auth,
         timeout=timeout,
+        event_hooks={"request": [on_request]},
+        **limits_options,
     ) as http_client:
         yield DodoIsApiHttpClient(http_client)
+
+
+@contextlib.asynccontextmanager
+async def closing_async_dodo_is_api_http_client(
+    *,
+    base_url: str,
+    access_token: str | None = None,
+    auth: httpx.Auth | None = None,
+    timeout: float = 120,
+    limits: httpx.Limits | None = None,
+    endpoint_timeouts: Mapping[str, float] | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> AsyncGenerator[AsyncDodoIsApiHttpClient, None]:
+    """
+    Opens the async Dodo IS API HTTP client.
+
+    Requests are authorized either with the fixed `access_token`
+    or by `auth`. `limits` configure the default transport, so when
+    `transport` is given they have to be set on it instead.
+    """
+    headers = {}
+    if access_token is not None:
+        headers["Authorization"] = f"Bearer {access_token}"
+    endpoint_timeouts = endpoint_timeouts or {}
+
+    async def on_request(request: httpx.Request) -> None:
+        apply_endpoint_timeout(request, endpoint_timeouts)
+
+    # Without limits of its own, the client keeps the httpx defaults.
+    limits_options = {} if limits is None else {"limits": limits}
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        auth=auth,
+        timeout=timeout,
+        event_hooks={"request": [on_request]},
+        transport=transport,
+        **limits_options,
+    ) as http_client:
+        yield AsyncDodoIsApiHttpClient(http_client)
@@ -0,0 +1,193 @@
+import codecs
+import enum
+import json
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+
+__all__ = ("JsonStreamError", "JsonObjectArrayStreamParser")
+
+
+ItemT = TypeVar("ItemT")
+
+WHITESPACE = " \t\n\r"
+
+
+class JsonStreamError(Exception):
+    """Raised when the streamed JSON is invalid or has an unexpected shape."""
+
+
+class ParserState(enum.Enum):
+    OBJECT_START = enum.auto()
+    KEY = enum.auto()
+    COLON = enum.auto()
+    VALUE = enum.auto()
+    ARRAY_ITEM = enum.auto()
+    END = enum.auto()
+
+
+class JsonObjectArrayStreamParser(Generic[ItemT]):
+    """
+    Incremental parser of a JSON object with one large array of objects.
+
+    Items of the array under `array_key` are decoded one at a time, as soon
+    as their bytes arrive, and passed to `parse_item`. The other values of
+    the top-level object are expected to be small and are collected as is.
+    Thus the whole document is never held as a tree of Python objects.
+
+    Usage:
+        parser = JsonObjectArrayStreamParser(array_key="members", parse_item=...)
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        fields = parser.close()
+    """
+
+    def __init__(
+        self,
+        *,
+        array_key: str,
+        parse_item: Callable[[Any], ItemT],
+    ) -> None:
+        self.__array_key = array_key
+        self.__parse_item = parse_item
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__state = ParserState.OBJECT_START
+        self.__key: str | None = None
+        self.__is_array_found = False
+        self.__fields: dict[str, Any] = {}
+
+    def __skip_whitespace(self, position: int) -> int:
+        while position < len(self.__buffer) and self.__buffer[position] in WHITESPACE:
+            position += 1
+        return position
+
+    def __decode_value(self, position: int, is_final: bool) -> tuple[Any, int] | None:
+        """Decodes the value at the position, None if its end is yet to come."""
+        try:
+            value, end = self.__json_decoder.raw_decode(self.__buffer, position)
+        except json.JSONDecodeError as error:
+            if is_final:
+                raise JsonStreamError(str(error)) from error
+            return None
+        # A number at the end of the buffer may continue in the next chunk.
+        if end == len(self.__buffer) and not is_final:
+            return None
+        return value, end
+
+    def __parse(self, is_final: bool) -> list[ItemT]:
+        items: list[ItemT] = []
+        position = 0
+        while True:
+            position = self.__skip_whitespace(position)
+            if position == len(self.__buffer) and self.__state is not ParserState.END:
+                break
+            character = self.__buffer[position : position + 1]
+
+            if self.__state is ParserState.OBJECT_START:
+                if character != "{":
+                    raise JsonStreamError("Top-level value is not an object")
+                position += 1
+                self.__state = ParserState.KEY
+
+            elif self.__state is ParserState.KEY:
+                if character == "}":
+                    position += 1
+                    self.__state = ParserState.END
+                    continue
+                if character == ",":
+                    position += 1
+                    continue
+                decoded = self.__decode_value(position, is_final)
+                if decoded is None:
+                    break
+                self.__key, position = decoded
+                if not isinstance(self.__key, str):
+                    raise JsonStreamError("Object key is not a string")
+                self.__state = ParserState.COLON
+
+            elif self.__state is ParserState.COLON:
+                if character != ":":
+                    raise JsonStreamError("Colon expected after object key")
+                position += 1
+                self.__state = ParserState.VALUE
+
+            elif self.__state is ParserState.VALUE:
+                if self.__key == self.__array_key:
+                    if character != "[":
+                        raise JsonStreamError(f'"{self.__array_key}" is not an array')
+                    position += 1
+                    self.__is_array_found = True
+                    self.__state = ParserState.ARRAY_ITEM
+                    continue
+                decoded = self.__decode_value(position, is_final)
+                if decoded is None:
+                    break
+                value, position = decoded
+                self.__fields[self.__key] = value
+                self.__state = ParserState.KEY
+
+            elif self.__state is ParserState.ARRAY_ITEM:
+                if character == "]":
+                    position += 1
+                    self.__state = ParserState.KEY
+                    continue
+                if character == ",":
+                    position += 1
+                    continue
+                decoded = self.__decode_value(position, is_final)
+                if decoded is None:
+                    break
+                item, position = decoded
+                items.append(self.__parse_item(item))
+
+            elif self.__state is ParserState.END:
+                if position != len(self.__buffer):
+                    raise JsonStreamError("Extra data after the top-level object")
+                break
+
+        self.__buffer = self.__buffer[position:]
+        return items
+
+    def feed(self, chunk: bytes) -> list[ItemT]:
+        """
+        Parses the next chunk of the document.
+
+        Args:
+            chunk: Next bytes of the UTF-8 encoded document.
+
+        Returns:
+            list: Array items completed by the chunk.
+
+        Raises:
+            JsonStreamError: If the document is invalid.
+        """
+        try:
+            self.__buffer += self.__text_decoder.decode(chunk)
+        except UnicodeDecodeError as error:
+            raise JsonStreamError(str(error)) from error
+        return self.__parse(is_final=False)
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finishes parsing once the whole document has been fed.
+
+        Returns:
+            dict: Values of the top-level object other than the array.
+
+        Raises:
+            JsonStreamError: If the document is invalid or incomplete,
+                or it has no array under `array_key`.
+        """
+        try:
+            self.__buffer += self.__text_decoder.decode(b"", final=True)
+        except UnicodeDecodeError as error:
+            raise JsonStreamError(str(error)) from error
+        self.__parse(is_final=True)
+        if self.__state is not ParserState.END:
+            raise JsonStreamError("Document ended before the end of the object")
+        if not self.__is_array_found:
+            raise JsonStreamError(f'"{self.__array_key}" is missing')
+        return self.__fields
@@ -0,0 +1,137 @@
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+from infrastructure.dodo_is_api.http_client import get_endpoint_setting
+
+
+__all__ = ("EndpointMetrics", "DodoIsApiMetrics", "compute_percentile")
+
+
+def compute_percentile(sorted_values: list[float], percentile: float) -> float:
+    """
+    Computes the percentile by the nearest-rank method.
+
+    Args:
+        sorted_values: Values sorted in ascending order.
+        percentile: Percentile from 0 to 100.
+
+    Returns:
+        float: The percentile or 0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+@dataclass(slots=True, kw_only=True)
+class EndpointMetrics:
+    """
+    Metrics of requests to one endpoint.
+
+    Attributes:
+        requests_count: Requests sent, not counting retries.
+        pages_count: Requests for a page of a paginated list.
+        coalesced_count: Requests answered by an equal in-flight
+            or memoized request instead of being sent.
+        response_bytes: Size of received response bodies.
+        latencies: Seconds from sending a request to receiving its
+            response, retries included.
+        status_codes: Status codes of received responses.
+        retries: Retried attempts by their status code or error name.
+    """
+
+    requests_count: int = 0
+    pages_count: int = 0
+    coalesced_count: int = 0
+    response_bytes: int = 0
+    latencies: list[float] = field(default_factory=list)
+    status_codes: Counter[int] = field(default_factory=Counter)
+    retries: Counter[str] = field(default_factory=Counter)
+
+
+class DodoIsApiMetrics:
+    """
+    Per endpoint metrics of Dodo IS API requests made during a run.
+
+    Endpoints are identified by their path relative to the base URL,
+    e.g. "/staff/members". Requests recorded by their full path, as seen
+    by transports, are attributed to the endpoint matching its end.
+    """
+
+    def __init__(self) -> None:
+        self.__endpoints: dict[str, EndpointMetrics] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> dict[str, EndpointMetrics]:
+        return dict(self.__endpoints)
+
+    def __get_endpoint_metrics(self, path: str) -> EndpointMetrics:
+        endpoint_metrics = get_endpoint_setting(path, self.__endpoints)
+        if endpoint_metrics is None:
+            endpoint = "/" + path.strip("/")
+            endpoint_metrics = self.__endpoints.setdefault(endpoint, EndpointMetrics())
+        return endpoint_metrics
+
+    def record_request(self, endpoint: str, *, is_page: bool) -> None:
+        with self.__lock:
+            endpoint_metrics = self.__get_endpoint_metrics(endpoint)
+            endpoint_metrics.requests_count += 1
+            if is_page:
+                endpoint_metrics.pages_count += 1
+
+    def record_coalesced_request(self, endpoint: str) -> None:
+        with self.__lock:
+            self.__get_endpoint_metrics(endpoint).coalesced_count += 1
+
+    def record_response(
+        self,
+        endpoint: str,
+        *,
+        status_code: int,
+        response_bytes: int,
+        latency: float,
+    ) -> None:
+        with self.__lock:
+            endpoint_metrics = self.__get_endpoint_metrics(endpoint)
+            endpoint_metrics.status_codes[status_code] += 1
+            endpoint_metrics.response_bytes += response_bytes
+            endpoint_metrics.latencies.append(latency)
+
+    def record_retry(self, path: str, reason: str) -> None:
+        with self.__lock:
+            self.__get_endpoint_metrics(path).retries[reason] += 1
+
+    def format_summary(self) -> str:
+        """Formats metrics of every endpoint as a table."""
+        header = (
+            f"{'endpoint':<32} {'requests':>8} {'pages':>6} {'coalesced':>9} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'KiB':>10} "
+            f"{'retries':>7}  status codes"
+        )
+        lines = [header]
+        with self.__lock:
+            for endpoint, endpoint_metrics in sorted(self.__endpoints.items()):
+                latencies = sorted(endpoint_metrics.latencies)
+                p50, p95, p99 = (
+                    compute_percentile(latencies, percentile) * 1000
+                    for percentile in (50, 95, 99)
+                )
+                status_codes = " ".join(
+                    f"{status_code}x{count}"
+                    for status_code, count in sorted(
+                        endpoint_metrics.status_codes.items()
+                    )
+                )
+                lines.append(
+                    f"{endpoint:<32} {endpoint_metrics.requests_count:>8} "
+                    f"{endpoint_metrics.pages_count:>6} "
+                    f"{endpoint_metrics.coalesced_count:>9} "
+                    f"{p50:>8.0f} {p95:>8.0f} {p99:>8.0f} "
+                    f"{endpoint_metrics.response_bytes / 1024:>10.1f} "
+                    f"{endpoint_metrics.retries.total():>7}  {status_codes}"
+                )
+        return "\n".join(lines)
@@ -13,6 +13,10 @@ __all__ = (
     "UnitMonthlySales",
     "StaffMember",
     "StaffMembersResponse",
+    "LeanStaffMember",
+    "LeanStaffMembersResponse",
+    "HistoricalStaffMember",
+    "HistoricalStaffMembersResponse",
     "StaffPositionsHistory",
     "StaffPositionsHistoryResponse",
 )
@@ -67,6 +71,51 @@ class StaffMembersResponse(BaseModel):
     ]
 
 
+class LeanStaffMember(BaseModel):
+    """Projection of `StaffMember` with only the fields staff counting needs.
+
+    Other fields of the payload, personal data included, are skipped.
+    """
+
+    id: UUID
+    unit_uuid: Annotated[UUID, Field(validation_alias="unitId")]
+    position_id: Annotated[UUID | None, Field(validation_alias="positionId")]
+
+
+class LeanStaffMembersResponse(BaseModel):
+    members: list[LeanStaffMember]
+    skipped_count: Annotated[int, Field(validation_alias="skippedCount")]
+    taken_count: Annotated[int, Field(validation_alias="takenCount")]
+    total_count: Annotated[int, Field(validation_alias="totalCount")]
+    is_end_of_list_reached: Annotated[
+        bool, Field(validation_alias="isEndOfListReached")
+    ]
+
+
+class HistoricalStaffMember(BaseModel):
+    """Projection of `StaffMember` with the fields reconstructing past weeks needs.
+
+    Hire and dismissal dates tell whether the staff member worked on a date.
+    """
+
+    id: UUID
+    unit_uuid: Annotated[UUID, Field(validation_alias="unitId")]
+    position_id: Annotated[UUID | None, Field(validation_alias="positionId")]
+    status: StaffMemberStatus
+    hired_on: Annotated[datetime.date, Field(validation_alias="hiredOn")]
+    dismissed_on: Annotated[datetime.date | None, Field(validation_alias="dismissedOn")]
+
+
+class HistoricalStaffMembersResponse(BaseModel):
+    members: list[HistoricalStaffMember]
+    skipped_count: Annotated[int, Field(validation_alias="skippedCount")]
+    taken_count: Annotated[int, Field(validation_alias="takenCount")]
+    total_count: Annotated[int, Field(validation_alias="totalCount")]
+    is_end_of_list_reached: Annotated[
+        bool, Field(validation_alias="isEndOfListReached")
+    ]
+
+
 class StaffPositionsHistory(BaseModel):
     staff_id: Annotated[UUID, Field(validation_alias="staffId")]
     unit_uuid: Annotated[UUID, Field(validation_alias="unitId")]
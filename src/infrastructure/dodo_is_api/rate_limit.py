@@ -0,0 +1,90 @@
+import asyncio
+import time
+from collections.abc import Mapping
+
+import httpx
+
+from infrastructure.dodo_is_api.http_client import get_endpoint_setting
+
+
+__all__ = ("TokenBucket", "RateLimitingTransport")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity` tokens.
+
+    Every acquisition takes one token and waits until one is available.
+    """
+
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__updated_at = time.monotonic()
+        self.__lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.__lock:
+            while True:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.__capacity,
+                    self.__tokens + (now - self.__updated_at) * self.__rate,
+                )
+                self.__updated_at = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+
+class RateLimitingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport limiting the request rate of every endpoint separately.
+
+    Each endpoint gets its own token bucket. Its rate is taken from
+    `endpoints_requests_per_second` by the longest matching path suffix,
+    falling back to `requests_per_second`.
+    """
+
+    def __init__(
+        self,
+        *,
+        transport: httpx.AsyncBaseTransport,
+        requests_per_second: float,
+        burst: int,
+        endpoints_requests_per_second: Mapping[str, float] | None = None,
+    ) -> None:
+        self.__transport = transport
+        self.__requests_per_second = requests_per_second
+        self.__burst = burst
+        self.__endpoints_requests_per_second = dict(endpoints_requests_per_second or {})
+        self.__buckets: dict[str, TokenBucket] = {}
+
+    def __get_requests_per_second(self, path: str) -> float:
+        requests_per_second = get_endpoint_setting(
+            path, self.__endpoints_requests_per_second
+        )
+        if requests_per_second is None:
+            return self.__requests_per_second
+        return requests_per_second
+
+    def __get_bucket(self, path: str) -> TokenBucket:
+        bucket = self.__buckets.get(path)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=self.__get_requests_per_second(path),
+                capacity=self.__burst,
+            )
+            self.__buckets[path] = bucket
+        return bucket
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.__get_bucket(request.url.path).acquire()
+        return await self.__transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.__transport.aclose()
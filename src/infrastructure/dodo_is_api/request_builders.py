@@ -0,0 +1,261 @@
+import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+from domain.enums import StaffMemberStatus, StaffMemberType
+
+
+__all__ = (
+    "DodoIsApiRequest",
+    "UNORDERED_LIST_QUERY_PARAMS",
+    "normalize_query_params",
+    "build_request_key",
+    "join_uuids_with_comma",
+    "join_with_comma",
+    "build_monthly_units_sales_request",
+    "build_unit_monthly_goals_request",
+    "build_delivery_statistics_request",
+    "build_production_productivity_request",
+    "build_staff_members_request",
+    "build_staff_positions_history_request",
+    "compute_max_staff_member_ids_per_request",
+)
+
+
+# Query params holding comma-separated lists whose order does not matter.
+UNORDERED_LIST_QUERY_PARAMS = ("units", "staffMembers", "statuses", "staffType")
+
+
+def join_uuids_with_comma(uuids: Iterable[UUID]) -> str:
+    return ",".join(uuid.hex for uuid in uuids)
+
+
+def join_with_comma(items: Iterable[str]) -> str:
+    return ",".join(items)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DodoIsApiRequest:
+    """GET request to Dodo IS API shared by sync and async connections.
+
+    Attributes:
+        url: Endpoint path relative to the API base URL.
+        query_params: Query parameters of the request.
+        name: Human-readable name of the requested resource used in logs.
+    """
+
+    url: str
+    query_params: dict
+    name: str
+
+
+def normalize_query_params(
+    query_params: Iterable[tuple[str, object]],
+) -> list[tuple[str, str]]:
+    """
+    Normalizes query params so that equal requests have equal ones.
+
+    Query params are sorted, and so are the items of comma-separated
+    lists whose order does not matter.
+
+    Args:
+        query_params: Names and values of the query params.
+
+    Returns:
+        list[tuple[str, str]]: Sorted names and values of the query params.
+    """
+    normalized_query_params: list[tuple[str, str]] = []
+    for name, value in query_params:
+        value = str(value)
+        if name in UNORDERED_LIST_QUERY_PARAMS:
+            value = join_with_comma(sorted(value.split(",")))
+        normalized_query_params.append((name, value))
+    return sorted(normalized_query_params)
+
+
+def build_request_key(request: DodoIsApiRequest) -> tuple[str, str]:
+    """
+    Builds the key identifying equal requests.
+
+    Args:
+        request: The Dodo IS API request.
+
+    Returns:
+        tuple[str, str]: URL and normalized query string of the request.
+    """
+    query_params = normalize_query_params(request.query_params.items())
+    query_string = "&".join(f"{name}={value}" for name, value in query_params)
+    return request.url, query_string
+
+
+def build_monthly_units_sales_request(
+    *,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    unit_uuids: Iterable[UUID],
+) -> DodoIsApiRequest:
+    return DodoIsApiRequest(
+        url="/finances/sales/units/monthly",
+        query_params={
+            "fromDate": f"{from_date:%Y-%m-%d}",
+            "toDate": f"{to_date:%Y-%m-%d}",
+            "units": join_uuids_with_comma(unit_uuids),
+        },
+        name="monthly units sales",
+    )
+
+
+def build_unit_monthly_goals_request(
+    *,
+    month: int,
+    year: int,
+    unit_uuid: UUID,
+) -> DodoIsApiRequest:
+    return DodoIsApiRequest(
+        url="/units/month-goals",
+        query_params={
+            "year": year,
+            "month": month,
+            "unit": unit_uuid.hex,
+        },
+        name="unit monthly goals",
+    )
+
+
+def build_delivery_statistics_request(
+    *,
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    unit_uuids: Iterable[UUID],
+) -> DodoIsApiRequest:
+    return DodoIsApiRequest(
+        url="/delivery/statistics",
+        query_params={
+            "from": f"{from_date:%Y-%m-%d %H:%M:%S}",
+            "to": f"{to_date:%Y-%m-%d %H:%M:%S}",
+            "units": join_uuids_with_comma(unit_uuids),
+        },
+        name="delivery statistics",
+    )
+
+
+def build_production_productivity_request(
+    *,
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    unit_uuids: Iterable[UUID],
+) -> DodoIsApiRequest:
+    return DodoIsApiRequest(
+        url="/production/productivity",
+        query_params={
+            "from": f"{from_date:%Y-%m-%d %H:%M:%S}",
+            "to": f"{to_date:%Y-%m-%d %H:%M:%S}",
+            "units": join_uuids_with_comma(unit_uuids),
+        },
+        name="production productivity",
+    )
+
+
+def build_staff_members_request(
+    *,
+    unit_uuids: Iterable[UUID] | None = None,
+    take: int | None = None,
+    skip: int | None = None,
+    statuses: Iterable[StaffMemberStatus] | None = None,
+    staff_types: Iterable[StaffMemberType] | None = None,
+    dismissed_from_date: datetime.datetime | None = None,
+    dismissed_to_date: datetime.datetime | None = None,
+    hired_from_date: datetime.datetime | None = None,
+    hired_to_date: datetime.datetime | None = None,
+) -> DodoIsApiRequest:
+    query_params = {}
+    if unit_uuids is not None:
+        query_params["units"] = join_uuids_with_comma(unit_uuids)
+    if take is not None:
+        query_params["take"] = take
+    if skip is not None:
+        query_params["skip"] = skip
+    if statuses is not None:
+        query_params["statuses"] = join_with_comma(statuses)
+    if staff_types is not None:
+        query_params["staffType"] = join_with_comma(staff_types)
+    if dismissed_from_date is not None:
+        query_params["dismissedFrom"] = f"{dismissed_from_date:%Y-%m-%d}"
+    if dismissed_to_date is not None:
+        query_params["dismissedTo"] = f"{dismissed_to_date:%Y-%m-%d}"
+    if hired_from_date is not None:
+        query_params["hiredFrom"] = f"{hired_from_date:%Y-%m-%d}"
+    if hired_to_date is not None:
+        query_params["hiredTo"] = f"{hired_to_date:%Y-%m-%d}"
+
+    return DodoIsApiRequest(
+        url="/staff/members",
+        query_params=query_params,
+        name="staff members",
+    )
+
+
+def build_staff_positions_history_request(
+    *,
+    staff_member_ids: Iterable[UUID] | None = None,
+    unit_ids: Iterable[UUID] | None = None,
+    take: int | None = None,
+    skip: int | None = None,
+) -> DodoIsApiRequest:
+    if staff_member_ids is not None and unit_ids is not None:
+        raise ValueError(
+            "Invalid parameters. Both staff_member_ids and unit_ids specified"
+        )
+    if staff_member_ids is None and unit_ids is None:
+        raise ValueError(
+            "Invalid parameters. Either staff_member_ids or unit_ids must be specified"
+        )
+
+    query_params = {}
+
+    if staff_member_ids is not None:
+        query_params["staffMembers"] = join_uuids_with_comma(staff_member_ids)
+    if unit_ids is not None:
+        query_params["units"] = join_uuids_with_comma(unit_ids)
+    if take is not None:
+        query_params["take"] = take
+    if skip is not None:
+        query_params["skip"] = skip
+
+    return DodoIsApiRequest(
+        url="staff/positions/history",
+        query_params=query_params,
+        name="staff positions history",
+    )
+
+
+def compute_max_staff_member_ids_per_request(max_query_length: int) -> int:
+    """
+    Computes how many staff member IDs fit into a positions history request.
+
+    IDs are sent as comma-separated hex strings, 32 characters each,
+    and the comma is percent-encoded as "%2C". Room is left for the
+    parameter name and for the pagination parameters.
+
+    Args:
+        max_query_length: Maximum length of the encoded query string.
+
+    Returns:
+        int: Number of IDs per request.
+
+    Raises:
+        ValueError: If not even a single ID fits into the query string.
+    """
+    uuid_hex_length = 32
+    encoded_separator_length = len("%2C")
+    reserved_length = len("staffMembers=&take=1000000&skip=1000000")
+
+    available_length = max_query_length - reserved_length
+    if available_length < uuid_hex_length:
+        raise ValueError(
+            f"Query length limit {max_query_length} is too small to fit a staff member ID"
+        )
+    return (available_length + encoded_separator_length) // (
+        uuid_hex_length + encoded_separator_length
+    )
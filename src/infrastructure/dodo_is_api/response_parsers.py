@@ -1,5 +1,7 @@
+import enum
 import json
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypedDict, TypeVar
 
 import httpx
 from pydantic import TypeAdapter, ValidationError
@@ -10,7 +12,16 @@ from infrastructure.exceptions.response_parsers import (
     ResponseJsonInvalidTypeError,
     ResponseDataParseError,
 )
+from infrastructure.dodo_is_api.json_stream import (
+    JsonObjectArrayStreamParser,
+    JsonStreamError,
+)
 from infrastructure.dodo_is_api.models import (
+    HistoricalStaffMember,
+    HistoricalStaffMembersResponse,
+    LeanStaffMember,
+    LeanStaffMembersResponse,
+    StaffMember,
     StaffMembersResponse,
     UnitDeliveryStatistics,
     UnitProductivityStatistics,
@@ -22,12 +33,15 @@ from infrastructure.dodo_is_api.models import (
 
 __all__ = (
     "parse_response_json",
+    "validate_response_json",
     "ensure_response_data_is_dict",
     "ensure_response_data_is_list",
     "parse_delivery_statistics_response",
     "parse_productivity_statistics_response",
     "parse_monthly_sales_response",
+    "StaffMembersParsingProfile",
     "parse_staff_members_response",
+    "parse_staff_members_response_stream",
     "parse_staff_positions_history_response",
 )
 
@@ -56,6 +70,74 @@ def ensure_status_code_success(response: httpx.Response) -> None:
         raise ResponseStatusCodeError(response=response)
 
 
+ParsedT = TypeVar("ParsedT")
+
+# Errors of the whole document being of another JSON type than expected.
+INVALID_TYPE_ERROR_TYPES = frozenset(
+    ("dict_type", "list_type", "model_type", "model_attributes_type")
+)
+
+
+def validate_response_json(
+    response: httpx.Response,
+    validate_json: Callable[[bytes], ParsedT],
+) -> ParsedT:
+    """
+    Validates the response body in a single pass over its bytes.
+
+    Pydantic decodes JSON and validates it at once, so no intermediate
+    tree of Python objects is built. Validation errors are translated
+    to the exceptions raised by the rest of the parsers.
+
+    Args:
+        response (httpx.Response): The HTTP response object.
+        validate_json: Pydantic validator of JSON data,
+            such as `TypeAdapter.validate_json`.
+
+    Returns:
+        The validated data.
+
+    Raises:
+        ResponseJsonParseError: If the response JSON is invalid.
+        ResponseJsonInvalidTypeError: If the response data type is not valid.
+        ResponseDataParseError: If the expected data structure is missing or invalid.
+    """
+    try:
+        return validate_json(response.content)
+    except ValidationError as error:
+        errors = error.errors(include_url=False, include_context=False)
+        if any(error_details["type"] == "json_invalid" for error_details in errors):
+            raise ResponseJsonParseError(response=response) from error
+        if any(
+            error_details["loc"] == ()
+            and error_details["type"] in INVALID_TYPE_ERROR_TYPES
+            for error_details in errors
+        ):
+            raise ResponseJsonInvalidTypeError from error
+        response_data = parse_response_json(response)
+        raise ResponseDataParseError(response_data=response_data) from error
+
+
+class DeliveryStatisticsResponseData(TypedDict):
+    unitsStatistics: list[UnitDeliveryStatistics]
+
+
+class ProductivityStatisticsResponseData(TypedDict):
+    productivityStatistics: list[UnitProductivityStatistics]
+
+
+class MonthlySalesResponseData(TypedDict):
+    result: list[UnitMonthlySales]
+
+
+# Building adapters is costly, so they are built once on import.
+delivery_statistics_response_adapter = TypeAdapter(DeliveryStatisticsResponseData)
+productivity_statistics_response_adapter = TypeAdapter(
+    ProductivityStatisticsResponseData
+)
+monthly_sales_response_adapter = TypeAdapter(MonthlySalesResponseData)
+
+
 def parse_delivery_statistics_response(
     response: httpx.Response,
 ) -> list[UnitDeliveryStatistics]:
@@ -76,21 +158,10 @@ def parse_delivery_statistics_response(
     """
     ensure_status_code_success(response)
 
-    response_data: dict | list = parse_response_json(response)
-
-    response_data = ensure_response_data_is_dict(response_data)
-
-    try:
-        units_delivery_statistics = response_data["unitsStatistics"]
-    except KeyError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
-
-    type_adapter = TypeAdapter(list[UnitDeliveryStatistics])
-
-    try:
-        return type_adapter.validate_python(units_delivery_statistics)
-    except ValidationError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+    response_data = validate_response_json(
+        response, delivery_statistics_response_adapter.validate_json
+    )
+    return response_data["unitsStatistics"]
 
 
 def parse_productivity_statistics_response(
@@ -113,21 +184,10 @@ def parse_productivity_statistics_response(
     """
     ensure_status_code_success(response)
 
-    response_data: dict | list = parse_response_json(response)
-
-    response_data = ensure_response_data_is_dict(response_data)
-
-    try:
-        productivity_statistics = response_data["productivityStatistics"]
-    except KeyError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
-
-    type_adapter = TypeAdapter(list[UnitProductivityStatistics])
-
-    try:
-        return type_adapter.validate_python(productivity_statistics)
-    except ValidationError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+    response_data = validate_response_json(
+        response, productivity_statistics_response_adapter.validate_json
+    )
+    return response_data["productivityStatistics"]
 
 
 def parse_unit_monthly_goals_response(
@@ -150,12 +210,7 @@ def parse_unit_monthly_goals_response(
     """
     ensure_status_code_success(response)
 
-    response_data = parse_response_json(response)
-
-    try:
-        return UnitMonthlyGoals.model_validate(response_data)
-    except ValidationError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+    return validate_response_json(response, UnitMonthlyGoals.model_validate_json)
 
 
 def parse_monthly_sales_response(
@@ -178,31 +233,50 @@ def parse_monthly_sales_response(
     """
     ensure_status_code_success(response)
 
-    response_data: Any = parse_response_json(response)
+    response_data = validate_response_json(
+        response, monthly_sales_response_adapter.validate_json
+    )
+    return response_data["result"]
 
-    response_data = ensure_response_data_is_dict(response_data)
 
-    try:
-        result = response_data["result"]
-    except KeyError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+class StaffMembersParsingProfile(enum.StrEnum):
+    """Which fields of staff members are validated and kept."""
 
-    type_adapter = TypeAdapter(list[UnitMonthlySales])
+    FULL = "full"
+    LEAN = "lean"
+    HISTORICAL = "historical"
 
-    try:
-        return type_adapter.validate_python(result)
-    except ValidationError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+
+STAFF_MEMBERS_PARSING_PROFILE_MODELS: dict[
+    StaffMembersParsingProfile,
+    tuple[
+        type[StaffMember | LeanStaffMember | HistoricalStaffMember],
+        type[
+            StaffMembersResponse
+            | LeanStaffMembersResponse
+            | HistoricalStaffMembersResponse
+        ],
+    ],
+] = {
+    StaffMembersParsingProfile.FULL: (StaffMember, StaffMembersResponse),
+    StaffMembersParsingProfile.LEAN: (LeanStaffMember, LeanStaffMembersResponse),
+    StaffMembersParsingProfile.HISTORICAL: (
+        HistoricalStaffMember,
+        HistoricalStaffMembersResponse,
+    ),
+}
 
 
 def parse_staff_members_response(
     response: httpx.Response,
-) -> StaffMembersResponse:
+    profile: StaffMembersParsingProfile = StaffMembersParsingProfile.FULL,
+) -> StaffMembersResponse | LeanStaffMembersResponse | HistoricalStaffMembersResponse:
     """
     Parses the response for staff members.
 
     Args:
         response (httpx.Response): The HTTP response object.
+        profile (StaffMembersParsingProfile): Which fields of staff members to parse.
 
     Returns:
         MembersResponse: Parsed members response object.
@@ -215,14 +289,65 @@ def parse_staff_members_response(
     """
     ensure_status_code_success(response)
 
-    response_data: Any = parse_response_json(response)
+    _, response_model = STAFF_MEMBERS_PARSING_PROFILE_MODELS[profile]
+    return validate_response_json(response, response_model.model_validate_json)
+
+
+async def parse_staff_members_response_stream(
+    response: httpx.Response,
+    profile: StaffMembersParsingProfile = StaffMembersParsingProfile.FULL,
+) -> StaffMembersResponse | LeanStaffMembersResponse | HistoricalStaffMembersResponse:
+    """
+    Parses the streamed response for staff members while it is being read.
 
-    response_data = ensure_response_data_is_dict(response_data)
+    Staff members are validated one at a time as their bytes arrive,
+    so the page is never held as a tree of Python objects.
+
+    Args:
+        response (httpx.Response): The HTTP response object, not read yet.
+        profile (StaffMembersParsingProfile): Which fields of staff members to parse.
+
+    Returns:
+        MembersResponse: Parsed members response object.
+
+    Raises:
+        ResponseStatusCodeError: If the response status code indicates failure.
+        ResponseJsonParseError: If the response JSON is invalid.
+        ResponseDataParseError: If the expected data structure is missing or invalid.
+    """
+    if not response.is_success:
+        await response.aread()
+        raise ResponseStatusCodeError(response=response)
+
+    staff_member_model, response_model = STAFF_MEMBERS_PARSING_PROFILE_MODELS[profile]
+
+    def parse_staff_member(
+        staff_member: Any,
+    ) -> StaffMember | LeanStaffMember | HistoricalStaffMember:
+        try:
+            return staff_member_model.model_validate(staff_member)
+        except ValidationError as error:
+            raise ResponseDataParseError(response_data=staff_member) from error
+
+    parser = JsonObjectArrayStreamParser(
+        array_key="members",
+        parse_item=parse_staff_member,
+    )
+    staff_members: list[StaffMember | LeanStaffMember | HistoricalStaffMember] = []
+    try:
+        async for chunk in response.aiter_bytes():
+            staff_members += parser.feed(chunk)
+        response_data = parser.close()
+    except JsonStreamError as error:
+        raise ResponseJsonParseError(response=response) from error
 
     try:
-        return StaffMembersResponse.model_validate(response_data)
+        staff_members_response = response_model.model_validate(
+            response_data | {"members": []}
+        )
     except ValidationError as error:
         raise ResponseDataParseError(response_data=response_data) from error
+    return staff_members_response.model_copy(update={"members": staff_members})
 
 
 def parse_staff_positions_history_response(
@@ -245,11 +370,6 @@ def parse_staff_positions_history_response(
     """
     ensure_status_code_success(response)
 
-    response_data: Any = parse_response_json(response)
-
-    response_data = ensure_response_data_is_dict(response_data)
-
-    try:
-        return StaffPositionsHistoryResponse.model_validate(response_data)
-    except ValidationError as error:
-        raise ResponseDataParseError(response_data=response_data) from error
+    return validate_response_json(
+        response, StaffPositionsHistoryResponse.model_validate_json
+    )
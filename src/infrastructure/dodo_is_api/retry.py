@@ -0,0 +1,153 @@
+import asyncio
+import email.utils
+import random
+import time
+
+import httpx
+
+from bootstrap.logger import create_logger
+from infrastructure.dodo_is_api.metrics import DodoIsApiMetrics
+
+
+__all__ = (
+    "RETRYABLE_STATUS_CODES",
+    "RetryBudget",
+    "RetryingTransport",
+    "parse_retry_after",
+)
+
+
+logger = create_logger("dodo_is_api_retry")
+
+
+RETRYABLE_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses the Retry-After header value.
+
+    Args:
+        value: Either delay in seconds or HTTP date.
+
+    Returns:
+        float | None: Delay in seconds or None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Number of retries all requests of a run may spend together."""
+
+    def __init__(self, retries_count: int) -> None:
+        self.__retries_left = retries_count
+
+    @property
+    def retries_left(self) -> int:
+        return self.__retries_left
+
+    def try_spend(self) -> bool:
+        if self.__retries_left <= 0:
+            return False
+        self.__retries_left -= 1
+        return True
+
+
+class RetryingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport retrying rate limited, failed and unreachable requests.
+
+    Requests answered with one of `RETRYABLE_STATUS_CODES` or failed
+    with a transport error are retried up to `max_attempts` attempts
+    in total, while the shared retry budget lasts. The delay honors the
+    Retry-After header and otherwise grows exponentially with full jitter.
+    Responses asking to retry after more than `max_delay` seconds are
+    returned as they are, so that no worker stalls for that long.
+    When retries are over, the last response is returned or the last
+    error is raised. Retried attempts are recorded to `metrics` if given.
+    """
+
+    def __init__(
+        self,
+        *,
+        transport: httpx.AsyncBaseTransport,
+        budget: RetryBudget,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        metrics: DodoIsApiMetrics | None = None,
+    ) -> None:
+        self.__transport = transport
+        self.__budget = budget
+        self.__max_attempts = max_attempts
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__metrics = metrics
+
+    def __compute_backoff_delay(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.__max_delay, self.__base_delay * 2 ** (attempt - 1))
+        )
+
+    def __record_retry(self, request: httpx.Request, reason: str) -> None:
+        if self.__metrics is not None:
+            self.__metrics.record_retry(request.url.path, reason)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            try:
+                response = await self.__transport.handle_async_request(request)
+            except httpx.TransportError as error:
+                if attempt >= self.__max_attempts or not self.__budget.try_spend():
+                    raise
+                delay = self.__compute_backoff_delay(attempt)
+                self.__record_retry(request, error.__class__.__name__)
+                logger.warning(
+                    "Request failed, retrying: %s",
+                    error.__class__.__name__,
+                    extra={"url": str(request.url), "attempt": attempt, "delay": delay},
+                )
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > self.__max_delay:
+                    logger.warning(
+                        "Request failed, not retrying: Retry-After exceeds max delay",
+                        extra={
+                            "url": str(request.url),
+                            "attempt": attempt,
+                            "retry_after": retry_after,
+                        },
+                    )
+                    return response
+                if attempt >= self.__max_attempts or not self.__budget.try_spend():
+                    return response
+
+                await response.aclose()
+                delay = retry_after
+                if delay is None:
+                    delay = self.__compute_backoff_delay(attempt)
+                self.__record_retry(request, str(response.status_code))
+                logger.warning(
+                    "Request failed, retrying: status code %d",
+                    response.status_code,
+                    extra={"url": str(request.url), "attempt": attempt, "delay": delay},
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.__transport.aclose()
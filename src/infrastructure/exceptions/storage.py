@@ -0,0 +1,14 @@
+__all__ = ("UnitsDataNotStoredError",)
+
+
+class UnitsDataNotStoredError(Exception):
+    """Raised when units data is not added because some of it is already stored.
+
+    For example, when another run stored the same period in the meantime.
+    """
+
+    def __init__(self, period: str) -> None:
+        super().__init__(
+            f"Units data of {period} is not stored: some is stored already"
+        )
+        self.period = period
@@ -4,18 +4,47 @@ import datetime
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from bootstrap.logger import create_logger
 from domain.entities import UnitMonthlyEconomicsData, UnitWeeklyStaffData
+from domain.services.week_calendar import CalendarWeek
 
 
 __all__ = ("StorageGateway",)
 
 
+logger = create_logger("storage")
+
+# Version of the stored data, kept in the user_version pragma of the file.
+# 1: weeks are numbered as ISO weeks.
+SCHEMA_VERSION = 1
+
+
+def get_legacy_week_start(year: int, week: int) -> datetime.date:
+    """
+    Returns the first day of a week numbered before ISO weeks were used.
+
+    The first week of the year used to be the one January 1st falls into,
+    which is the last ISO week of the previous year for years starting
+    on Friday to Sunday.
+
+    Args:
+        year (int): The year number.
+        week (int): The legacy week number.
+
+    Returns:
+        datetime.date: Monday of the week.
+    """
+    day_of_week = datetime.date(year, 1, 1) + datetime.timedelta(weeks=week - 1)
+    return day_of_week - datetime.timedelta(days=day_of_week.weekday())
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class StorageGateway:
     connection: sqlite3.Connection
 
     def __post_init__(self) -> None:
         self.__init_tables()
+        self.__migrate()
 
     def __init_tables(self) -> None:
         queries = (
@@ -54,14 +83,213 @@ class StorageGateway:
                 PRIMARY KEY (unit_name, year, month)
             )
             """,
+            """
+            CREATE TABLE IF NOT EXISTS staff_backfill_checkpoints (
+                year INTEGER,
+                week INTEGER,
+                completed_at TEXT,
+                PRIMARY KEY (year, week)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS calendar_weeks (
+                year INTEGER,
+                week INTEGER,
+                from_date TEXT,
+                to_date TEXT,
+                month INTEGER,
+                PRIMARY KEY (year, week)
+            )
+            """,
         )
         for query in queries:
             with self.connection:
                 self.connection.execute(query)
 
-    def add_units_staff_data(self, units_data: Iterable[UnitWeeklyStaffData]) -> bool:
-        query = """
-        INSERT INTO units_staff_data (
+    def __migrate(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version;").fetchone()
+        if version >= SCHEMA_VERSION:
+            return
+        with self.connection:
+            if version < 1:
+                self.__renumber_legacy_weeks()
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+
+    def __renumber_legacy_weeks(self) -> None:
+        """
+        Renumbers weeks stored before ISO weeks were used.
+
+        Every week keeps the days its data was downloaded for and gets
+        the ISO year and week number of them. Weeks of years starting on
+        Friday to Sunday move one week back, and week 53 of the year and
+        week 1 of the next one that covered the same days become one.
+        Renumbered staff data is uploaded to the dashboard again.
+        """
+        cursor = self.connection.cursor()
+        with contextlib.closing(cursor):
+            # Weeks only move back, so going forward never overwrites
+            # a week that is still to be moved.
+            cursor.execute(
+                """
+                SELECT year, week FROM units_staff_data
+                UNION
+                SELECT year, week FROM staff_backfill_checkpoints
+                ORDER BY year, week;
+                """
+            )
+            legacy_weeks = cursor.fetchall()
+
+            renumbered_years: set[int] = set()
+            for year, week in legacy_weeks:
+                week_start = get_legacy_week_start(year, week)
+                iso_year, iso_week, _ = week_start.isocalendar()
+                if (iso_year, iso_week) == (year, week):
+                    continue
+                renumbered_years.add(year)
+                # Rows left over are already stored under the ISO week.
+                cursor.execute(
+                    """
+                    UPDATE OR IGNORE units_staff_data
+                    SET year = ?, month = ?, week = ?, uploaded_at = NULL
+                    WHERE year = ? AND week = ?;
+                    """,
+                    (iso_year, week_start.month, iso_week, year, week),
+                )
+                cursor.execute(
+                    "DELETE FROM units_staff_data WHERE year = ? AND week = ?;",
+                    (year, week),
+                )
+                cursor.execute(
+                    """
+                    UPDATE OR IGNORE staff_backfill_checkpoints
+                    SET year = ?, week = ?
+                    WHERE year = ? AND week = ?;
+                    """,
+                    (iso_year, iso_week, year, week),
+                )
+                cursor.execute(
+                    "DELETE FROM staff_backfill_checkpoints WHERE year = ? AND week = ?;",
+                    (year, week),
+                )
+            cursor.execute("DELETE FROM calendar_weeks;")
+
+        if renumbered_years:
+            logger.warning(
+                "Staff data weeks of %s are renumbered as ISO weeks"
+                " and will be uploaded to the dashboard again",
+                ", ".join(map(str, sorted(renumbered_years))),
+            )
+
+    def get_stored_staff_data_unit_names(
+        self,
+        *,
+        unit_names: Iterable[str],
+        year: int,
+        month: int,
+        week: int,
+    ) -> set[str]:
+        """
+        Finds the units whose staff data of the week is stored.
+
+        The lookup goes through the primary key, so no rows are scanned.
+
+        Args:
+            unit_names (Iterable[str]): Names of the units to check.
+            year (int): The year number.
+            month (int): The month number.
+            week (int): The week number.
+
+        Returns:
+            set[str]: Names of the units with staff data of the week.
+        """
+        unit_names = set(unit_names)
+        placeholders = ", ".join("?" for _ in unit_names)
+        query = f"""
+        SELECT unit_name FROM units_staff_data
+        WHERE unit_name IN ({placeholders}) AND year = ? AND month = ? AND week = ?;
+        """
+        cursor = self.connection.cursor()
+        with contextlib.closing(cursor):
+            cursor.execute(query, (*unit_names, year, month, week))
+            return {unit_name for (unit_name,) in cursor.fetchall()}
+
+    def has_units_staff_data(
+        self,
+        *,
+        unit_names: Iterable[str],
+        year: int,
+        month: int,
+        week: int,
+    ) -> bool:
+        """
+        Checks whether staff data of the week is stored for every unit.
+
+        Args:
+            unit_names (Iterable[str]): Names of the units.
+            year (int): The year number.
+            month (int): The month number.
+            week (int): The week number.
+
+        Returns:
+            bool: True if every unit has staff data of the week.
+        """
+        unit_names = set(unit_names)
+        return unit_names == self.get_stored_staff_data_unit_names(
+            unit_names=unit_names, year=year, month=month, week=week
+        )
+
+    def get_stored_economics_data_unit_names(
+        self,
+        *,
+        unit_names: Iterable[str],
+        year: int,
+        month: int,
+    ) -> set[str]:
+        """
+        Finds the units whose economics data of the month is stored.
+
+        The lookup goes through the primary key, so no rows are scanned.
+
+        Args:
+            unit_names (Iterable[str]): Names of the units to check.
+            year (int): The year number.
+            month (int): The month number.
+
+        Returns:
+            set[str]: Names of the units with economics data of the month.
+        """
+        unit_names = set(unit_names)
+        placeholders = ", ".join("?" for _ in unit_names)
+        query = f"""
+        SELECT unit_name FROM units_economics_data
+        WHERE unit_name IN ({placeholders}) AND year = ? AND month = ?;
+        """
+        cursor = self.connection.cursor()
+        with contextlib.closing(cursor):
+            cursor.execute(query, (*unit_names, year, month))
+            return {unit_name for (unit_name,) in cursor.fetchall()}
+
+    def add_units_staff_data(
+        self,
+        units_data: Iterable[UnitWeeklyStaffData],
+        *,
+        replace: bool = False,
+    ) -> bool:
+        """
+        Adds staff data of units.
+
+        Args:
+            units_data (Iterable[UnitWeeklyStaffData]): Staff data to add.
+            replace (bool): Whether already stored rows are replaced.
+                Replaced rows are not marked as uploaded anymore.
+
+        Returns:
+            bool: False if some of the rows are already stored and
+                `replace` is not set, in which case nothing is added.
+        """
+        insert = "INSERT OR REPLACE" if replace else "INSERT"
+        query = f"""
+        {insert} INTO units_staff_data (
             unit_name,
             year,
             month,
@@ -109,10 +337,26 @@ class StorageGateway:
         return True
 
     def add_units_economics_data(
-        self, units_data: Iterable[UnitMonthlyEconomicsData]
+        self,
+        units_data: Iterable[UnitMonthlyEconomicsData],
+        *,
+        replace: bool = False,
     ) -> bool:
-        query = """
-        INSERT INTO units_economics_data (
+        """
+        Adds economics data of units.
+
+        Args:
+            units_data (Iterable[UnitMonthlyEconomicsData]): Economics data to add.
+            replace (bool): Whether already stored rows are replaced.
+                Replaced rows are not marked as uploaded anymore.
+
+        Returns:
+            bool: False if some of the rows are already stored and
+                `replace` is not set, in which case nothing is added.
+        """
+        insert = "INSERT OR REPLACE" if replace else "INSERT"
+        query = f"""
+        {insert} INTO units_economics_data (
             unit_name,
             year,
             month,
@@ -254,3 +498,44 @@ class StorageGateway:
             cursor = self.connection.cursor()
             with contextlib.closing(cursor):
                 cursor.executemany(query, params)
+
+    def get_completed_staff_backfill_weeks(self) -> set[tuple[int, int]]:
+        query = "SELECT year, week FROM staff_backfill_checkpoints;"
+        cursor = self.connection.cursor()
+        with contextlib.closing(cursor):
+            cursor.execute(query)
+            rows = cursor.fetchall()
+        return {(year, week) for year, week in rows}
+
+    def mark_staff_backfill_week_as_completed(self, year: int, week: int) -> None:
+        now = datetime.datetime.now(datetime.UTC).isoformat()
+        query = """
+        INSERT OR REPLACE INTO staff_backfill_checkpoints (year, week, completed_at)
+        VALUES (?, ?, ?);
+        """
+        with self.connection:
+            self.connection.execute(query, (year, week, now))
+
+    def add_calendar_weeks(self, calendar_weeks: Iterable[CalendarWeek]) -> None:
+        """
+        Adds weeks to the calendar dimension table, replacing stored ones.
+
+        Args:
+            calendar_weeks (Iterable[CalendarWeek]): Weeks to add.
+        """
+        query = """
+        INSERT OR REPLACE INTO calendar_weeks (year, week, from_date, to_date, month)
+        VALUES (?, ?, ?, ?, ?);
+        """
+        rows = [
+            (
+                calendar_week.year,
+                calendar_week.week,
+                calendar_week.from_date.isoformat(),
+                calendar_week.to_date.isoformat(),
+                calendar_week.month,
+            )
+            for calendar_week in calendar_weeks
+        ]
+        with self.connection:
+            self.connection.executemany(query, rows)
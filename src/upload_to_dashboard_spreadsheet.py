@@ -1,5 +1,6 @@
 from fast_depends import inject
 
+from bootstrap.run_scope import open_run_scope
 from infrastructure.dependencies.dashboard import (
     DashboardSpreadsheetGatewayDependency,
 )
@@ -25,4 +26,5 @@ def main(
 
 
 if __name__ == "__main__":
-    main()  # type: ignore[reportCallIssue]
+    with open_run_scope():
+        main()  # type: ignore[reportCallIssue]
@@ -0,0 +1,6 @@
+import pathlib
+import sys
+
+
+# Modules are imported from src, as the scripts are run from there.
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from infrastructure.dodo_is_api.json_stream import (
+    JsonObjectArrayStreamParser,
+    JsonStreamError,
+)
+
+
+DOCUMENT = {
+    "members": [
+        {"id": 1, "firstName": "Анна", "rate": 12.75, "isActive": True},
+        {"id": 22, "firstName": "José", "rate": -0.5e3, "tags": ["a", "б"]},
+        {"id": 333, "firstName": 'Quote " and \\ slash', "unitId": None},
+    ],
+    "totalCount": 1234567,
+    "isEndOfListReached": False,
+}
+
+
+def split_into_chunks(document: bytes, chunk_size: int) -> list[bytes]:
+    return [
+        document[start : start + chunk_size]
+        for start in range(0, len(document), chunk_size)
+    ]
+
+
+def parse_chunks(chunks: list[bytes]) -> tuple[list, dict]:
+    parser = JsonObjectArrayStreamParser(array_key="members", parse_item=lambda x: x)
+    items = []
+    for chunk in chunks:
+        items += parser.feed(chunk)
+    return items, parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 10_000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_chunked_document_is_parsed_as_whole(chunk_size: int, indent: int | None):
+    document = json.dumps(DOCUMENT, ensure_ascii=False, indent=indent).encode()
+
+    items, fields = parse_chunks(split_into_chunks(document, chunk_size))
+
+    assert items == DOCUMENT["members"]
+    assert fields == {"totalCount": 1234567, "isEndOfListReached": False}
+
+
+def test_items_are_returned_as_soon_as_they_are_complete():
+    document = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    first_item_end = document.index(b"}") + 1
+    parser = JsonObjectArrayStreamParser(array_key="members", parse_item=lambda x: x)
+
+    assert parser.feed(document[: first_item_end - 1]) == []
+    assert parser.feed(document[first_item_end - 1 : first_item_end + 1]) == [
+        DOCUMENT["members"][0]
+    ]
+
+
+def test_number_split_across_chunks_is_not_cut():
+    items, fields = parse_chunks([b'{"members": [], "totalCount": 12', b"34}"])
+
+    assert items == []
+    assert fields == {"totalCount": 1234}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"members": [{"id": 1}',
+        b'{"members": [{"id": 1}]',
+        b'{"totalCount": 1}',
+        b'[{"id": 1}]',
+        b'{"members": {"id": 1}}',
+        b'{"members": []} {}',
+        b'{"members": [{"id": 1},]x}',
+    ],
+)
+def test_invalid_document_raises_error(document: bytes):
+    with pytest.raises(JsonStreamError):
+        parse_chunks(split_into_chunks(document, 3))
+
+
+def test_invalid_utf8_raises_error():
+    with pytest.raises(JsonStreamError):
+        parse_chunks([b'{"members": ["\xd0', b'"]}'])
@@ -0,0 +1,138 @@
+import random
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+
+from domain.entities import UnitStaffCountByPosition
+from domain.services.staff_members import (
+    CANDIDATES,
+    COURIERS,
+    INTERNS,
+    MANAGERS,
+    SKIPPED,
+    SPECIALIST,
+    compute_staff_count_by_position,
+    compute_staff_count_by_position_columnar,
+)
+
+
+UNKNOWN_POSITION_ID = UUID("00000000000000000000000000000001")
+
+FIRST_UNIT_UUID = UUID("00000000000000000000000000000010")
+SECOND_UNIT_UUID = UUID("00000000000000000000000000000020")
+NOT_COUNTED_UNIT_UUID = UUID("00000000000000000000000000000030")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FakeStaffMember:
+    id: UUID
+    unit_uuid: UUID
+    position_id: UUID | None
+
+
+def create_staff_member(
+    unit_uuid: UUID, position_id: UUID | None, staff_member_id: UUID | None = None
+) -> FakeStaffMember:
+    return FakeStaffMember(
+        id=staff_member_id or uuid4(),
+        unit_uuid=unit_uuid,
+        position_id=position_id,
+    )
+
+
+def count_with_both(
+    staff_members: list[FakeStaffMember],
+    specialist_staff_member_ids: set[UUID],
+) -> list[UnitStaffCountByPosition]:
+    counts = compute_staff_count_by_position(staff_members, specialist_staff_member_ids)
+    columnar_counts = compute_staff_count_by_position_columnar(
+        staff_members, specialist_staff_member_ids
+    )
+    assert columnar_counts == counts
+    return counts
+
+
+def test_edge_cases_are_counted_the_same():
+    former_specialist_id = uuid4()
+    staff_members = [
+        create_staff_member(FIRST_UNIT_UUID, MANAGERS[0]),
+        create_staff_member(FIRST_UNIT_UUID, SPECIALIST[0]),
+        create_staff_member(FIRST_UNIT_UUID, COURIERS[0]),
+        create_staff_member(FIRST_UNIT_UUID, CANDIDATES[0]),
+        create_staff_member(
+            FIRST_UNIT_UUID, CANDIDATES[1], staff_member_id=former_specialist_id
+        ),
+        create_staff_member(FIRST_UNIT_UUID, INTERNS[0]),
+        create_staff_member(FIRST_UNIT_UUID, None),
+        create_staff_member(FIRST_UNIT_UUID, SKIPPED[0]),
+        create_staff_member(FIRST_UNIT_UUID, UNKNOWN_POSITION_ID),
+        create_staff_member(NOT_COUNTED_UNIT_UUID, None),
+        create_staff_member(NOT_COUNTED_UNIT_UUID, SKIPPED[0]),
+        create_staff_member(NOT_COUNTED_UNIT_UUID, UNKNOWN_POSITION_ID),
+        create_staff_member(SECOND_UNIT_UUID, COURIERS[1]),
+    ]
+
+    counts = count_with_both(staff_members, {former_specialist_id})
+
+    assert counts == [
+        UnitStaffCountByPosition(
+            unit_uuid=FIRST_UNIT_UUID,
+            managers_count=1,
+            kitchen_members_count=2,
+            couriers_count=1,
+            candidates_count=1,
+            interns_count=1,
+        ),
+        UnitStaffCountByPosition(
+            unit_uuid=NOT_COUNTED_UNIT_UUID,
+            managers_count=0,
+            kitchen_members_count=0,
+            couriers_count=0,
+            candidates_count=0,
+            interns_count=0,
+        ),
+        UnitStaffCountByPosition(
+            unit_uuid=SECOND_UNIT_UUID,
+            managers_count=0,
+            kitchen_members_count=0,
+            couriers_count=1,
+            candidates_count=0,
+            interns_count=0,
+        ),
+    ]
+
+
+def test_no_staff_members_are_counted_the_same():
+    assert count_with_both([], set()) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_staff_members_are_counted_the_same(seed: int):
+    random_generator = random.Random(seed)
+    unit_uuids = [UUID(int=random_generator.getrandbits(128)) for _ in range(10)]
+    position_ids = [
+        *MANAGERS,
+        *SPECIALIST,
+        *COURIERS,
+        *CANDIDATES,
+        *INTERNS,
+        *SKIPPED,
+        UNKNOWN_POSITION_ID,
+        None,
+    ]
+    staff_members = [
+        create_staff_member(
+            random_generator.choice(unit_uuids),
+            random_generator.choice(position_ids),
+            staff_member_id=UUID(int=random_generator.getrandbits(128)),
+        )
+        for _ in range(1000)
+    ]
+    specialist_staff_member_ids = {
+        staff_member.id
+        for staff_member in staff_members
+        if random_generator.random() < 0.3
+    }
+
+    count_with_both(staff_members, specialist_staff_member_ids)